@@ -0,0 +1,101 @@
+# Avaliadores de indicadores fundamentalistas, um submódulo por agrupador.
+# Razão: o antigo analiseativos.py tinha mais de 7 mil linhas e qualquer import pagava a compilação e a
+# execução de todas as classes. Aqui nenhum submódulo é carregado no import do pacote: o __getattr__ do
+# módulo (PEP 562) importa só o submódulo da classe pedida na primeira vez que ela é acessada.
+#   from analiseativos import ROEEvaluator   -> carrega apenas analiseativos/rentabilidade.py
+#   from analiseativos import *              -> carrega tudo (via __all__), como antes
+# As duas definições de PLAtivosEvaluator continuam juntas em estrutura_capital.py, na mesma ordem,
+# para que a segunda continue prevalecendo.
+import importlib
+
+
+# Nome público -> submódulo que o define
+_SUBMODULOS = {
+    'ResultadoIND': 'resultado',
+    'exibir_resultado': 'resultado',
+    'TextoCatalogo': 'catalogo',
+    'texto': 'catalogo',
+    'compilar_catalogo': 'catalogo',
+    'ler_texto': 'catalogo',
+    'Regra': 'regras',
+    'tabela_regras': 'regras',
+    'compilar_regras': 'regras',
+    'regra': 'regras',
+    'resultado_regra': 'regras',
+    'divergencias': 'regras',
+    'CacheResultados': 'cache',
+    'cache_resultados': 'cache',
+    'resultado_erro': 'cache',
+    'estatisticas_cache': 'cache',
+    'limpar_cache': 'cache',
+    'converter_numero': 'numeros',
+    'converter_numeros': 'numeros',
+    'TagAlongEvaluator': 'governanca',
+    'FreeFloatEvaluator': 'liquidez_mercado',
+    'FreeFloatEvaluatororiginal': 'liquidez_mercado',
+    'LiquidezMediaDiariaEvaluator': 'liquidez_mercado',
+    'CAGRLucrosEvaluator': 'crescimento',
+    'CAGREvaluator': 'crescimento',
+    'BetaEvaluator': 'risco',
+    'WACCEvaluator': 'estrutura_capital',
+    'PatrimonioAtivosEvaluator': 'estrutura_capital',
+    'PLAtivosEvaluator': 'estrutura_capital',
+    'FCDEvaluator': 'valuation',
+    'CrescimentoImplicitoEvaluator': 'valuation',
+    'PAtivoCirculanteLiquidoEvaluator': 'valuation',
+    'PCapitalGiroEvaluator': 'valuation',
+    'PSREvaluator': 'valuation',
+    'VPAEvaluator': 'valuation',
+    'PLEvaluator': 'valuation',
+    'PEBITDAEvaluator': 'valuation',
+    'PEBITEvaluator': 'valuation',
+    'PAtivoEvaluator': 'valuation',
+    'EVEBITDAEvaluator': 'valuation',
+    'EVEBITEvaluator': 'valuation',
+    'PVPEvaluator': 'valuation',
+    'FCFEvaluator': 'geracao_caixa',
+    'CCCEvaluator': 'eficiencia',
+    'GiroAtivoEvaluator': 'eficiencia',
+    'MargemEBITDAEvaluator': 'eficiencia',
+    'MargemEBITEvaluator': 'eficiencia',
+    'MargemBrutaEvaluator': 'eficiencia',
+    'LiquidezSecaEvaluator': 'liquidez',
+    'DisponibilidadesEvaluator': 'liquidez',
+    'AtivoCirculanteEvaluator': 'liquidez',
+    'LiquidezCorrenteEvaluator': 'liquidez',
+    'LucroLiquidoEvaluator': 'lucratividade',
+    'EBITDAEvaluator': 'lucratividade',
+    'EBITEvaluator': 'lucratividade',
+    'ReceitaLiquidaEvaluator': 'lucratividade',
+    'AtivosEvaluator': 'saude_financeira',
+    'PatrimonioLiquidoEvaluator': 'saude_financeira',
+    'DividaLiquidaEvaluator': 'alavancagem',
+    'DividaBrutaEvaluator': 'alavancagem',
+    'DividendYieldEvaluator': 'rentabilidade',
+    'ROICEvaluator': 'rentabilidade',
+    'ROAEvaluator': 'rentabilidade',
+    'ROEEvaluator': 'rentabilidade',
+    'MargemLiquidaEvaluator': 'rentabilidade',
+    'LPAEvaluator': 'rentabilidade',
+    'DivLiquidaPatrimonioLiquidoEvaluator': 'solvencia',
+    'DivLiquidaEBITEvaluator': 'solvencia',
+    'DivLiquidaEBITDAEvaluator': 'solvencia',
+}
+
+__all__ = list(_SUBMODULOS)
+
+
+def __getattr__(nome):
+    # Chamado só quando o nome ainda não está no módulo: importa o submódulo e guarda o objeto
+    submodulo = _SUBMODULOS.get(nome)
+    if submodulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(f'.{submodulo}', __name__), nome)
+    # Próximos acessos encontram o nome direto no módulo, sem passar por aqui
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    # Lista também os nomes ainda não carregados
+    return sorted(set(globals()) | set(__all__))
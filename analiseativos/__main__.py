@@ -0,0 +1,89 @@
+# Execução do pacote (python -m analiseativos): testes originais do módulo e benchmark de tempo de import
+import subprocess
+import sys
+
+from analiseativos import VPAEvaluator, exibir_resultado
+
+
+def medir_import(codigo, repeticoes=5):
+    '''
+    Mede, em processos novos (sem cache de módulos), o menor tempo de execução de um trecho de import.
+
+    Retorna:
+    - float: tempo em milissegundos
+    '''
+    script = ("import time; inicio = time.perf_counter(); " + codigo +
+              "; print((time.perf_counter() - inicio) * 1e3)")
+    return min(float(subprocess.check_output([sys.executable, '-c', script], text=True))
+               for _ in range(repeticoes))
+
+
+# Bloco principal para testes
+if __name__ == "__main__":
+    # Cria instância de PVPEvaluator
+    avaliador = VPAEvaluator()
+
+    # Teste 1: Avaliação automática com P/VP = 1.2
+    # Avalia o valor P/VP 1.2
+    resultado_avaliacao = avaliador.avaliar(1.2)
+    # Imprime cabeçalho do teste
+    print("🔍 Teste de avaliação automática:")
+    # Imprime o objeto ResultadoIND
+    print(resultado_avaliacao)
+    # Imprime a representação em dicionário
+    print(resultado_avaliacao.to_dict())
+    # Imprime linha em branco
+    print()
+
+    # Teste 2: Geração manual de resultado
+    # Gera ResultadoIND com entradas manuais
+    resultado_manual = avaliador.gerar_resultado(
+        classificacao='Teste',
+        faixa='1.0 - 2.0',
+        descricao='Exemplo de uso externo',
+        riscos='Risco moderado',
+        referencia='Referência fictícia',
+        recomendacao='Recomendação de teste'
+    )
+    # Imprime cabeçalho do teste
+    print("🧪 Teste de geração manual de resultado:")
+    # Imprime o objeto ResultadoIND
+    print(resultado_manual)
+    # Imprime a representação em dicionário
+    print(resultado_manual.to_dict())
+    # Imprime linha em branco
+    print()
+
+    # Teste 3: Simulação de erro
+    # Avalia entrada inválida para disparar erro
+    resultado_erro = avaliador.avaliar("valor_invalido")
+    # Imprime cabeçalho do teste
+    print("⚠️ Teste de erro:")
+    # Imprime o ResultadoIND de erro
+    print(resultado_erro)
+    # Imprime a representação em dicionário
+    print(resultado_erro.to_dict())
+    # Imprime linha em branco
+    print()
+
+    # Teste adicional: Exibição formatada
+    # Define valor de teste P/VP
+    valor_pvp = 1.2
+    # Avalia o valor P/VP
+    resultado = avaliador.avaliar(valor_pvp)
+    # Exibe resultado formatado
+    exibir_resultado(resultado)
+    # Imprime cabeçalho do dicionário
+    print("📦 Resultado como dicionário:")
+    # Converte resultado em dicionário e imprime
+    print(resultado.to_dict())
+
+
+    # Benchmark de import: pacote vazio, uma classe (um submódulo) e tudo (equivalente ao antigo módulo único)
+    print("⏱️ Tempo de import (menor de 5 processos novos):")
+    for descricao, codigo in [
+        ("import analiseativos", "import analiseativos"),
+        ("from analiseativos import ROEEvaluator", "from analiseativos import ROEEvaluator"),
+        ("from analiseativos import *", "from analiseativos import *"),
+    ]:
+        print(f"  {descricao:<42} {medir_import(codigo):6.1f} ms")
@@ -0,0 +1,203 @@
+# Avaliadores do agrupador Alavancagem
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe DividaLiquidaEvaluator para avaliar o indicador Dívida Líquida
+class DividaLiquidaEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição da Dívida Líquida
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Dívida Líquida
+        self.definicao = texto('DividaLiquidaEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Alavancagem"
+        self.agrupador = 'Alavancagem'
+        # Define a fórmula da Dívida Líquida
+        self.formula = 'Dívida Líquida = Dívida Bruta - Caixa e Equivalentes de Caixa'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor da Dívida Líquida em relação aos Ativos Totais e retorna um objeto ResultadoIND
+    def avaliar(self, divida_liquida, ativos_totais):
+        # Tenta processar o valor da Dívida Líquida e Ativos Totais
+        try:
+            # Converte Dívida Líquida e Ativos Totais para float
+            divida_liquida = converter_numero(divida_liquida, "O valor de Dívida Líquida deve ser numérico.")
+            ativos_totais = converter_numero(ativos_totais, "O valor de Ativos Totais deve ser numérico.")
+            # Calcula a proporção da Dívida Líquida em relação aos Ativos Totais
+            if ativos_totais == 0:
+                raise ValueError("Os Ativos Totais não podem ser zero para calcular a proporção.")
+            proporcao_divida_ativos = divida_liquida / ativos_totais
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'DividaLiquidaEvaluator', proporcao_divida_ativos=proporcao_divida_ativos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Dívida Líquida: {mensagem}.
+                Verifique os dados de entrada (Dívida Líquida e Ativos Totais) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe DividaBrutaEvaluator para avaliar o indicador Dívida Bruta
+class DividaBrutaEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição da Dívida Bruta
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Dívida Bruta
+        self.definicao = texto('DividaBrutaEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Alavancagem"
+        self.agrupador = 'Alavancagem'
+        # Define a fórmula da Dívida Bruta (não é uma razão, mas um valor absoluto)
+        self.formula = 'Dívida Bruta = Total de Empréstimos e Financiamentos (Curto e Longo Prazo)'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula a proporção da Dívida Bruta em relação aos Ativos Totais
+    def calcular_divida_ativos(self, divida_bruta, ativos_totais):
+        # Converte Dívida Bruta e Ativos Totais para float
+        divida_bruta = converter_numero(divida_bruta, "O valor de Dívida Bruta deve ser numérico.")
+        ativos_totais = converter_numero(ativos_totais, "O valor de Ativos Totais deve ser numérico.")
+        # Calcula a proporção da Dívida Bruta em relação aos Ativos Totais
+        if ativos_totais == 0:
+            raise ValueError("Os Ativos Totais não podem ser zero para calcular a proporção.")
+        return divida_bruta / ativos_totais
+
+    # Avalia o valor da Dívida Bruta em relação aos Ativos Totais e retorna um objeto ResultadoIND
+    def avaliar(self, divida_bruta, ativos_totais):
+        # Tenta processar o valor da Dívida Bruta e Ativos Totais
+        try:
+            # Calcula a proporção Dívida Bruta / Ativos
+            divida_ativos = self.calcular_divida_ativos(divida_bruta, ativos_totais)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+        # Classifica a proporção calculada nas faixas (os limites e rótulos descrevem Dívida Bruta / Ativos)
+        return self.avaliar_divida_ativos(divida_ativos)
+
+    # Avalia uma proporção Dívida Bruta / Ativos já calculada (ex.: pelo grafo de indicadores derivados)
+    def avaliar_divida_ativos(self, divida_ativos):
+        # Tenta processar a proporção Dívida Bruta / Ativos
+        try:
+            # Converte para float
+            divida_ativos = converter_numero(divida_ativos, "O valor da Dívida Bruta / Ativos deve ser numérico.")
+            # Verifica se a proporção foi calculada (NaN indica dado ausente ou Ativos zero no lote)
+            if divida_ativos != divida_ativos:
+                raise ValueError("A proporção Dívida Bruta / Ativos não pôde ser calculada para este ativo.")
+            # Classifica pela tabela de regras (a variável das faixas, divida_bruta, é a mesma de evaluate_divida_bruta)
+            return resultado_regra(self, 'DividaBrutaEvaluator', divida_bruta=divida_ativos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Dívida Bruta: {mensagem}.
+                Verifique os dados de entrada (Dívida Bruta e Ativos Totais) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
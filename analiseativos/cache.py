@@ -0,0 +1,103 @@
+# Cache dos resultados dos avaliadores, indexado pela faixa.
+# Razão: o resultado de avaliar() depende só da faixa em que o valor cai (os textos vêm do catálogo e
+# definição, agrupador e fórmula são fixos por classe), mas cada chamada montava um ResultadoIND novo,
+# com a validação dos textos. Em lotes com milhares de tickers e datas, os mesmos poucos resultados eram
+# reconstruídos sem parar. Aqui cada avaliador guarda o resultado já montado de cada faixa (e os de erro,
+# por tipo e mensagem da exceção) e as avaliações repetidas custam uma consulta ao dicionário.
+# Os resultados guardados não saem do cache: cada chamada recebe uma cópia rasa (os textos longos continuam
+# como referências ao catálogo), que pode ser alterada sem afetar as avaliações seguintes.
+import copy
+
+
+# Máximo de resultados de erro guardados por avaliador: mensagens que embutem o valor recebido
+# (ex.: erros de conversão) não fazem o cache crescer sem limite
+LIMITE_ERROS = 256
+
+
+class CacheResultados:
+    # Resultados prontos de um avaliador: por posição da faixa e por (tipo, mensagem) de erro
+    __slots__ = ('nome', 'faixas', 'erros', 'acertos', 'falhas')
+
+    def __init__(self, nome):
+        self.nome = nome
+        self.faixas = {}
+        self.erros = {}
+        # Contadores de consultas atendidas pelo cache e de resultados que precisaram ser montados
+        self.acertos = 0
+        self.falhas = 0
+
+    def faixa(self, indice, montar, *args):
+        '''
+        Resultado da faixa na posição indice; na primeira vez é montado com montar(*args) e guardado.
+        '''
+        resultado = self.faixas.get(indice)
+        if resultado is None:
+            self.falhas += 1
+            resultado = self.faixas[indice] = montar(*args)
+        else:
+            self.acertos += 1
+        return resultado
+
+    def erro(self, excecao, montar):
+        '''
+        Resultado de erro da exceção; montar(mensagem) só é chamado na primeira vez de cada tipo e mensagem.
+        '''
+        mensagem = str(excecao)
+        # A mensagem entra na chave porque faz parte do texto do resultado
+        chave = (type(excecao), mensagem)
+        resultado = self.erros.get(chave)
+        if resultado is not None:
+            self.acertos += 1
+            return resultado
+        self.falhas += 1
+        resultado = montar(mensagem)
+        if len(self.erros) < LIMITE_ERROS:
+            self.erros[chave] = resultado
+        return resultado
+
+
+# Um cache por classe avaliadora (instâncias novas a cada chamada continuam aproveitando) ou por nome
+# de função evaluate_*
+_caches = {}
+
+
+def cache_resultados(chave):
+    '''
+    Cache de um avaliador, criado no primeiro uso.
+
+    Parâmetros:
+    - chave: classe avaliadora (ex.: ROEEvaluator) ou nome da função evaluate_* (ex.: 'evaluate_roe')
+
+    Retorna:
+    - CacheResultados
+    '''
+    cache = _caches.get(chave)
+    if cache is None:
+        cache = _caches[chave] = CacheResultados(getattr(chave, '__name__', chave))
+    return cache
+
+
+def resultado_erro(avaliador, excecao):
+    '''
+    Cópia do ResultadoIND de erro do avaliador para a exceção, montado uma vez por tipo e mensagem de erro.
+    '''
+    return copy.copy(cache_resultados(type(avaliador)).erro(excecao, avaliador._erro))
+
+
+def estatisticas_cache():
+    '''
+    Acertos e falhas do cache de cada avaliador já usado.
+
+    Retorna:
+    - dict {avaliador: {'acertos', 'falhas', 'faixas', 'erros'}}, com faixas e erros = resultados guardados
+    '''
+    return {cache.nome: {'acertos': cache.acertos, 'falhas': cache.falhas,
+                         'faixas': len(cache.faixas), 'erros': len(cache.erros)}
+            for cache in _caches.values()}
+
+
+def limpar_cache():
+    '''
+    Descarta os resultados guardados e zera os contadores (ex.: depois de editar textos ou faixas).
+    '''
+    _caches.clear()
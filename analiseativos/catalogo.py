@@ -0,0 +1,201 @@
+# Catálogo externo dos textos longos dos avaliadores (definição, descrição, riscos, referência e recomendação).
+# Razão: esses textos ficavam como literais no código e eram carregados na memória a cada import, mesmo
+# em execuções que só precisam da classificação. Agora os avaliadores guardam apenas referências
+# (TextoCatalogo) e os textos ficam em textos.json (fonte editável) compilado em textos.bin: um índice
+# pequeno seguido dos textos UTF-8 deduplicados. O textos.bin é mapeado em memória (mmap) na primeira
+# leitura e cada texto só é decodificado quando alguém de fato o lê (ex.: ResultadoIND.to_dict()).
+# Como o regras.bin, o textos.bin não é versionado: é gerado na primeira leitura (e refeito quando o
+# textos.json muda), de modo que um checkout nunca o deixa modificado.
+import os
+from functools import lru_cache
+
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_TEXTOS = os.path.join(DIRETORIO, 'textos.json')
+ARQUIVO_CATALOGO = os.path.join(DIRETORIO, 'textos.bin')
+
+# Cabeçalho do textos.bin: identificador, tamanho do índice, data de modificação e tamanho do textos.json de origem
+_FORMATO_CABECALHO = '<4sIdQ'
+_IDENTIFICADOR = b'TXC1'
+# Campos de cada faixa, na ordem em que as posições são gravadas no índice
+CAMPOS_FAIXA = ('descricao', 'riscos', 'referencia', 'recomendacao')
+
+
+def compilar_catalogo(origem=ARQUIVO_TEXTOS, destino=ARQUIVO_CATALOGO):
+    '''
+    Compila textos.json em textos.bin (índice + textos deduplicados).
+
+    O textos.json tem a forma {avaliador: {'definicao': texto, 'faixas': {faixa: {campo: texto}}}}.
+    Campos ausentes numa faixa (ex.: as funções evaluate_* só têm descricao) ficam sem texto.
+    Como os avaliadores deixam de validar os textos do catálogo a cada resultado, a validação
+    (string não vazia) é feita aqui, uma única vez.
+
+    Retorna:
+    - int: número de textos distintos gravados
+    '''
+    import json
+    import struct
+
+    with open(origem, encoding='utf-8') as f:
+        textos = json.load(f)
+    posicoes = {}
+    blocos = []
+    tamanho = 0
+
+    def gravar(texto, descricao):
+        nonlocal tamanho
+        if not isinstance(texto, str) or not texto.strip():
+            raise ValueError(f"O texto '{descricao}' deve ser uma string não vazia.")
+        # Textos repetidos (ex.: mesma referência cruzada em várias faixas) são gravados uma vez só
+        if texto not in posicoes:
+            dados = texto.encode('utf-8')
+            posicoes[texto] = (tamanho, len(dados))
+            blocos.append(dados)
+            tamanho += len(dados)
+        return list(posicoes[texto])
+
+    # Índice compacto: {avaliador: {'': [posição, tamanho] da definição, faixa: [posição, tamanho] × 4 campos]}}
+    # (posição -1 marca campo ausente)
+    indice = {}
+    for avaliador, conteudo in textos.items():
+        indice[avaliador] = {'': gravar(conteudo['definicao'], f'{avaliador} / definicao')}
+        for faixa, campos in conteudo['faixas'].items():
+            indice[avaliador][faixa] = [valor for campo in CAMPOS_FAIXA
+                                        for valor in (gravar(campos[campo], f'{avaliador} / {faixa} / {campo}')
+                                                      if campo in campos else [-1, 0])]
+    indice_bytes = json.dumps(indice, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    estado = os.stat(origem)
+    # Grava em arquivo temporário e substitui, para que leitores nunca vejam um catálogo pela metade
+    temporario = destino + '.tmp'
+    with open(temporario, 'wb') as f:
+        f.write(struct.pack(_FORMATO_CABECALHO, _IDENTIFICADOR, len(indice_bytes), estado.st_mtime, estado.st_size))
+        f.write(indice_bytes)
+        f.writelines(blocos)
+    os.replace(temporario, destino)
+    return len(posicoes)
+
+
+class _Catalogo:
+    # Abre o catálogo só na primeira leitura de texto (o import dos avaliadores não toca no disco)
+    def __init__(self, origem=ARQUIVO_TEXTOS, caminho=ARQUIVO_CATALOGO):
+        self.origem = origem
+        self.caminho = caminho
+        self.indice = None
+        self.mapa = None
+        self.inicio = 0
+        # Textos carregados direto do JSON quando o textos.bin não pode ser (re)compilado
+        self.reserva = None
+
+    def _desatualizado(self):
+        import struct
+
+        # Compara o cabeçalho com o textos.json de origem (data e tamanho)
+        with open(self.caminho, 'rb') as f:
+            identificador, _, mtime, tamanho = struct.unpack(_FORMATO_CABECALHO, f.read(struct.calcsize(_FORMATO_CABECALHO)))
+        if identificador != _IDENTIFICADOR:
+            return True
+        if not os.path.exists(self.origem):
+            return False
+        estado = os.stat(self.origem)
+        return estado.st_mtime != mtime or estado.st_size != tamanho
+
+    def abrir(self):
+        if self.indice is not None or self.reserva is not None:
+            return
+        # Módulos importados só aqui: quem nunca lê texto não paga o import de json/mmap
+        import json
+        import mmap
+        import struct
+
+        try:
+            if not os.path.exists(self.caminho) or self._desatualizado():
+                compilar_catalogo(self.origem, self.caminho)
+        except OSError:
+            # Pacote em diretório somente leitura: usa o JSON em memória
+            with open(self.origem, encoding='utf-8') as f:
+                textos = json.load(f)
+            self.reserva = textos
+            return
+        with open(self.caminho, 'rb') as f:
+            self.mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _, tamanho_indice, _, _ = struct.unpack_from(_FORMATO_CABECALHO, self.mapa, 0)
+        tamanho_cabecalho = struct.calcsize(_FORMATO_CABECALHO)
+        self.inicio = tamanho_cabecalho + tamanho_indice
+        self.indice = json.loads(self.mapa[tamanho_cabecalho:self.inicio].decode('utf-8'))
+
+    def ler(self, avaliador, campo, faixa=None):
+        self.abrir()
+        if self.reserva is not None:
+            conteudo = self.reserva[avaliador]
+            return conteudo['definicao'] if faixa is None else conteudo['faixas'][faixa].get(campo)
+        # Posição do texto no índice: definição ou o campo dentro da faixa
+        if faixa is None:
+            posicao, tamanho = self.indice[avaliador]['']
+        else:
+            i = 2 * CAMPOS_FAIXA.index(campo)
+            posicao, tamanho = self.indice[avaliador][faixa][i:i + 2]
+            # Campo sem texto nesta faixa
+            if posicao < 0:
+                return None
+        # Decodifica só o trecho do texto pedido
+        return self.mapa[self.inicio + posicao:self.inicio + posicao + tamanho].decode('utf-8')
+
+
+_catalogo = _Catalogo()
+
+
+@lru_cache(maxsize=None)
+def ler_texto(avaliador, campo, faixa=None):
+    '''
+    Decodifica (uma única vez por processo) um texto do catálogo; None quando a faixa não tem o campo.
+    '''
+    return _catalogo.ler(avaliador, campo, faixa)
+
+
+class TextoCatalogo:
+    # Referência a um texto do catálogo; ocupa só a chave até ser convertida em str
+    __slots__ = ('avaliador', 'campo', 'faixa')
+
+    def __init__(self, avaliador, campo, faixa=None):
+        self.avaliador = avaliador
+        self.campo = campo
+        self.faixa = faixa
+
+    # Decodifica o texto do catálogo
+    def __str__(self):
+        return ler_texto(self.avaliador, self.campo, self.faixa)
+
+    def __repr__(self):
+        return f"TextoCatalogo({self.avaliador!r}, {self.campo!r}, {self.faixa!r})"
+
+    # Comparação, hash e tamanho se comportam como os da string correspondente
+    def __eq__(self, outro):
+        return str(self) == str(outro)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __format__(self, especificacao):
+        return format(str(self), especificacao)
+
+    # Demais métodos de str (strip, split, replace...) atuam sobre o texto decodificado
+    def __getattr__(self, nome):
+        return getattr(str(self), nome)
+
+
+def texto(avaliador, campo, faixa=None):
+    '''
+    Referência preguiçosa a um texto do catálogo.
+
+    Parâmetros:
+    - avaliador: nome da classe avaliadora (ex.: 'ROEEvaluator')
+    - campo: 'definicao', 'descricao', 'riscos', 'referencia' ou 'recomendacao'
+    - faixa: faixa do resultado (ex.: 'ROE < 0%'); ausente para a definição
+
+    Retorna:
+    - TextoCatalogo
+    '''
+    return TextoCatalogo(avaliador, campo, faixa)
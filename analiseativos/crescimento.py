@@ -0,0 +1,254 @@
+# Avaliadores do agrupador Crescimento
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe CAGRLucrosEvaluator para avaliar o indicador CAGR de Lucros 5 Anos
+class CAGRLucrosEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do CAGR de Lucros
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice CAGR de Lucros
+        self.definicao = texto('CAGRLucrosEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Crescimento"
+        self.agrupador = 'Crescimento'
+        # Define a fórmula do CAGR
+        self.formula = '''
+        CAGR = (VF / VI)^(1/n) - 1
+        Onde:
+        - VF = Valor Final do lucro líquido (ao final do período de 5 anos)
+        - VI = Valor Inicial do lucro líquido (no início do período de 5 anos)
+        - n = Número de anos (neste caso, 5)
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula o CAGR com base nos valores inicial e final dos lucros
+    def calcular_cagr(self, valor_inicial, valor_final, anos=5):
+        try:
+            # Converte parâmetros para float
+            valor_inicial = converter_numero(valor_inicial, "O valor de Valor Inicial do Lucro Líquido deve ser numérico.")
+            valor_final = converter_numero(valor_final, "O valor de Valor Final do Lucro Líquido deve ser numérico.")
+            anos = converter_numero(anos, "O valor de Número de Anos deve ser numérico.")
+            # Verifica se o valor inicial é maior que zero
+            if valor_inicial <= 0:
+                raise ValueError("O valor inicial do lucro líquido deve ser maior que zero.")
+            # Verifica se o número de anos é positivo
+            if anos <= 0:
+                raise ValueError("O número de anos deve ser maior que zero.")
+            # Calcula o CAGR
+            cagr = (valor_final / valor_inicial) ** (1 / anos) - 1
+            return cagr
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o CAGR: {str(e)}")
+
+    # Avalia o valor do CAGR de Lucros e retorna um objeto ResultadoIND
+    def avaliar(self, valor_inicial, valor_final, anos=5):
+        # Tenta processar o cálculo do CAGR
+        try:
+            # Calcula o CAGR
+            cagr = self.calcular_cagr(valor_inicial, valor_final, anos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+        # Classifica o CAGR calculado nas faixas
+        return self.avaliar_cagr(cagr)
+
+    # Avalia um CAGR já calculado (ex.: pelo motor de séries históricas de cagrhistorico.py) e retorna um objeto ResultadoIND
+    def avaliar_cagr(self, cagr):
+        # Tenta processar a avaliação do CAGR
+        try:
+            # Converte para float
+            cagr = converter_numero(cagr, "O valor do CAGR deve ser numérico.")
+            # Verifica se o CAGR foi calculado (NaN indica série sem pontas positivas)
+            if cagr != cagr:
+                raise ValueError("O CAGR não está definido para esta série (valor inicial zero ou negativo ou dados insuficientes).")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'CAGRLucrosEvaluator', cagr=cagr)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o CAGR de Lucros: {mensagem}.
+                Verifique os dados de entrada (valor inicial, valor final, número de anos) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe CAGREvaluator para avaliar o indicador CAGR de Receitas 5 Anos
+class CAGREvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do CAGR
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice CAGR de Receitas
+        self.definicao = texto('CAGREvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Crescimento"
+        self.agrupador = 'Crescimento'
+        # Define a fórmula do CAGR
+        self.formula = '''
+        CAGR = (VF / VI)^(1/n) - 1
+        Onde:
+        - VF = Valor Final das receitas (ao final do período de 5 anos)
+        - VI = Valor Inicial das receitas (no início do período de 5 anos)
+        - n = Número de anos (neste caso, 5)
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula o CAGR com base nos valores inicial e final das receitas
+    def calcular_cagr(self, valor_inicial, valor_final, anos=5):
+        try:
+            # Converte parâmetros para float
+            valor_inicial = converter_numero(valor_inicial, "O valor de Valor Inicial deve ser numérico.")
+            valor_final = converter_numero(valor_final, "O valor de Valor Final deve ser numérico.")
+            anos = converter_numero(anos, "O valor de Número de Anos deve ser numérico.")
+            # Verifica se o valor inicial é maior que zero
+            if valor_inicial <= 0:
+                raise ValueError("O valor inicial das receitas deve ser maior que zero.")
+            # Verifica se o número de anos é positivo
+            if anos <= 0:
+                raise ValueError("O número de anos deve ser maior que zero.")
+            # Calcula o CAGR
+            cagr = (valor_final / valor_inicial) ** (1 / anos) - 1
+            return cagr
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o CAGR: {str(e)}")
+
+    # Avalia o valor do CAGR e retorna um objeto ResultadoIND
+    def avaliar(self, valor_inicial, valor_final, anos=5):
+        # Tenta processar o cálculo do CAGR
+        try:
+            # Calcula o CAGR
+            cagr = self.calcular_cagr(valor_inicial, valor_final, anos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+        # Classifica o CAGR calculado nas faixas
+        return self.avaliar_cagr(cagr)
+
+    # Avalia um CAGR já calculado (ex.: pelo motor de séries históricas de cagrhistorico.py) e retorna um objeto ResultadoIND
+    def avaliar_cagr(self, cagr):
+        # Tenta processar a avaliação do CAGR
+        try:
+            # Converte para float
+            cagr = converter_numero(cagr, "O valor do CAGR deve ser numérico.")
+            # Verifica se o CAGR foi calculado (NaN indica série sem pontas positivas)
+            if cagr != cagr:
+                raise ValueError("O CAGR não está definido para esta série (valor inicial zero ou negativo ou dados insuficientes).")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'CAGREvaluator', cagr=cagr)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o CAGR: {mensagem}.
+                Verifique os dados de entrada (valor inicial, valor final, número de anos) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
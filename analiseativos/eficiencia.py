@@ -0,0 +1,428 @@
+# Avaliadores do agrupador Eficiência Operacional
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe CCCEvaluator para avaliar o indicador Ciclo de Conversão de Caixa
+class CCCEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do CCC
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Ciclo de Conversão de Caixa
+        self.definicao = texto('CCCEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Eficiência Operacional"
+        self.agrupador = 'Eficiência Operacional'
+        # Define a fórmula do CCC
+        self.formula = '''
+        CCC = (Período Médio de Estoques + Período Médio de Recebíveis - Período Médio de Pagamento)
+        Onde:
+        - Período Médio de Estoques = (Estoque Médio / Custo dos Bens Vendidos) * 365
+        - Período Médio de Recebíveis = (Contas a Receber Médias / Receita Líquida) * 365
+        - Período Médio de Pagamento = (Contas a Pagar Médias / Custo dos Bens Vendidos) * 365
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+
+        return wrapper
+
+    # Avalia o valor do Ciclo de Conversão de Caixa e retorna um objeto ResultadoIND
+    def avaliar(self, ccc):
+        # Tenta processar o valor do CCC
+        try:
+            # Converte CCC para float
+            ccc = converter_numero(ccc, "O valor do CCC deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'CCCEvaluator', ccc=ccc)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Ciclo de Conversão de Caixa: {mensagem}.
+                Verifique os dados de entrada (Estoque Médio, Contas a Receber, Contas a Pagar, Custo dos Bens Vendidos, Receita Líquida) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe GiroAtivoEvaluator para avaliar o indicador Giro do Ativo
+class GiroAtivoEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do Giro do Ativo
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Giro do Ativo
+        self.definicao = texto('GiroAtivoEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Eficiência Operacional"
+        self.agrupador = 'Eficiência Operacional'
+        # Define a fórmula do Giro do Ativo
+        self.formula = 'Giro do Ativo = Receita Líquida / Ativos Totais'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do Giro do Ativo e retorna um objeto ResultadoIND
+    def avaliar(self, giro_ativo):
+        # Tenta processar o valor do Giro do Ativo
+        try:
+            # Converte o Giro do Ativo para float para garantir que é numérico
+            giro_ativo = converter_numero(giro_ativo, "O valor do Giro do Ativo deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'GiroAtivoEvaluator', giro_ativo=giro_ativo)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Giro do Ativo: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe MargemEBITDAEvaluator para avaliar o indicador Margem EBITDA
+class MargemEBITDAEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula da Margem EBITDA
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Margem EBITDA
+        self.definicao = texto('MargemEBITDAEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Eficiência Operacional"
+        self.agrupador = 'Eficiência Operacional'
+        # Define a fórmula da Margem EBITDA
+        self.formula = 'Margem EBITDA (%) = (EBITDA / Receita Líquida) * 100'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor da Margem EBITDA e retorna um objeto ResultadoIND
+    def avaliar(self, margem_ebitda):
+        # Tenta processar o valor da Margem EBITDA
+        try:
+            # Converte a Margem EBITDA para float para garantir que é numérico
+            margem_ebitda = converter_numero(margem_ebitda, "O valor da Margem EBITDA deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'MargemEBITDAEvaluator', margem_ebitda=margem_ebitda)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Margem EBITDA: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe MargemEBITEvaluator para avaliar o indicador Margem EBIT
+class MargemEBITEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula da Margem EBIT
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Margem EBIT
+        self.definicao = texto('MargemEBITEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Eficiência Operacional"
+        self.agrupador = 'Eficiência Operacional'
+        # Define a fórmula da Margem EBIT
+        self.formula = 'Margem EBIT (%) = (EBIT / Receita Líquida) * 100'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor da Margem EBIT e retorna um objeto ResultadoIND
+    def avaliar(self, margem_ebit):
+        # Tenta processar o valor da Margem EBIT
+        try:
+            # Converte a Margem EBIT para float para garantir que é numérico
+            margem_ebit = converter_numero(margem_ebit, "O valor da Margem EBIT deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'MargemEBITEvaluator', margem_ebit=margem_ebit)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Margem EBIT: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe MargemBrutaEvaluator para avaliar o indicador Margem Bruta
+class MargemBrutaEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula da Margem Bruta
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Margem Bruta
+        self.definicao = texto('MargemBrutaEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Eficiência Operacional"
+        self.agrupador = 'Eficiência Operacional'
+        # Define a fórmula da Margem Bruta
+        self.formula = 'Margem Bruta (%) = ((Receita Líquida - Custo dos Produtos Vendidos) / Receita Líquida) * 100'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor da Margem Bruta e retorna um objeto ResultadoIND
+    def avaliar(self, margem_bruta):
+        # Tenta processar o valor da Margem Bruta
+        try:
+            # Converte a Margem Bruta para float para garantir que é numérico
+            margem_bruta = converter_numero(margem_bruta, "O valor da Margem Bruta deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'MargemBrutaEvaluator', margem_bruta=margem_bruta)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Margem Bruta: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
@@ -0,0 +1,385 @@
+# Avaliadores do agrupador Estrutura de Capital
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe WACCEvaluator para avaliar o indicador Custo Médio Ponderado de Capital
+class WACCEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do WACC
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice WACC
+        self.definicao = texto('WACCEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Estrutura de Capital"
+        self.agrupador = 'Estrutura de Capital'
+        # Define a fórmula do WACC
+        self.formula = '''
+        WACC = (E/V) × Re + (D/V) × Rd × (1 - Tc)
+        Onde:
+        - E = Valor de mercado do capital próprio (equity)
+        - D = Valor de mercado da dívida
+        - V = E + D (valor total da empresa)
+        - Re = Custo do capital próprio (ex.: estimado pelo CAPM)
+        - Rd = Custo da dívida (ex.: taxa de juros média)
+        - Tc = Taxa de imposto (alíquota efetiva, para dedução fiscal dos juros)
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula o WACC com base nos parâmetros fornecidos
+    def calcular_wacc(self, equity, divida, custo_equity, custo_divida, taxa_imposto):
+        try:
+            # Converte parâmetros para float
+            equity = converter_numero(equity, "O valor de Equity deve ser numérico.")
+            divida = converter_numero(divida, "O valor de Dívida deve ser numérico.")
+            custo_equity = converter_numero(custo_equity, "O valor de Custo do Equity deve ser numérico.")
+            custo_divida = converter_numero(custo_divida, "O valor de Custo da Dívida deve ser numérico.")
+            taxa_imposto = converter_numero(taxa_imposto, "O valor de Taxa de Imposto deve ser numérico.")
+            # Calcula o valor total (V = E + D)
+            valor_total = equity + divida
+            if valor_total == 0:
+                raise ValueError("O valor total (Equity + Dívida) não pode ser zero.")
+            # Calcula as proporções de equity e dívida
+            proporcao_equity = equity / valor_total
+            proporcao_divida = divida / valor_total
+            # Calcula o WACC
+            wacc = (proporcao_equity * custo_equity) + (proporcao_divida * custo_divida * (1 - taxa_imposto))
+            return wacc
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o WACC: {str(e)}")
+
+    # Avalia o valor do WACC e retorna um objeto ResultadoIND
+    def avaliar(self, equity, divida, custo_equity, custo_divida, taxa_imposto):
+        # Tenta processar o cálculo do WACC
+        try:
+            # Calcula o WACC
+            wacc = self.calcular_wacc(equity, divida, custo_equity, custo_divida, taxa_imposto)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+        # Classifica o WACC calculado nas faixas
+        return self.avaliar_wacc(wacc)
+
+    # Avalia um WACC já calculado (ex.: pelo cálculo em lote de custocapital.py) e retorna um objeto ResultadoIND
+    def avaliar_wacc(self, wacc):
+        # Tenta processar a avaliação do WACC
+        try:
+            # Converte para float
+            wacc = converter_numero(wacc, "O valor do WACC deve ser numérico.")
+            # Verifica se o WACC foi calculado (NaN indica dados ausentes no lote)
+            if wacc != wacc:
+                raise ValueError("O WACC não pôde ser calculado para este ativo.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'WACCEvaluator', wacc=wacc)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o WACC: {mensagem}.
+                Verifique os dados de entrada (Equity, Dívida, Custo do Equity, Custo da Dívida, Taxa de Imposto) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PatrimonioAtivosEvaluator para avaliar o indicador Patrimônio Líquido / Ativos
+class PatrimonioAtivosEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do Patrimônio/Ativos
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Patrimônio/Ativos
+        self.definicao = texto('PatrimonioAtivosEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Estrutura de Capital"
+        self.agrupador = 'Estrutura de Capital'
+        # Define a fórmula do Patrimônio/Ativos
+        self.formula = 'Patrimônio/Ativos = Patrimônio Líquido / Ativos Totais'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do Patrimônio/Ativos e retorna um objeto ResultadoIND
+    def avaliar(self, patrimonio_ativos):
+        # Tenta processar o valor do Patrimônio/Ativos
+        try:
+            # Converte o Patrimônio/Ativos para float para garantir que é numérico
+            patrimonio_ativos = converter_numero(patrimonio_ativos, "O valor do Patrimônio/Ativos deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PatrimonioAtivosEvaluator', patrimonio_ativos=patrimonio_ativos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Patrimônio/Ativos: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PLAtivosEvaluator para avaliar o indicador Patrimônio Líquido / Ativos
+class PLAtivosEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do PL/Ativos
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice PL/Ativos
+        self.definicao = texto('PLAtivosEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Estrutura de Capital"
+        self.agrupador = 'Estrutura de Capital'
+        # Define a fórmula do PL/Ativos
+        self.formula = 'PL/Ativos = Patrimônio Líquido / Ativos Totais'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do PL/Ativos e retorna um objeto ResultadoIND
+    def avaliar(self, pl_ativos):
+        # Tenta processar o valor do PL/Ativos
+        try:
+            # Converte o PL/Ativos para float para garantir que é numérico
+            pl_ativos = converter_numero(pl_ativos, "O valor do PL/Ativos deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PLAtivosEvaluator', pl_ativos=pl_ativos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o PL/Ativos: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PLAtivosEvaluator para avaliar o indicador Patrimônio Líquido / Ativos
+class PLAtivosEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do PL/Ativos
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice PL/Ativos
+        self.definicao = texto('PLAtivosEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Estrutura de Capital"
+        self.agrupador = 'Estrutura de Capital'
+        # Define a fórmula do PL/Ativos
+        self.formula = 'PL/Ativos = Patrimônio Líquido / Ativos Totais'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do PL/Ativos e retorna um objeto ResultadoIND
+    def avaliar(self, pl_ativos):
+        # Tenta processar o valor do PL/Ativos
+        try:
+            # Converte o PL/Ativos para float para garantir que é numérico
+            pl_ativos = converter_numero(pl_ativos, "O valor do PL/Ativos deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PLAtivosEvaluator', pl_ativos=pl_ativos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o PL/Ativos: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
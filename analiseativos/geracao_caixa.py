@@ -0,0 +1,120 @@
+# Avaliadores do agrupador Geração de Caixa
+# Importa o núcleo de desconto compartilhado com fluxodecaixagrok3/fluxodecaixagrok3brasil
+from descontos import fluxo_caixa_livre
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe FCFEvaluator para avaliar o indicador Fluxo de Caixa Livre
+class FCFEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do FCF
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Fluxo de Caixa Livre
+        self.definicao = texto('FCFEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Geração de Caixa"
+        self.agrupador = 'Geração de Caixa'
+        # Define a fórmula do FCF
+        self.formula = '''
+        FCF = EBIT × (1 - Taxa de Imposto) + Depreciação e Amortização - Variação no Capital de Giro - CAPEX
+        Onde:
+        - EBIT: Lucro antes de juros e impostos
+        - Taxa de Imposto: Alíquota efetiva de imposto
+        - Depreciação e Amortização: Despesas não-caixa
+        - Variação no Capital de Giro: Mudança nos ativos e passivos circulantes
+        - CAPEX: Gastos de capital em ativos fixos
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula o Fluxo de Caixa Livre com base nos parâmetros fornecidos
+    def calcular_fcf(self, ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex):
+        try:
+            # Converte todos os parâmetros para float
+            ebit = converter_numero(ebit, "O valor de EBIT deve ser numérico.")
+            taxa_imposto = converter_numero(taxa_imposto, "O valor de Taxa de Imposto deve ser numérico.")
+            depreciacao_amortizacao = converter_numero(depreciacao_amortizacao, "O valor de Depreciação e Amortização deve ser numérico.")
+            variacao_capital_giro = converter_numero(variacao_capital_giro, "O valor de Variação no Capital de Giro deve ser numérico.")
+            capex = converter_numero(capex, "O valor de CAPEX deve ser numérico.")
+            # Calcula o FCF pelo núcleo compartilhado
+            fcf = fluxo_caixa_livre(ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex)
+            return fcf
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o FCF: {str(e)}")
+
+    # Avalia o valor do FCF em relação à Receita Líquida e retorna um objeto ResultadoIND
+    def avaliar(self, ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex, receita_liquida):
+        # Tenta processar o cálculo do FCF e a avaliação
+        try:
+            # Converte Receita Líquida para float
+            receita_liquida = converter_numero(receita_liquida, "O valor da Receita Líquida deve ser numérico.")
+            # Calcula o FCF
+            fcf = self.calcular_fcf(ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex)
+            # Calcula a margem de FCF (FCF / Receita Líquida)
+            if receita_liquida == 0:
+                raise ValueError("A Receita Líquida não pode ser zero para calcular a margem de FCF.")
+            margem_fcf = fcf / receita_liquida
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'FCFEvaluator', margem_fcf=margem_fcf)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Fluxo de Caixa Livre: {mensagem}.
+                Verifique os dados de entrada (EBIT, Taxa de Imposto, Depreciação e Amortização, Variação no Capital de Giro, CAPEX, Receita Líquida) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
@@ -0,0 +1,104 @@
+# Avaliadores do agrupador Governança Corporativa
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe TagAlongEvaluator para avaliar o indicador Tag Along
+class TagAlongEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Tag Along
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Tag Along
+        self.definicao = texto('TagAlongEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Governança Corporativa"
+        self.agrupador = 'Governança Corporativa'
+        # Define a fórmula do Tag Along
+        self.formula = '''
+        Tag Along (%) = Percentual do preço por ação pago ao controlador garantido aos minoritários
+        Observação: O Tag Along é uma informação estatutária ou regulatória, geralmente definida como 0%, 80%, 100% ou outro percentual específico.
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Valida o percentual de Tag Along
+    def validar_tag_along(self, tag_along):
+        try:
+            # Converte para float
+            tag_along = converter_numero(tag_along, "O valor do Tag Along deve ser numérico.")
+            # Verifica se o Tag Along está entre 0% e 100%
+            if tag_along < 0 or tag_along > 100:
+                raise ValueError("O Tag Along deve estar entre 0% e 100%.")
+            return tag_along
+        except Exception as e:
+            raise ValueError(f"Erro ao validar o Tag Along: {str(e)}")
+
+    # Avalia o valor do Tag Along e retorna um objeto ResultadoIND
+    def avaliar(self, tag_along):
+        # Tenta processar a avaliação do Tag Along
+        try:
+            # Valida o Tag Along
+            tag_along = self.validar_tag_along(tag_along)
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'TagAlongEvaluator', tag_along=tag_along)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Tag Along: {mensagem}.
+                Verifique o dado de entrada (percentual de Tag Along) e assegure que seja um valor numérico válido entre 0% e 100%.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
@@ -0,0 +1,375 @@
+# Avaliadores do agrupador Liquidez
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe LiquidezSecaEvaluator para avaliar o indicador Liquidez Seca
+class LiquidezSecaEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição da Liquidez Seca
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Liquidez Seca
+        self.definicao = texto('LiquidezSecaEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Liquidez"
+        self.agrupador = 'Liquidez'
+        # Define a fórmula da Liquidez Seca
+        self.formula = 'Liquidez Seca = (Ativo Circulante - Estoques) / Passivo Circulante'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula a Liquidez Seca ((Ativo Circulante - Estoques) / Passivo Circulante)
+    def calcular_liquidez_seca(self, ativo_circulante, estoques, passivo_circulante):
+        # Converte Ativo Circulante, Estoques e Passivo Circulante para float
+        ativo_circulante = converter_numero(ativo_circulante, "O valor de Ativo Circulante deve ser numérico.")
+        estoques = converter_numero(estoques, "O valor de Estoques deve ser numérico.")
+        passivo_circulante = converter_numero(passivo_circulante, "O valor de Passivo Circulante deve ser numérico.")
+        # Calcula Liquidez Seca
+        if passivo_circulante == 0:
+            raise ValueError("O Passivo Circulante não pode ser zero para calcular a Liquidez Seca.")
+        return (ativo_circulante - estoques) / passivo_circulante
+
+    # Avalia o valor da Liquidez Seca e retorna um objeto ResultadoIND
+    def avaliar(self, ativo_circulante, estoques, passivo_circulante):
+        # Tenta processar os valores de Ativo Circulante, Estoques e Passivo Circulante
+        try:
+            # Calcula a Liquidez Seca
+            liquidez_seca = self.calcular_liquidez_seca(ativo_circulante, estoques, passivo_circulante)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+        # Classifica a Liquidez Seca calculada nas faixas
+        return self.avaliar_liquidez_seca(liquidez_seca)
+
+    # Avalia uma Liquidez Seca já calculada (ex.: pelo grafo de indicadores derivados) e retorna um objeto ResultadoIND
+    def avaliar_liquidez_seca(self, liquidez_seca):
+        # Tenta processar a Liquidez Seca
+        try:
+            # Converte para float
+            liquidez_seca = converter_numero(liquidez_seca, "O valor da Liquidez Seca deve ser numérico.")
+            # Verifica se a Liquidez Seca foi calculada (NaN indica dado ausente ou Passivo Circulante zero no lote)
+            if liquidez_seca != liquidez_seca:
+                raise ValueError("A Liquidez Seca não pôde ser calculada para este ativo.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'LiquidezSecaEvaluator', liquidez_seca=liquidez_seca)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Liquidez Seca: {mensagem}.
+                Verifique os dados de entrada (Ativo Circulante, Estoques e Passivo Circulante) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe DisponibilidadesEvaluator para avaliar o indicador Disponibilidades
+class DisponibilidadesEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição das Disponibilidades
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Disponibilidades
+        self.definicao = texto('DisponibilidadesEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Liquidez"
+        self.agrupador = 'Liquidez'
+        # Define a fórmula das Disponibilidades
+        self.formula = 'Disponibilidades = Caixa + Equivalentes de Caixa'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor das Disponibilidades em relação ao Passivo Circulante e retorna um objeto ResultadoIND
+    def avaliar(self, disponibilidades, passivo_circulante):
+        # Tenta processar o valor das Disponibilidades e Passivo Circulante
+        try:
+            # Converte Disponibilidades e Passivo Circulante para float
+            disponibilidades = converter_numero(disponibilidades, "O valor de Disponibilidades deve ser numérico.")
+            passivo_circulante = converter_numero(passivo_circulante, "O valor de Passivo Circulante deve ser numérico.")
+            # Calcula a proporção das Disponibilidades em relação ao Passivo Circulante (Liquidez Imediata)
+            if passivo_circulante == 0:
+                raise ValueError("O Passivo Circulante não pode ser zero para calcular a proporção.")
+            proporcao_liquidez_imediata = disponibilidades / passivo_circulante
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'DisponibilidadesEvaluator', disponibilidades=disponibilidades, proporcao_liquidez_imediata=proporcao_liquidez_imediata)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar as Disponibilidades: {mensagem}.
+                Verifique os dados de entrada (Disponibilidades e Passivo Circulante) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe AtivoCirculanteEvaluator para avaliar o indicador Ativo Circulante
+class AtivoCirculanteEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Ativo Circulante
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Ativo Circulante
+        self.definicao = texto('AtivoCirculanteEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Liquidez"
+        self.agrupador = 'Liquidez'
+        # Define a fórmula do Ativo Circulante
+        self.formula = 'Ativo Circulante = Caixa e Equivalentes + Contas a Receber + Estoques + Outros Ativos de Curto Prazo'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do Ativo Circulante em relação ao Passivo Circulante e retorna um objeto ResultadoIND
+    def avaliar(self, ativo_circulante, passivo_circulante):
+        # Tenta processar o valor do Ativo Circulante e Passivo Circulante
+        try:
+            # Converte Ativo Circulante e Passivo Circulante para float
+            ativo_circulante = converter_numero(ativo_circulante, "O valor de Ativo Circulante deve ser numérico.")
+            passivo_circulante = converter_numero(passivo_circulante, "O valor de Passivo Circulante deve ser numérico.")
+            # Calcula a proporção do Ativo Circulante em relação ao Passivo Circulante (Liquidez Corrente)
+            if passivo_circulante == 0:
+                raise ValueError("O Passivo Circulante não pode ser zero para calcular a proporção.")
+            proporcao_liquidez_corrente = ativo_circulante / passivo_circulante
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'AtivoCirculanteEvaluator', ativo_circulante=ativo_circulante, proporcao_liquidez_corrente=proporcao_liquidez_corrente)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Ativo Circulante: {mensagem}.
+                Verifique os dados de entrada (Ativo Circulante e Passivo Circulante) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe LiquidezCorrenteEvaluator para avaliar o indicador Liquidez Corrente
+class LiquidezCorrenteEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula da Liquidez Corrente
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Liquidez Corrente
+        self.definicao = texto('LiquidezCorrenteEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Liquidez"
+        self.agrupador = 'Liquidez'
+        # Define a fórmula da Liquidez Corrente
+        self.formula = 'Liquidez Corrente = Ativo Circulante / Passivo Circulante'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor da Liquidez Corrente e retorna um objeto ResultadoIND
+    def avaliar(self, liquidez_corrente):
+        # Tenta processar o valor da Liquidez Corrente
+        try:
+            # Converte a Liquidez Corrente para float para garantir que é numérico
+            liquidez_corrente = converter_numero(liquidez_corrente, "O valor da Liquidez Corrente deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'LiquidezCorrenteEvaluator', liquidez_corrente=liquidez_corrente)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Liquidez Corrente: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
@@ -0,0 +1,287 @@
+# Avaliadores do agrupador Liquidez de Mercado
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe FreeFloatEvaluator para avaliar o indicador Free Float
+class FreeFloatEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Free Float
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Free Float
+        self.definicao = texto('FreeFloatEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Liquidez de Mercado"
+        self.agrupador = 'Liquidez de Mercado'
+        # Define a fórmula do Free Float
+        self.formula = '''
+        Free Float (%) = (Ações em Circulação - Ações Restritas) / Total de Ações × 100
+        Onde:
+        - Ações em Circulação: Total de ações emitidas disponíveis no mercado
+        - Ações Restritas: Ações detidas por controladores, insiders ou bloqueadas
+        - Total de Ações: Soma de todas as ações emitidas pela empresa
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+
+    # Avalia o valor do Free Float e retorna um objeto ResultadoIND
+    def avaliar(self, total_acoes):
+        # Tenta processar o cálculo do Free Float e a avaliação
+        try:
+            # Calcula o Free Float
+            free_float = self. total_acoes
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'FreeFloatEvaluator', free_float=free_float)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Free Float: {mensagem}.
+                Verifique os dados de entrada (ações em circulação, ações restritas, total de ações) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe FreeFloatEvaluator para avaliar o indicador Free Float
+class FreeFloatEvaluatororiginal:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Free Float
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Free Float
+        self.definicao = texto('FreeFloatEvaluatororiginal', 'definicao')
+        # Define a categoria de agrupamento como "Liquidez de Mercado"
+        self.agrupador = 'Liquidez de Mercado'
+        # Define a fórmula do Free Float
+        self.formula = '''
+        Free Float (%) = (Ações em Circulação - Ações Restritas) / Total de Ações × 100
+        Onde:
+        - Ações em Circulação: Total de ações emitidas disponíveis no mercado
+        - Ações Restritas: Ações detidas por controladores, insiders ou bloqueadas
+        - Total de Ações: Soma de todas as ações emitidas pela empresa
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula o Free Float com base no número de ações
+    def calcular_free_float(self, acoes_em_circulacao, acoes_restritas, total_acoes):
+        try:
+            # Converte parâmetros para float
+            acoes_em_circulacao = converter_numero(acoes_em_circulacao, "O valor de Ações em Circulação deve ser numérico.")
+            acoes_restritas = converter_numero(acoes_restritas, "O valor de Ações Restritas deve ser numérico.")
+            total_acoes = converter_numero(total_acoes, "O valor de Total de Ações deve ser numérico.")
+            # Verifica se o total de ações é maior que zero
+            if total_acoes <= 0:
+                raise ValueError("O total de ações deve ser maior que zero.")
+            # Verifica se as ações restritas são menores ou iguais às ações em circulação
+            if acoes_restritas > acoes_em_circulacao:
+                raise ValueError("As ações restritas não podem exceder as ações em circulação.")
+            # Calcula o Free Float
+            free_float = ((acoes_em_circulacao - acoes_restritas) / total_acoes) * 100
+            return free_float
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o Free Float: {str(e)}")
+
+    # Avalia o valor do Free Float e retorna um objeto ResultadoIND
+    def avaliar(self, acoes_em_circulacao, acoes_restritas, total_acoes):
+        # Tenta processar o cálculo do Free Float e a avaliação
+        try:
+            # Calcula o Free Float
+            free_float = self.calcular_free_float(acoes_em_circulacao, acoes_restritas, total_acoes)
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'FreeFloatEvaluatororiginal', free_float=free_float)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Free Float: {mensagem}.
+                Verifique os dados de entrada (ações em circulação, ações restritas, total de ações) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe LiquidezMediaDiariaEvaluator para avaliar o indicador Liquidez Média Diária
+class LiquidezMediaDiariaEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula da Liquidez Média Diária
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Liquidez Média Diária
+        self.definicao = texto('LiquidezMediaDiariaEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Liquidez de Mercado"
+        self.agrupador = 'Liquidez de Mercado'
+        # Define a fórmula da Liquidez Média Diária
+        self.formula = 'Liquidez Média Diária = Valor Total Negociado / Número de Dias'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor da Liquidez Média Diária e retorna um objeto ResultadoIND
+    def avaliar(self, liquidez_media_diaria):
+        # Tenta processar o valor da Liquidez Média Diária
+        try:
+            # Converte a Liquidez Média Diária para float para garantir que é numérico
+            liquidez_media_diaria = converter_numero(liquidez_media_diaria, "O valor da Liquidez Média Diária deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'LiquidezMediaDiariaEvaluator', liquidez_media_diaria=liquidez_media_diaria)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Liquidez Média Diária: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
@@ -0,0 +1,379 @@
+# Avaliadores do agrupador Lucratividade, Lucratividade Operacional e Desempenho Operacional
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe LucroLiquidoEvaluator para avaliar o indicador Lucro Líquido
+class LucroLiquidoEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Lucro Líquido
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Lucro Líquido
+        self.definicao = texto('LucroLiquidoEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Lucratividade"
+        self.agrupador = 'Lucratividade'
+        # Define a fórmula do Lucro Líquido
+        self.formula = 'Lucro Líquido = Receita Líquida - (Custos Operacionais + Despesas Operacionais + Juros + Impostos + Outros Ajustes)'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula a margem líquida (Lucro Líquido / Receita Líquida)
+    def calcular_margem_liquida(self, lucro_liquido, receita_liquida):
+        # Converte Lucro Líquido e Receita Líquida para float
+        lucro_liquido = converter_numero(lucro_liquido, "O valor de Lucro Líquido deve ser numérico.")
+        receita_liquida = converter_numero(receita_liquida, "O valor de Receita Líquida deve ser numérico.")
+        # Calcula a margem líquida (Lucro Líquido / Receita Líquida)
+        if receita_liquida == 0:
+            raise ValueError("A Receita Líquida não pode ser zero para calcular a margem líquida.")
+        return lucro_liquido / receita_liquida
+
+    # Avalia o valor do Lucro Líquido em relação à Receita Líquida e retorna um objeto ResultadoIND
+    def avaliar(self, lucro_liquido, receita_liquida):
+        # Tenta processar o valor do Lucro Líquido e Receita Líquida
+        try:
+            # Calcula a margem líquida
+            margem_liquida = self.calcular_margem_liquida(lucro_liquido, receita_liquida)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+        # Classifica a margem líquida calculada nas faixas
+        return self.avaliar_margem_liquida(margem_liquida)
+
+    # Avalia uma margem líquida já calculada (ex.: pelo grafo de indicadores derivados) e retorna um objeto ResultadoIND
+    def avaliar_margem_liquida(self, margem_liquida):
+        # Tenta processar a margem líquida
+        try:
+            # Converte para float
+            margem_liquida = converter_numero(margem_liquida, "O valor da margem líquida deve ser numérico.")
+            # Verifica se a margem foi calculada (NaN indica dado ausente ou Receita Líquida zero no lote)
+            if margem_liquida != margem_liquida:
+                raise ValueError("A margem líquida não pôde ser calculada para este ativo.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'LucroLiquidoEvaluator', margem_liquida=margem_liquida)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Lucro Líquido: {mensagem}.
+                Verifique os dados de entrada (Lucro Líquido e Receita Líquida) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe EBITDAEvaluator para avaliar o indicador EBITDA
+class EBITDAEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do EBITDA
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice EBITDA
+        self.definicao = texto('EBITDAEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Lucratividade Operacional"
+        self.agrupador = 'Lucratividade Operacional'
+        # Define a fórmula do EBITDA
+        self.formula = 'EBITDA = Receita Líquida - Custos Operacionais - Despesas Operacionais (excluindo Depreciação e Amortização)'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do EBITDA em relação à Receita Líquida e retorna um objeto ResultadoIND
+    def avaliar(self, ebitda, receita_liquida):
+        # Tenta processar o valor do EBITDA e Receita Líquida
+        try:
+            # Converte EBITDA e Receita Líquida para float
+            ebitda = converter_numero(ebitda, "O valor de EBITDA deve ser numérico.")
+            receita_liquida = converter_numero(receita_liquida, "O valor de Receita Líquida deve ser numérico.")
+            # Calcula a margem EBITDA (EBITDA / Receita Líquida)
+            if receita_liquida == 0:
+                raise ValueError("A Receita Líquida não pode ser zero para calcular a margem EBITDA.")
+            margem_ebitda = ebitda / receita_liquida
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'EBITDAEvaluator', ebitda=ebitda)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o EBITDA: {mensagem}.
+                Verifique os dados de entrada (EBITDA e Receita Líquida) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe EBITEvaluator para avaliar o indicador EBIT
+class EBITEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do EBIT
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice EBIT
+        self.definicao = texto('EBITEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Lucratividade Operacional"
+        self.agrupador = 'Lucratividade Operacional'
+        # Define a fórmula do EBIT
+        self.formula = 'EBIT = Receita Líquida - Custos Operacionais - Despesas Operacionais'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do EBIT em relação à Receita Líquida e retorna um objeto ResultadoIND
+    def avaliar(self, ebit, receita_liquida):
+        # Tenta processar o valor do EBIT e Receita Líquida
+        try:
+            # Converte EBIT e Receita Líquida para float
+            ebit = converter_numero(ebit, "O valor de EBIT deve ser numérico.")
+            receita_liquida = converter_numero(receita_liquida, "O valor de Receita Líquida deve ser numérico.")
+            # Calcula a margem EBIT (EBIT / Receita Líquida)
+            if receita_liquida == 0:
+                raise ValueError("A Receita Líquida não pode ser zero para calcular a margem EBIT.")
+            margem_ebit = ebit / receita_liquida
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'EBITEvaluator', margem_ebit=margem_ebit)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o EBIT: {mensagem}.
+                Verifique os dados de entrada (EBIT e Receita Líquida) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe ReceitaLiquidaEvaluator para avaliar o indicador Receita Líquida
+class ReceitaLiquidaEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição da Receita Líquida
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Receita Líquida
+        self.definicao = texto('ReceitaLiquidaEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Desempenho Operacional"
+        self.agrupador = 'Desempenho Operacional'
+        # Define a fórmula da Receita Líquida
+        self.formula = 'Receita Líquida = Receita Bruta - (Impostos + Devoluções + Descontos)'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor da Receita Líquida em relação aos Ativos Totais e retorna um objeto ResultadoIND
+    def avaliar(self, receita_liquida, ativos_totais):
+        # Tenta processar o valor da Receita Líquida e Ativos Totais
+        try:
+            # Converte Receita Líquida e Ativos Totais para float
+            receita_liquida = converter_numero(receita_liquida, "O valor de Receita Líquida deve ser numérico.")
+            ativos_totais = converter_numero(ativos_totais, "O valor de Ativos Totais deve ser numérico.")
+            # Calcula a proporção da Receita Líquida em relação aos Ativos Totais (Giro do Ativo)
+            if ativos_totais == 0:
+                raise ValueError("Os Ativos Totais não podem ser zero para calcular a proporção.")
+            proporcao_receita_ativos = receita_liquida / ativos_totais
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'ReceitaLiquidaEvaluator', receita_liquida=receita_liquida, proporcao_receita_ativos=proporcao_receita_ativos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar a Receita Líquida: {mensagem}.
+                Verifique os dados de entrada (Receita Líquida e Ativos Totais) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
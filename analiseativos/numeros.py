@@ -0,0 +1,128 @@
+# Conversão das entradas numéricas dos avaliadores, compartilhada por todos os avaliar/calcular_*.
+# Razão: cada método repetia a validação isinstance(x, (int, float)) or x.replace('.', '', 1).isdigit(),
+# que custa várias chamadas por valor nos laços e recusa strings válidas como '-1.5' (sinal) ou
+# '1.234,5' (formato brasileiro). Aqui a validação é uma expressão regular compilada uma única vez, com
+# caminho direto para float e int, e há uma versão em lote para arrays que pode dispensar a validação
+# quando os dados já chegam normalizados.
+import re
+
+
+# Mensagem usada quando o avaliador não informa uma específica
+MENSAGEM_PADRAO = "O valor deve ser numérico."
+
+# Número com ponto decimal (como float() aceita, sem espaços internos): '12', '-1.5', '.5', '5.', '1e3'
+_NUMERO = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+# Número no formato brasileiro: milhares com ponto e decimais com vírgula ('1.234,5', '-0,75', '1.234.567')
+_NUMERO_BR = re.compile(r'\s*([+-]?)(\d{1,3}(?:\.\d{3})+|\d+)(?:,(\d*))?\s*')
+
+
+def converter_numero(valor, mensagem=MENSAGEM_PADRAO):
+    '''
+    Converte uma entrada de avaliador em float.
+
+    Aceita int, float (inclusive NaN e infinito, que seguem para as faixas como antes), tipos numéricos
+    do numpy e strings numéricas com sinal, em notação comum ('-1.5', '1e3') ou brasileira ('1.234,5').
+    Uma string só com um ponto ('1.234') é lida com ponto decimal, como antes; o ponto só é separador de
+    milhares quando há vírgula decimal ou mais de um ponto ('1.234.567').
+
+    Parâmetros:
+    - valor: valor recebido pelo avaliador
+    - mensagem: mensagem do ValueError quando o valor não é numérico (ex.: "O valor do ROE deve ser numérico.")
+
+    Retorna:
+    - float
+    '''
+    # Caminho mais comum nos laços: o valor já é float ou int
+    tipo = type(valor)
+    if tipo is float:
+        return valor
+    if tipo is int:
+        return float(valor)
+    if isinstance(valor, str):
+        # Dígitos com no máximo um ponto: o formato mais comum dispensa a expressão regular
+        if valor.replace('.', '', 1).isdigit() or _NUMERO.fullmatch(valor):
+            return float(valor)
+        encontrado = _NUMERO_BR.fullmatch(valor)
+        if encontrado is None:
+            raise ValueError(mensagem)
+        sinal, inteira, decimais = encontrado.groups()
+        return float(f"{sinal}{inteira.replace('.', '')}.{decimais or '0'}")
+    # Subclasses de int/float (bool, numpy.float64) e demais números reais (numpy.int64...)
+    if isinstance(valor, (int, float)) or _real(valor):
+        return float(valor)
+    raise ValueError(mensagem)
+
+
+def _real(valor):
+    # numbers só é importado quando chega um tipo fora de int, float e str
+    import numbers
+
+    return isinstance(valor, numbers.Real)
+
+
+def converter_numeros(valores, mensagem=MENSAGEM_PADRAO, validar=True, invalido=None):
+    '''
+    Versão em lote de converter_numero para listas, Series e arrays.
+
+    Parâmetros:
+    - valores: sequência ou array de valores
+    - mensagem: mensagem do ValueError para valores não numéricos
+    - validar: se False, só converte para float (np.asarray), sem nenhuma verificação; para quem já
+      passa arrays de float normalizados
+    - invalido: se informado (ex.: np.nan), valor usado no lugar das entradas não numéricas em vez de
+      levantar ValueError
+
+    Retorna:
+    - np.ndarray de float com o mesmo formato da entrada
+    '''
+    import numpy as np
+
+    if not validar:
+        return np.asarray(valores, dtype=float)
+    matriz = np.asarray(valores)
+    # Arrays numéricos (float, int, bool) são convertidos de uma vez
+    if matriz.dtype.kind in 'fiub':
+        return matriz.astype(float, copy=False)
+    # Demais entradas elemento a elemento, com os tipos originais (listas mistas viram array de str no numpy)
+    matriz = np.asarray(valores, dtype=object)
+
+    def converter(valor):
+        try:
+            return converter_numero(valor, mensagem)
+        except ValueError:
+            if invalido is None:
+                raise
+            return invalido
+
+    return np.fromiter((converter(valor) for valor in matriz.ravel()), dtype=float,
+                       count=matriz.size).reshape(matriz.shape)
+
+
+# Bloco principal: compara a validação antiga (replace + isdigit, repetida em cada avaliador) com a
+# compartilhada e mede a versão em lote (1 milhão de valores)
+if __name__ == "__main__":
+    import timeit
+
+    import numpy as np
+
+    def validacao_antiga(valor):
+        if not isinstance(valor, (int, float)) and not (isinstance(valor, str) and valor.replace('.', '', 1).isdigit()):
+            raise ValueError(MENSAGEM_PADRAO)
+        return float(valor)
+
+    for rotulo, valor in (('float', 12.5), ('int', 12), ('str', '12.5')):
+        antigo = min(timeit.repeat(lambda: validacao_antiga(valor), number=200_000, repeat=5)) / 200_000
+        novo = min(timeit.repeat(lambda: converter_numero(valor), number=200_000, repeat=5)) / 200_000
+        print(f"{rotulo:>5}: antiga {antigo * 1e9:.0f} ns | compartilhada {novo * 1e9:.0f} ns")
+    for valor in ('-1.5', '1.234,5', '-0,75', '1.234.567', '1.234', 'abc'):
+        try:
+            print(f"{valor!r:>12} -> {converter_numero(valor)!r}")
+        except ValueError as e:
+            print(f"{valor!r:>12} -> ValueError: {e}")
+    lote = np.random.default_rng(0).normal(10, 5, 1_000_000)
+    textos = [f'{valor:.2f}'.replace('.', ',') for valor in lote[:100_000]]
+    for rotulo, funcao in (('array de float, converter_numeros', lambda: converter_numeros(lote)),
+                           ('array de float, sem validação', lambda: converter_numeros(lote, validar=False)),
+                           ('lista de float, converter_numeros', lambda: converter_numeros(lote.tolist())),
+                           ('100 mil strings brasileiras, converter_numeros', lambda: converter_numeros(textos))):
+        print(f"{rotulo}: {min(timeit.repeat(funcao, number=1, repeat=3)) * 1e3:.2f} ms")
@@ -0,0 +1,351 @@
+# Tabela única de regras de classificação (faixas) dos avaliadores.
+# Razão: as faixas viviam em cadeias if/elif repetidas em dois lugares, as classes deste pacote e as
+# funções evaluate_* de analisefundamentalista.py (estas com definições duplicadas, em que a última
+# sobrescreve a anterior em silêncio), e o mesmo indicador tinha limites diferentes em cada um.
+# Agora as faixas ficam em regras.json (fonte editável) e a tabela inteira é compilada em funções Python
+# equivalentes às cadeias originais: mesmas comparações, na mesma ordem (NaN continua sem faixa e entradas
+# inválidas levantam as mesmas exceções). O código compilado fica em regras.bin e é carregado uma única vez
+# por processo, na primeira avaliação. As classes e as funções evaluate_* só consultam a tabela e montam o
+# resultado com os textos do catálogo (uma vez por faixa; ver cache.py).
+import copy
+import os
+from functools import lru_cache
+
+from .cache import cache_resultados
+from .catalogo import texto
+
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_REGRAS = os.path.join(DIRETORIO, 'regras.json')
+ARQUIVO_COMPILADO = os.path.join(DIRETORIO, 'regras.bin')
+
+# Cabeçalho do regras.bin: identificador, versão do Python (cache_tag), data de modificação e tamanho do regras.json
+_FORMATO_CABECALHO = '<4s16sdQ'
+_IDENTIFICADOR = b'RGC1'
+
+# Índice devolvido quando nenhuma faixa se aplica (ex.: NaN ou valor fora das condições)
+SEM_FAIXA = -1
+
+
+def _partes(condicao):
+    # Operandos e operadores alternados: '0 <= roe <= 5' -> ['0', '<=', 'roe', '<=', '5']
+    import re
+
+    return re.split(r'\s*(<=|>=|==|!=|<|>)\s*', condicao.strip())
+
+
+def _analisar(condicao):
+    # Valida a condição (só comparações entre nomes e números, ex.: '0 <= roe <= 5') e devolve
+    # (variáveis em ordem, limites)
+    partes = _partes(condicao)
+    # Operandos nas posições pares e operadores nas ímpares: a op b [op c ...]
+    if len(partes) < 3:
+        raise ValueError(f"Condição inválida (esperada uma comparação): {condicao!r}")
+    variaveis = []
+    limites = []
+    for operando in partes[::2]:
+        if operando.isidentifier():
+            if operando not in variaveis:
+                variaveis.append(operando)
+            continue
+        try:
+            limites.append(int(operando) if operando.lstrip('-').isdigit() else float(operando))
+        except ValueError:
+            raise ValueError(f"Condição inválida (só nomes e números): {condicao!r}") from None
+    return variaveis, limites
+
+
+def _fonte(nome_funcao, variaveis, faixas):
+    # Código da cadeia if/elif equivalente às faixas; cada ramo devolve a posição da faixa
+    linhas = [f"def {nome_funcao}({', '.join(variaveis)}):"]
+    for i, faixa in enumerate(faixas):
+        if faixa['condicao'] is None:
+            # Faixa sem condição: o else final da cadeia original
+            linhas += ['    else:' if i else '    if True:', f'        return {i}']
+        else:
+            linhas += [f"    {'elif' if i else 'if'} {faixa['condicao']}:", f'        return {i}']
+    linhas.append(f'    return {SEM_FAIXA}')
+    return '\n'.join(linhas)
+
+
+def _fonte_lote(variaveis, faixas):
+    # Código da versão vetorizada (numpy) das condições: uma máscara booleana por faixa, com as
+    # comparações encadeadas desdobradas ('0 <= x <= 5' -> (0 <= x) & (x <= 5))
+    argumentos = ', '.join(variaveis)
+    linhas = [f"def _condicoes({argumentos}):"]
+    linhas += [f"    {variavel} = _np.asarray({variavel}, dtype=float)" for variavel in variaveis]
+    linhas.append(f"    _forma = _np.broadcast_shapes({''.join(f'{variavel}.shape, ' for variavel in variaveis)})")
+    mascaras = []
+    for faixa in faixas:
+        if faixa['condicao'] is None:
+            # Faixa sem condição (else): vale para todos os pontos que não caíram nas anteriores
+            mascaras.append('True')
+            continue
+        partes = _partes(faixa['condicao'])
+        mascaras.append(' & '.join(f'({partes[i]} {partes[i + 1]} {partes[i + 2]})'
+                                   for i in range(0, len(partes) - 2, 2)))
+    linhas.append('    return [' + ', '.join(f'_np.broadcast_to({mascara}, _forma)' for mascara in mascaras) + ']')
+    return '\n'.join(linhas)
+
+
+def _analisar_regra(nome, faixas):
+    # Variáveis (na ordem em que aparecem) e limites numéricos de todas as faixas de uma regra
+    variaveis = []
+    limites = []
+    for posicao, faixa in enumerate(faixas):
+        if faixa['condicao'] is None:
+            # Só a última faixa pode ficar sem condição (é o else da cadeia)
+            if posicao != len(faixas) - 1:
+                raise ValueError(f"Regra {nome}: só a última faixa pode não ter condição.")
+            continue
+        variaveis_faixa, limites_faixa = _analisar(faixa['condicao'])
+        variaveis += [variavel for variavel in variaveis_faixa if variavel not in variaveis]
+        limites += [limite for limite in limites_faixa if limite not in limites]
+    return variaveis, sorted(limites)
+
+
+def compilar_regras(origem=ARQUIVO_REGRAS, destino=ARQUIVO_COMPILADO):
+    '''
+    Compila regras.json em regras.bin: as faixas, as variáveis e limites de cada regra e o código
+    (marshal) de uma função por regra, todas geradas num único código-fonte e compiladas de uma vez.
+
+    Compilar a tabela inteira leva dezenas de milissegundos; carregar o regras.bin, menos de um. Como o
+    código compilado depende da versão do Python, o cabeçalho guarda a versão além da data e do tamanho
+    do regras.json de origem.
+
+    Retorna:
+    - tuple (faixas por regra, (variáveis, limites) por regra, código compilado)
+    '''
+    import json
+    import marshal
+    import struct
+    import sys
+
+    with open(origem, encoding='utf-8') as f:
+        dados = json.load(f)
+    analises = {nome: _analisar_regra(nome, regra['faixas']) for nome, regra in dados.items()}
+    # Uma função por regra (_regra_0, _regra_1...), na ordem do regras.json
+    fonte = '\n\n'.join(_fonte(f'_regra_{i}', analises[nome][0], regra['faixas'])
+                         for i, (nome, regra) in enumerate(dados.items()))
+    compilado = (dados, analises, compile(fonte, origem, 'exec'))
+    estado = os.stat(origem)
+    try:
+        # Grava em arquivo temporário e substitui, para que leitores nunca vejam um arquivo pela metade
+        temporario = destino + '.tmp'
+        with open(temporario, 'wb') as f:
+            f.write(struct.pack(_FORMATO_CABECALHO, _IDENTIFICADOR, sys.implementation.cache_tag.encode(),
+                                estado.st_mtime, estado.st_size))
+            f.write(marshal.dumps(compilado))
+        os.replace(temporario, destino)
+    except OSError:
+        # Pacote em diretório somente leitura: a tabela compilada fica só em memória
+        pass
+    return compilado
+
+
+def _carregar(origem, caminho):
+    # Lê o regras.bin quando ele corresponde ao regras.json e à versão do Python; senão recompila
+    import marshal
+    import struct
+    import sys
+
+    tamanho_cabecalho = struct.calcsize(_FORMATO_CABECALHO)
+    try:
+        with open(caminho, 'rb') as f:
+            bruto = f.read()
+        identificador, versao, mtime, tamanho = struct.unpack_from(_FORMATO_CABECALHO, bruto)
+        estado = os.stat(origem)
+        if (identificador, versao.rstrip(b'\0'), mtime, tamanho) == \
+                (_IDENTIFICADOR, sys.implementation.cache_tag.encode(), estado.st_mtime, estado.st_size):
+            return marshal.loads(bruto[tamanho_cabecalho:])
+    except (OSError, struct.error, ValueError, EOFError):
+        pass
+    return compilar_regras(origem, caminho)
+
+
+class Regra:
+    # Faixas de um avaliador já compiladas
+    __slots__ = ('nome', 'variaveis', 'limites', 'faixas', 'dados', 'classificar', '_condicoes')
+
+    def __init__(self, nome, dados, variaveis, limites, classificar):
+        self.nome = nome
+        self.dados = dados
+        self.faixas = tuple(dados['faixas'])
+        self.variaveis = variaveis
+        self.limites = limites
+        # Função compilada com a cadeia if/elif das faixas
+        self.classificar = classificar
+        # Versão vetorizada das condições, compilada só no primeiro uso em lote
+        self._condicoes = None
+
+    def indice(self, *args, **kwargs):
+        '''
+        Posição da faixa em que os valores se enquadram (SEM_FAIXA quando nenhuma se aplica).
+        '''
+        return self.classificar(*args, **kwargs)
+
+    def faixa(self, *args, **kwargs):
+        '''
+        Faixa ({'condicao', 'classificacao', 'faixa'}) em que os valores se enquadram, ou None.
+        '''
+        indice = self.classificar(*args, **kwargs)
+        return None if indice == SEM_FAIXA else self.faixas[indice]
+
+    def condicoes(self, *args, **kwargs):
+        '''
+        Avalia a condição de cada faixa, isoladamente, sobre arrays de valores (numpy).
+
+        Retorna:
+        - list com uma máscara booleana por faixa (a faixa sem condição vale True em todos os pontos);
+          pontos com mais de uma máscara verdadeira estão em faixas sobrepostas
+        '''
+        if self._condicoes is None:
+            import numpy as np
+
+            funcoes = {'_np': np}
+            exec(compile(_fonte_lote(self.variaveis, self.faixas), f'<regra {self.nome}>', 'exec'), funcoes)
+            self._condicoes = funcoes['_condicoes']
+        return self._condicoes(*args, **kwargs)
+
+    def indices(self, *args, **kwargs):
+        '''
+        Versão em lote de indice: posição da faixa de cada ponto (SEM_FAIXA quando nenhuma se aplica),
+        com a mesma precedência da cadeia if/elif (a primeira condição verdadeira vence).
+
+        Retorna:
+        - np.ndarray de int
+        '''
+        import numpy as np
+
+        mascaras = self.condicoes(*args, **kwargs)
+        return np.select(mascaras, range(len(mascaras)), default=SEM_FAIXA)
+
+
+@lru_cache(maxsize=None)
+def tabela_regras(origem=ARQUIVO_REGRAS, caminho=ARQUIVO_COMPILADO):
+    '''
+    Carrega a tabela de regras compilada (uma única vez por processo).
+
+    Retorna:
+    - dict {nome da regra: Regra}
+    '''
+    dados, analises, codigo = _carregar(origem, caminho)
+    funcoes = {}
+    exec(codigo, funcoes)
+    return {nome: Regra(nome, regra, *analises[nome], funcoes[f'_regra_{i}'])
+            for i, (nome, regra) in enumerate(dados.items())}
+
+
+def regra(nome):
+    '''
+    Regra compilada de um avaliador (nome da classe ou da função evaluate_*).
+    '''
+    return tabela_regras()[nome]
+
+
+def _montar_resultado(avaliador, nome, faixa):
+    # ResultadoIND da faixa com os textos do catálogo
+    rotulo = faixa['faixa']
+    return avaliador.gerar_resultado(
+        classificacao=faixa['classificacao'],
+        faixa=rotulo,
+        descricao=texto(nome, 'descricao', rotulo),
+        riscos=texto(nome, 'riscos', rotulo),
+        referencia=texto(nome, 'referencia', rotulo),
+        recomendacao=texto(nome, 'recomendacao', rotulo)
+    )
+
+
+def resultado_regra(avaliador, nome, **valores):
+    '''
+    Classifica os valores pela regra do avaliador e devolve uma cópia do ResultadoIND da faixa, montado
+    com os textos do catálogo na primeira vez e reaproveitado do cache do avaliador nas seguintes.
+
+    Parâmetros:
+    - avaliador: instância da classe avaliadora (fornece gerar_resultado)
+    - nome: nome da regra (o nome da classe)
+    - valores: variáveis usadas nas condições das faixas (ex.: roe=12.5)
+
+    Retorna:
+    - ResultadoIND, ou None quando nenhuma faixa se aplica (ex.: NaN), como nas cadeias if/elif originais
+    '''
+    compilada = tabela_regras()[nome]
+    indice = compilada.classificar(**valores)
+    if indice == SEM_FAIXA:
+        return None
+    return copy.copy(cache_resultados(type(avaliador)).faixa(indice, _montar_resultado, avaliador, nome,
+                                                             compilada.faixas[indice]))
+
+
+def _cortes(compilada):
+    # Pontos de corte da regra de uma variável: 'c]' (c fica na faixa de baixo), '[c' (na de cima)
+    # ou '{c}' (c sozinho numa faixa, ex.: x == 0)
+    cortes = []
+    for limite in compilada.limites:
+        passo = max(abs(limite), 1) * 1e-9
+        abaixo, no_limite, acima = (compilada.indice(limite - passo), compilada.indice(limite),
+                                    compilada.indice(limite + passo))
+        if abaixo != no_limite and no_limite != acima:
+            cortes.append(f'{{{limite:g}}}')
+        elif abaixo != no_limite:
+            cortes.append(f'[{limite:g}')
+        elif no_limite != acima:
+            cortes.append(f'{limite:g}]')
+    return cortes
+
+
+def _pontos(limites):
+    # Valores de teste: cada limite, vizinhos imediatos, pontos entre limites, extremos e NaN
+    pontos = [float('-inf'), limites[0] - 1] if limites else [float('-inf'), 0.0]
+    for i, limite in enumerate(limites):
+        passo = max(abs(limite), 1) * 1e-9
+        pontos += [limite - passo, limite, limite + passo]
+        if i + 1 < len(limites):
+            pontos.append((limite + limites[i + 1]) / 2)
+    pontos += [limites[-1] + 1 if limites else 0.0, float('inf'), float('nan')]
+    return pontos
+
+
+def divergencias(regras=None):
+    '''
+    Compara as faixas de regras que avaliam o mesmo indicador.
+
+    São comparadas: cada função evaluate_* com a classe equivalente (campo 'equivalente' em regras.json)
+    e cada definição sombreada de evaluate_* com a que de fato vale (campo 'sombreada_por').
+
+    Retorna:
+    - list de dict com regra, comparada_com, relacao, cortes de cada lado, cortes exclusivos de cada lado
+      e os valores de teste em que as classificações diferem
+    '''
+    regras = tabela_regras() if regras is None else regras
+    relatorio = []
+    for nome, atual in regras.items():
+        for relacao, campo in (('equivalente', 'equivalente'), ('sombreada', 'sombreada_por')):
+            outra_nome = atual.dados.get(campo)
+            if outra_nome is None:
+                continue
+            outra = regras[outra_nome]
+            # Só regras de uma variável são comparáveis ponto a ponto
+            if len(atual.variaveis) != 1 or len(outra.variaveis) != 1:
+                continue
+            cortes_atual = _cortes(atual)
+            cortes_outra = _cortes(outra)
+            diferentes = []
+            for ponto in _pontos(sorted(set(atual.limites) | set(outra.limites))):
+                faixa_atual = atual.faixa(ponto)
+                faixa_outra = outra.faixa(ponto)
+                classificacao_atual = faixa_atual['classificacao'] if faixa_atual else None
+                classificacao_outra = faixa_outra['classificacao'] if faixa_outra else None
+                if classificacao_atual != classificacao_outra:
+                    diferentes.append((ponto, classificacao_atual, classificacao_outra))
+            relatorio.append({
+                'regra': nome,
+                'comparada_com': outra_nome,
+                'relacao': relacao,
+                'cortes': cortes_atual,
+                'cortes_comparada': cortes_outra,
+                'so_na_regra': [corte for corte in cortes_atual if corte not in cortes_outra],
+                'so_na_comparada': [corte for corte in cortes_outra if corte not in cortes_atual],
+                'classificacoes_diferentes': diferentes,
+            })
+    return relatorio
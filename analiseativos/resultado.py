@@ -0,0 +1,105 @@
+# Resultado comum a todos os avaliadores do pacote
+
+
+# Atributo de texto longo: guarda a referência ao catálogo e só decodifica (e remove espaços nas pontas,
+# se aparar) na leitura
+class _TextoLongo:
+    def __init__(self, aparar=True):
+        self.aparar = aparar
+
+    def __set_name__(self, dono, nome):
+        self.atributo = '_' + nome
+
+    def __get__(self, instancia, dono=None):
+        if instancia is None:
+            return self
+        valor = str(getattr(instancia, self.atributo))
+        return valor.strip() if self.aparar else valor
+
+    def __set__(self, instancia, valor):
+        setattr(instancia, self.atributo, valor)
+
+
+# Define a classe ResultadoIND para armazenar resultados da avaliação P/VP
+
+
+class ResultadoIND:
+    # Textos longos (podem vir do catálogo como TextoCatalogo): decodificados apenas quando lidos
+    descricao = _TextoLongo()
+    definicao = _TextoLongo()
+    riscos = _TextoLongo()
+    referencia_cruzada = _TextoLongo()
+    recomendacao = _TextoLongo()
+
+    # Construtor que inicializa os atributos do resultado da avaliação P/VP
+    def __init__(self, classificacao, faixa, descricao, definicao, agrupador, formula, riscos, referencia_cruzada, recomendacao):
+        # Atribui a classificação (ex.: "Ótimo", "Crítico") à variável de instância
+        self.classificacao = classificacao
+        # Atribui a faixa de P/VP (ex.: "0 <= P/VP <= 0.8") à variável de instância
+        self.faixa = faixa
+        # Atribui a descrição (espaços em branco no início/fim são removidos na leitura)
+        self.descricao = descricao
+        # Atribui a definição do P/VP (espaços em branco removidos na leitura)
+        self.definicao = definicao
+        # Atribui a categoria de agrupamento (ex.: "Valuation")
+        self.agrupador = agrupador
+        # Atribui a fórmula do P/VP
+        self.formula = formula
+        # Atribui os riscos (espaços em branco removidos na leitura)
+        self.riscos = riscos
+        # Atribui as referências cruzadas (espaços em branco removidos na leitura)
+        self.referencia_cruzada = referencia_cruzada
+        # Atribui a recomendação (espaços em branco removidos na leitura)
+        self.recomendacao = recomendacao
+
+    # Cópia rasa barata (usada pelo cache de resultados): os textos longos continuam como referências ao catálogo
+    def __copy__(self):
+        copia = object.__new__(type(self))
+        copia.__dict__.update(self.__dict__)
+        return copia
+
+    # Define a representação em string do objeto para depuração/impressão
+    def __repr__(self):
+        # Retorna string formatada com classificação e faixa
+        return f"<ResultadoIND: {self.classificacao} | Faixa: {self.faixa}>"
+
+    # Converte o objeto em dicionário para serialização
+    def to_dict(self):
+        # Retorna dicionário com todos os atributos da instância
+        return {
+            'classificacao': self.classificacao,
+            'faixa': self.faixa,
+            'descricao': self.descricao,
+            'definicao': self.definicao,
+            'agrupador': self.agrupador,
+            'formula': self.formula,
+            'riscos': self.riscos,
+            'referencia_cruzada': self.referencia_cruzada,
+            'recomendacao': self.recomendacao
+        }
+
+
+# Exibe os atributos de um ResultadoIND formatados
+def exibir_resultado(resultado):
+    # Imprime cabeçalho do resultado da avaliação
+    print("📊 Resultado da Avaliação P/VP")
+    # Imprime a classificação
+    print(f"Classificação: {resultado.classificacao}")
+    # Imprime a faixa de P/VP
+    print(f"Faixa: {resultado.faixa}")
+    # Imprime a descrição
+    print(f"Descrição: {resultado.descricao}")
+    # Imprime a definição do P/VP
+    print(f"Definição: {resultado.definicao}")
+    # Imprime a categoria de agrupamento
+    print(f"Agrupador: {resultado.agrupador}")
+    # Imprime a fórmula
+    print(f"Fórmula: {resultado.formula}")
+    # Imprime os riscos
+    print(f"Riscos: {resultado.riscos}")
+    # Imprime as referências cruzadas
+    print(f"Referência Cruzada: {resultado.referencia_cruzada}")
+    # Imprime a recomendação
+    print(f"Recomendação: {resultado.recomendacao}")
+    # Imprime linha separadora
+    print("-" * 60)
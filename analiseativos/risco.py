@@ -0,0 +1,124 @@
+# Avaliadores do agrupador Risco
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe BetaEvaluator para avaliar o indicador Índice Beta
+class BetaEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Beta
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Beta
+        self.definicao = texto('BetaEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Risco"
+        self.agrupador = 'Risco'
+        # Define a fórmula do Beta
+        self.formula = '''
+        Beta = Cov(Rₐ, Rₘ) / Var(Rₘ)
+        Onde:
+        - Rₐ = Retornos da ação
+        - Rₘ = Retornos do mercado
+        - Cov(Rₐ, Rₘ) = Covariância entre os retornos da ação e do mercado
+        - Var(Rₘ) = Variância dos retornos do mercado
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula o Beta com base nos retornos da ação e do mercado
+    def calcular_beta(self, retornos_acao, retornos_mercado):
+        try:
+            # Verifica se as entradas são listas ou tuplas numéricas com o mesmo tamanho
+            if not isinstance(retornos_acao, (list, tuple)) or not isinstance(retornos_mercado, (list, tuple)):
+                raise ValueError("Retornos da ação e do mercado devem ser listas ou tuplas.")
+            if len(retornos_acao) != len(retornos_mercado):
+                raise ValueError("Retornos da ação e do mercado devem ter o mesmo tamanho.")
+            if len(retornos_acao) < 2:
+                raise ValueError("É necessário pelo menos dois períodos de retornos para calcular o Beta.")
+            # Converte retornos para float
+            retornos_acao = [converter_numero(r, "Os retornos da ação devem ser numéricos.") for r in retornos_acao]
+            retornos_mercado = [converter_numero(r, "Os retornos do mercado devem ser numéricos.") for r in retornos_mercado]
+            # Calcula a média dos retornos
+            media_acao = sum(retornos_acao) / len(retornos_acao)
+            media_mercado = sum(retornos_mercado) / len(retornos_mercado)
+            # Calcula a covariância entre retornos da ação e do mercado
+            covariancia = sum((r_a - media_acao) * (r_m - media_mercado) for r_a, r_m in zip(retornos_acao, retornos_mercado)) / (len(retornos_acao) - 1)
+            # Calcula a variância dos retornos do mercado
+            variancia_mercado = sum((r_m - media_mercado) ** 2 for r_m in retornos_mercado) / (len(retornos_mercado) - 1)
+            if variancia_mercado == 0:
+                raise ValueError("A variância dos retornos do mercado não pode ser zero.")
+            # Calcula o Beta
+            beta = covariancia / variancia_mercado
+            return beta
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o Beta: {str(e)}")
+
+    # Avalia o valor do Beta e retorna um objeto ResultadoIND
+    def avaliar(self, retornos_acao, retornos_mercado):
+        # Tenta processar o cálculo do Beta e a avaliação
+        try:
+            # Calcula o Beta
+            beta = self.calcular_beta(retornos_acao, retornos_mercado)
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'BetaEvaluator', beta=beta)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Beta: {mensagem}.
+                Verifique os dados de entrada (retornos da ação e do mercado) e assegure que sejam numéricos válidos e com tamanho suficiente.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
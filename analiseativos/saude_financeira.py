@@ -0,0 +1,183 @@
+# Avaliadores do agrupador Saúde Financeira
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe AtivosEvaluator para avaliar o indicador Ativos Totais
+class AtivosEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição dos Ativos Totais
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Ativos Totais
+        self.definicao = texto('AtivosEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Saúde Financeira"
+        self.agrupador = 'Saúde Financeira'
+        # Define a fórmula dos Ativos Totais
+        self.formula = 'Ativos Totais = Ativo Circulante + Ativo Não Circulante'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor dos Ativos Totais em relação à Receita Líquida e retorna um objeto ResultadoIND
+    def avaliar(self, ativos_totais, receita_liquida):
+        # Tenta processar o valor dos Ativos Totais e Receita Líquida
+        try:
+            # Converte Ativos Totais e Receita Líquida para float
+            ativos_totais = converter_numero(ativos_totais, "O valor de Ativos Totais deve ser numérico.")
+            receita_liquida = converter_numero(receita_liquida, "O valor de Receita Líquida deve ser numérico.")
+            # Calcula a proporção dos Ativos Totais em relação à Receita Líquida
+            if receita_liquida == 0:
+                raise ValueError("A Receita Líquida não pode ser zero para calcular a proporção.")
+            proporcao_ativos_receita = ativos_totais / receita_liquida
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'AtivosEvaluator', ativos_totais=ativos_totais, proporcao_ativos_receita=proporcao_ativos_receita)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar os Ativos Totais: {mensagem}.
+                Verifique os dados de entrada (Ativos Totais e Receita Líquida) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PatrimonioLiquidoEvaluator para avaliar o indicador Patrimônio Líquido
+class PatrimonioLiquidoEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Patrimônio Líquido
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Patrimônio Líquido
+        self.definicao = texto('PatrimonioLiquidoEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Saúde Financeira"
+        self.agrupador = 'Saúde Financeira'
+        # Define a fórmula do Patrimônio Líquido
+        self.formula = 'Patrimônio Líquido = Ativos Totais - Passivos Totais'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do Patrimônio Líquido e retorna um objeto ResultadoIND
+    def avaliar(self, patrimonio_liquido, ativos_totais=None):
+        # Tenta processar o valor do Patrimônio Líquido e Ativos Totais
+        try:
+            # Converte Patrimônio Líquido e Ativos Totais para float
+            patrimonio_liquido = converter_numero(patrimonio_liquido, "O valor de Patrimônio Líquido deve ser numérico.")
+            ativos_totais = converter_numero(ativos_totais, "O valor de Ativos Totais deve ser numérico.")
+            # Calcula a proporção do Patrimônio Líquido em relação aos Ativos Totais
+            if ativos_totais == 0:
+                raise ValueError("Os Ativos Totais não podem ser zero para calcular a proporção.")
+            #proporcao_pl_ativos = patrimonio_liquido / ativos_totais
+            proporcao_pl_ativos = patrimonio_liquido
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PatrimonioLiquidoEvaluator', proporcao_pl_ativos=proporcao_pl_ativos)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Patrimônio Líquido: {mensagem}.
+                Verifique os dados de entrada (Patrimônio Líquido e Ativos Totais) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
@@ -0,0 +1,1201 @@
+# Avaliadores do agrupador Valuation
+# Importa o núcleo de desconto compartilhado com fluxodecaixagrok3/fluxodecaixagrok3brasil
+from descontos import fluxo_caixa_livre, valor_fcd, valor_fcd_crescimento_constante
+from .cache import resultado_erro
+from .catalogo import TextoCatalogo, texto
+from .numeros import converter_numero
+from .regras import resultado_regra
+from .resultado import ResultadoIND, _TextoLongo
+
+
+# Define a classe FCDEvaluator para avaliar o indicador Fluxo de Caixa Descontado
+class FCDEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do FCD
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice Fluxo de Caixa Descontado
+        self.definicao = texto('FCDEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do FCD
+        self.formula = '''
+        FCD = Σ [FCFFₜ / (1 + WACC)ᵗ] + Valor Terminal / (1 + WACC)ⁿ
+        Onde:
+        - FCFFₜ = Fluxo de Caixa Livre para a Firma no ano t
+        - WACC = Custo Médio Ponderado de Capital
+        - Valor Terminal = FCFFₙ₊₁ / (WACC - g), onde g é a taxa de crescimento perpétuo
+        - n = número de anos no período explícito
+        FCFF = EBIT × (1 - Taxa de Imposto) + Depreciação e Amortização - Variação no Capital de Giro - CAPEX
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Calcula o Fluxo de Caixa Livre para a Firma (FCFF) para um único ano
+    def calcular_fcff(self, ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex):
+        try:
+            # Converte parâmetros para float
+            ebit = converter_numero(ebit, "O valor de EBIT deve ser numérico.")
+            taxa_imposto = converter_numero(taxa_imposto, "O valor de Taxa de Imposto deve ser numérico.")
+            depreciacao_amortizacao = converter_numero(depreciacao_amortizacao, "O valor de Depreciação e Amortização deve ser numérico.")
+            variacao_capital_giro = converter_numero(variacao_capital_giro, "O valor de Variação no Capital de Giro deve ser numérico.")
+            capex = converter_numero(capex, "O valor de CAPEX deve ser numérico.")
+            # Calcula o FCFF pelo núcleo compartilhado
+            fcff = fluxo_caixa_livre(ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex)
+            return fcff
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o FCFF: {str(e)}")
+
+    # Calcula o Fluxo de Caixa Descontado (FCD)
+    def calcular_fcd(self, fcffs_projetados, wacc, taxa_crescimento_perpetuo, anos_projetados):
+        try:
+            # Verifica se as entradas são válidas
+            if not isinstance(fcffs_projetados, (list, tuple)) or len(fcffs_projetados) != anos_projetados:
+                raise ValueError("fcffs_projetados deve ser uma lista com tamanho igual a anos_projetados.")
+            # Converte parâmetros para float
+            fcffs_projetados = [converter_numero(fcff, "Cada FCFF projetado deve ser numérico.") for fcff in fcffs_projetados]
+            wacc = converter_numero(wacc, "O WACC deve ser numérico.")
+            taxa_crescimento_perpetuo = converter_numero(taxa_crescimento_perpetuo, "A taxa de crescimento perpétuo deve ser numérica.")
+            if not isinstance(anos_projetados, int) or anos_projetados <= 0:
+                raise ValueError("anos_projetados deve ser um inteiro positivo.")
+            # Verifica se WACC > taxa de crescimento perpétuo
+            if wacc <= taxa_crescimento_perpetuo:
+                raise ValueError("O WACC deve ser maior que a taxa de crescimento perpétuo para calcular o valor terminal.")
+            # Calcula o valor presente dos FCFFs projetados e do valor terminal (perpetuidade)
+            # com o vetor de fatores de desconto em cache para este WACC
+            valor_presente_fcffs, valor_terminal, valor_terminal_presente = valor_fcd(
+                fcffs_projetados, wacc, taxa_crescimento_perpetuo)
+            # Calcula o FCD total
+            fcd = valor_presente_fcffs + valor_terminal_presente
+            return fcd
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o FCD: {str(e)}")
+
+    # Calcula o FCD de fluxos com crescimento constante (FCFF₀ × (1 + g)ᵗ) pela forma fechada, sem projetar os fluxos
+    def calcular_fcd_crescimento_constante(self, fcff_atual, crescimento, wacc, taxa_crescimento_perpetuo, anos_projetados):
+        try:
+            # Converte parâmetros para float
+            fcff_atual = converter_numero(fcff_atual, "O FCFF atual deve ser numérico.")
+            crescimento = converter_numero(crescimento, "A taxa de crescimento deve ser numérica.")
+            wacc = converter_numero(wacc, "O WACC deve ser numérico.")
+            taxa_crescimento_perpetuo = converter_numero(taxa_crescimento_perpetuo, "A taxa de crescimento perpétuo deve ser numérica.")
+            if not isinstance(anos_projetados, int) or anos_projetados <= 0:
+                raise ValueError("anos_projetados deve ser um inteiro positivo.")
+            # Verifica se WACC > taxa de crescimento perpétuo
+            if wacc <= taxa_crescimento_perpetuo:
+                raise ValueError("O WACC deve ser maior que a taxa de crescimento perpétuo para calcular o valor terminal.")
+            # Valor presente dos fluxos explícitos pela série geométrica e do valor terminal (perpetuidade)
+            valor_presente_fcffs, valor_terminal, valor_terminal_presente = valor_fcd_crescimento_constante(
+                fcff_atual, crescimento, wacc, taxa_crescimento_perpetuo, anos_projetados)
+            # Calcula o FCD total
+            return valor_presente_fcffs + valor_terminal_presente
+        except Exception as e:
+            raise ValueError(f"Erro ao calcular o FCD: {str(e)}")
+
+    # Avalia o FCD em relação ao valor de mercado (Enterprise Value) e retorna um objeto ResultadoIND
+    def avaliar(self, fcffs_projetados, wacc, taxa_crescimento_perpetuo, anos_projetados, enterprise_value):
+        # Tenta processar o cálculo do FCD
+        try:
+            # Converte Enterprise Value para float
+            enterprise_value = converter_numero(enterprise_value, "O valor do Enterprise Value deve ser numérico.")
+            # Calcula o FCD
+            fcd = self.calcular_fcd(fcffs_projetados, wacc, taxa_crescimento_perpetuo, anos_projetados)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+        # Classifica o FCD calculado em relação ao Enterprise Value
+        return self.avaliar_fcd(fcd, enterprise_value)
+
+    # Avalia um FCD já calculado (ex.: pelo motor de cenários) em relação ao Enterprise Value e retorna um objeto ResultadoIND
+    def avaliar_fcd(self, fcd, enterprise_value):
+        # Tenta processar a avaliação do FCD
+        try:
+            # Converte parâmetros para float
+            fcd = converter_numero(fcd, "O valor do FCD deve ser numérico.")
+            enterprise_value = converter_numero(enterprise_value, "O valor do Enterprise Value deve ser numérico.")
+            # Calcula a proporção FCD/EV
+            if enterprise_value == 0:
+                raise ValueError("O Enterprise Value não pode ser zero para calcular a proporção FCD/EV.")
+            proporcao_fcd_ev = fcd / enterprise_value
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'FCDEvaluator', fcd=fcd, proporcao_fcd_ev=proporcao_fcd_ev)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Fluxo de Caixa Descontado: {mensagem}.
+                Verifique os dados de entrada (FCFFs projetados, WACC, taxa de crescimento perpétuo, anos projetados, Enterprise Value) e assegure que sejam válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe CrescimentoImplicitoEvaluator para avaliar o crescimento implícito no preço (FCD reverso)
+class CrescimentoImplicitoEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e descrição do Crescimento Implícito
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o Crescimento Implícito
+        self.definicao = texto('CrescimentoImplicitoEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do Crescimento Implícito
+        self.formula = '''
+        Crescimento Implícito = g tal que EV = Σ [FCF₀ × (1 + g)ᵗ / (1 + WACC)ᵗ] + Valor Terminal / (1 + WACC)ⁿ
+        Onde:
+        - EV = Valor de mercado da firma (Valor de Mercado + Dívida Líquida)
+        - FCF₀ = Fluxo de Caixa Livre atual
+        - Valor Terminal = FCF₀ × (1 + g)ⁿ × (1 + gₜ) / (WACC - gₜ), onde gₜ é a taxa de crescimento perpétuo
+        - n = número de anos no período explícito
+        '''
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Valida o Crescimento Implícito retornado pelo FCD reverso
+    def validar_crescimento_implicito(self, crescimento_implicito):
+        try:
+            # Converte para float
+            crescimento_implicito = converter_numero(crescimento_implicito, "O valor do Crescimento Implícito deve ser numérico.")
+            # Verifica se o resolvedor convergiu (NaN indica ausência de solução no intervalo)
+            if crescimento_implicito != crescimento_implicito:
+                raise ValueError("O FCD reverso não convergiu para um Crescimento Implícito válido.")
+            return crescimento_implicito
+        except Exception as e:
+            raise ValueError(f"Erro ao validar o Crescimento Implícito: {str(e)}")
+
+    # Avalia o Crescimento Implícito e retorna um objeto ResultadoIND
+    def avaliar(self, crescimento_implicito):
+        # Tenta processar a avaliação do Crescimento Implícito
+        try:
+            # Valida o Crescimento Implícito
+            crescimento_implicito = self.validar_crescimento_implicito(crescimento_implicito)
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'CrescimentoImplicitoEvaluator', crescimento_implicito=crescimento_implicito)
+        # Captura exceções para entradas inválidas (ex.: não numéricas ou sem convergência)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o Crescimento Implícito: {mensagem}.
+                Verifique os dados de entrada do FCD reverso (FCF atual, valor de mercado, WACC, taxa de crescimento perpétuo) e assegure que sejam válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PAtivoCirculanteLiquidoEvaluator para avaliar o indicador Preço sobre Ativo Circulante Líquido
+class PAtivoCirculanteLiquidoEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do P/Ativo Circulante Líquido
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice P/Ativo Circulante Líquido
+        self.definicao = texto('PAtivoCirculanteLiquidoEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do P/Ativo Circulante Líquido
+        self.formula = 'P/Ativo Circulante Líquido = Valor de Mercado / (Ativo Circulante - Passivo Circulante)'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do P/Ativo Circulante Líquido e retorna um objeto ResultadoIND
+    def avaliar(self, p_ativo_circulante_liquido):
+        # Tenta processar o valor do P/Ativo Circulante Líquido
+        try:
+            # Converte o P/Ativo Circulante Líquido para float para garantir que é numérico
+            p_ativo_circulante_liquido = converter_numero(p_ativo_circulante_liquido, "O valor do P/Ativo Circulante Líquido deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PAtivoCirculanteLiquidoEvaluator', p_ativo_circulante_liquido=p_ativo_circulante_liquido)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o P/Ativo Circulante Líquido: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PCapitalGiroEvaluator para avaliar o indicador Preço sobre Capital de Giro
+class PCapitalGiroEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do P/Capital de Giro
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice P/Capital de Giro
+        self.definicao = texto('PCapitalGiroEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do P/Capital de Giro
+        self.formula = 'P/Capital de Giro = Valor de Mercado / (Ativo Circulante - Passivo Circulante)'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do P/Capital de Giro e retorna um objeto ResultadoIND
+    def avaliar(self, p_capital_giro):
+        # Tenta processar o valor do P/Capital de Giro
+        try:
+            # Converte o P/Capital de Giro para float para garantir que é numérico
+            p_capital_giro = converter_numero(p_capital_giro, "O valor do P/Capital de Giro deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PCapitalGiroEvaluator', p_capital_giro=p_capital_giro)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o P/Capital de Giro: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PSREvaluator para avaliar o indicador Preço sobre Vendas (PSR)
+class PSREvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do PSR
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice PSR
+        self.definicao = texto('PSREvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do PSR
+        self.formula = 'PSR = Valor de Mercado / Receita Líquida'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do PSR e retorna um objeto ResultadoIND
+    def avaliar(self, psr):
+        # Tenta processar o valor do PSR
+        try:
+            # Converte o PSR para float para garantir que é numérico
+            psr = converter_numero(psr, "O valor do PSR deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PSREvaluator', psr=psr)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o PSR: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe VPAEvaluator para avaliar o indicador Valor Patrimonial por Ação (VPA)
+class VPAEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do VPA
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice VPA
+        self.definicao = texto('VPAEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do VPA
+        self.formula = 'VPA = Patrimônio Líquido / Número Total de Ações'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do VPA em relação ao preço da ação (P/VPA) e retorna um objeto ResultadoIND
+    def avaliar(self, vpa, preco_acao=None):
+        # Tenta processar o valor do VPA e preço da ação
+        try:
+            # Converte VPA e preço da ação para float (o preço continua obrigatório, embora só o VPA seja classificado)
+            #vpa = float(vpa)
+            p_vpa = converter_numero(vpa, "O valor de VPA deve ser numérico.")
+            converter_numero(preco_acao, "O valor de preço da ação deve ser numérico.")
+            #preco_acao = float(preco_acao)
+            # Calcula o P/VPA (Preço / Valor Patrimonial por Ação)
+            #if vpa == 0:
+            #    raise ValueError("O VPA não pode ser zero para calcular P/VPA.")
+            #p_vpa = preco_acao / vpa
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'VPAEvaluator', p_vpa=p_vpa)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o VPA: {mensagem}.
+                Verifique os dados de entrada (VPA e preço da ação) e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PLEvaluator para avaliar o indicador Preço sobre Lucro (P/L)
+class PLEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do P/L
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice P/L
+        self.definicao = texto('PLEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do P/L
+        self.formula = 'P/L = Valor de Mercado / Lucro Líquido'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor do P/L e retorna um objeto ResultadoIND
+    def avaliar(self, p_l):
+        # Tenta processar o valor do P/L
+        try:
+            # Converte o P/L para float para garantir que é numérico
+            p_l = converter_numero(p_l, "O valor do P/L deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PLEvaluator', p_l=p_l)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o P/L: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PEBITDAEvaluator para avaliar o indicador P/EBITDA
+class PEBITDAEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do P/EBITDA
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice P/EBITDA
+        self.definicao = texto('PEBITDAEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do P/EBITDA
+        self.formula = 'P/EBITDA = Valor de Mercado / EBITDA'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor P/EBITDA e retorna um objeto ResultadoIND
+    def avaliar(self, p_ebitda):
+        # Tenta processar o valor P/EBITDA
+        try:
+            # Converte o P/EBITDA para float para garantir que é numérico
+            p_ebitda = converter_numero(p_ebitda, "O valor de P/EBITDA deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PEBITDAEvaluator', p_ebitda=p_ebitda)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o P/EBITDA: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PEBITEvaluator para avaliar o indicador P/EBIT
+class PEBITEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do P/EBIT
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice P/EBIT
+        self.definicao = texto('PEBITEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do P/EBIT
+        self.formula = 'P/EBIT = Valor de Mercado / EBIT'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor P/EBIT e retorna um objeto ResultadoIND
+    def avaliar(self, p_ebit):
+        # Tenta processar o valor P/EBIT
+        try:
+            # Converte o P/EBIT para float para garantir que é numérico
+            p_ebit = converter_numero(p_ebit, "O valor de P/EBIT deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PEBITEvaluator', p_ebit=p_ebit)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o P/EBIT: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PAtivoEvaluator para avaliar o indicador P/Ativo
+class PAtivoEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do P/Ativo
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice P/Ativo
+        self.definicao = texto('PAtivoEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do P/Ativo
+        self.formula = 'P/Ativo = Valor de Mercado / Ativos Totais'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor P/Ativo e retorna um objeto ResultadoIND
+    def avaliar(self, p_ativo):
+        # Tenta processar o valor P/Ativo
+        try:
+            # Converte o P/Ativo para float para garantir que é numérico
+            p_ativo = converter_numero(p_ativo, "O valor de P/Ativo deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PAtivoEvaluator', p_ativo=p_ativo)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o P/Ativo: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe EVEBITDAEvaluator para avaliar o indicador EV/EBITDA
+class EVEBITDAEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do EV/EBITDA
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice EV/EBITDA
+        self.definicao = texto('EVEBITDAEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do EV/EBITDA
+        self.formula = 'EV/EBITDA = Enterprise Value / EBITDA'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor EV/EBITDA e retorna um objeto ResultadoIND
+    def avaliar(self, ev_ebitda):
+        # Tenta processar o valor EV/EBITDA
+        try:
+            # Converte o EV/EBITDA para float para garantir que é numérico
+            ev_ebitda = converter_numero(ev_ebitda, "O valor de EV/EBITDA deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'EVEBITDAEvaluator', ev_ebitda=ev_ebitda)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o EV/EBITDA: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe EVEBITEvaluator para avaliar o indicador EV/EBIT
+class EVEBITEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do EV/EBIT
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice EV/EBIT
+        self.definicao = texto('EVEBITEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do EV/EBIT
+        self.formula = 'EV/EBIT = Enterprise Value / EBIT'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor EV/EBIT e retorna um objeto ResultadoIND
+    def avaliar(self, ev_ebit):
+        # Tenta processar o valor EV/EBIT
+        try:
+            # Converte o EV/EBIT para float para garantir que é numérico
+            ev_ebit = converter_numero(ev_ebit, "O valor de EV/EBIT deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'EVEBITEvaluator', ev_ebit=ev_ebit)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o EV/EBIT: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
+
+
+# Define a classe PVPEvaluator para avaliar índices P/VP
+class PVPEvaluator:
+    # Definição lida do catálogo como str; a instância guarda só a referência (TextoCatalogo)
+    definicao = _TextoLongo(aparar=False)
+
+    # Construtor que inicializa definição, agrupador e fórmula do P/VP
+    def __init__(self):
+        # Referência ao texto do catálogo explicando o índice P/VP
+        self.definicao = texto('PVPEvaluator', 'definicao')
+        # Define a categoria de agrupamento como "Valuation"
+        self.agrupador = 'Valuation'
+        # Define a fórmula do P/VP
+        self.formula = 'P/VP = Preço da Ação / Valor Patrimonial por Ação'
+
+    # Decorator para validar que os parâmetros são strings não vazias
+    def validar_strings(funcao):
+        def wrapper(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+            # Verifica se cada parâmetro é uma string não vazia
+            for param, nome in [
+                (classificacao, "classificacao"),
+                (faixa, "faixa"),
+                (descricao, "descricao"),
+                (riscos, "riscos"),
+                (referencia, "referencia"),
+                (recomendacao, "recomendacao")
+            ]:
+                # Textos do catálogo foram validados na compilação do catálogo e só são decodificados sob demanda
+                if isinstance(param, TextoCatalogo):
+                    continue
+                if not isinstance(param, str) or not param.strip():
+                    raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+            # Chama a função original com os parâmetros validados
+            return funcao(self, classificacao, faixa, descricao, riscos, referencia, recomendacao)
+        return wrapper
+
+    # Avalia o valor P/VP e retorna um objeto ResultadoIND
+    def avaliar(self, p_vp):
+        # Tenta processar o valor P/VP
+        try:
+            # Converte o P/VP para float para garantir que é numérico
+            p_vp = converter_numero(p_vp, "O valor de P/VP deve ser numérico.")
+            # Classifica pela tabela de regras (regras.json) e monta o resultado com os textos do catálogo
+            return resultado_regra(self, 'PVPEvaluator', p_vp=p_vp)
+        # Captura exceções para entradas inválidas (ex.: não numéricas)
+        except Exception as e:
+            # Retorna o ResultadoIND de erro (reaproveitado do cache por tipo e mensagem da exceção)
+            return resultado_erro(self, e)
+
+    # Cria objeto ResultadoIND com os parâmetros fornecidos
+    @validar_strings
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        # Instancia e retorna ResultadoIND com atributos da instância
+        return ResultadoIND(
+            classificacao=classificacao,
+            faixa=faixa,
+            descricao=descricao,
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos=riscos,
+            referencia_cruzada=referencia,
+            recomendacao=recomendacao
+        )
+
+    # Trata erros criando um ResultadoIND de erro
+    def _erro(self, mensagem):
+        # Retorna ResultadoIND com detalhes de erro
+        return ResultadoIND(
+            classificacao='Erro',
+            faixa='N/A',
+            descricao=f'''
+                Ocorreu um erro ao processar o P/VP: {mensagem}.
+                Verifique os dados de entrada e assegure que sejam numéricos válidos.
+            ''',
+            definicao=self.definicao,
+            agrupador=self.agrupador,
+            formula=self.formula,
+            riscos='N/A',
+            referencia_cruzada='N/A',
+            recomendacao='N/A'
+        )
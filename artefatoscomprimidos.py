@@ -0,0 +1,333 @@
+# Irmãos pré-comprimidos (.gz e .br) dos relatórios gerados e ZIP de distribuição sem recompressão.
+# Razão: as páginas e dados gerados (site_indicadores, modals_compartilhados...) e os ZIPs distribuídos
+# (statusinvest_html_*exemplos.zip etc.) eram comprimidos do zero a cada geração, inclusive os arquivos
+# que não mudaram. Aqui cada artefato ganha irmãos .gz (e .br, quando o pacote brotli está instalado)
+# gravados uma vez: um manifesto no diretório guarda o hash do conteúdo de cada artefato e, enquanto o
+# hash não muda, os irmãos existentes são reaproveitados (tamanho e data iguais dispensam até a leitura
+# do arquivo). O ZIP de distribuição não recomprime nada: o fluxo deflate do irmão .gz vai direto para a
+# entrada do ZIP (o método de compressão é o mesmo, deflate), e arquivos sem irmão entram armazenados.
+import gzip
+import hashlib
+import json
+import os
+import struct
+import time
+import warnings
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    # Sem o pacote brotli só os irmãos .gz são gravados
+    brotli = None
+
+
+# Manifesto gravado em cada diretório comprimido (não é artefato nem entra no ZIP)
+ARQUIVO_MANIFESTO = ".compressao.json"
+# Artefatos de texto que ganham irmãos comprimidos
+EXTENSOES = (".html", ".js", ".css", ".json", ".csv", ".svg", ".txt", ".xml")
+# Arquivos menores do que isso não compensam a compressão
+MINIMO_BYTES = 256
+# Níveis máximos: a compressão é feita uma vez e servida muitas
+NIVEL_GZIP = 9
+QUALIDADE_BROTLI = 11
+
+
+def formatos_disponiveis():
+    '''
+    Formatos de irmão que podem ser gravados neste ambiente.
+
+    Retorna:
+    - tuple com 'gz' e, se o pacote brotli estiver instalado, 'br'
+    '''
+    return ('gz', 'br') if brotli is not None else ('gz',)
+
+
+def _comprimir(dados, formato):
+    # gzip com mtime fixo: o mesmo conteúdo produz sempre os mesmos bytes
+    if formato == 'gz':
+        return gzip.compress(dados, compresslevel=NIVEL_GZIP, mtime=0)
+    return brotli.compress(dados, quality=QUALIDADE_BROTLI)
+
+
+def _artefatos(diretorio, extensoes):
+    # Caminhos relativos (com '/') de todos os artefatos do diretório, em ordem
+    for raiz, pastas, arquivos in os.walk(diretorio):
+        pastas.sort()
+        for nome in sorted(arquivos):
+            if nome != ARQUIVO_MANIFESTO and nome.endswith(extensoes):
+                yield os.path.relpath(os.path.join(raiz, nome), diretorio).replace(os.sep, '/')
+
+
+def comprimir_artefatos(diretorio, extensoes=EXTENSOES, formatos=None):
+    '''
+    Grava (ou reaproveita) os irmãos comprimidos de todos os artefatos do diretório.
+
+    Parâmetros:
+    - diretorio: diretório com os artefatos gerados (percorrido com os subdiretórios)
+    - extensoes: extensões dos artefatos que ganham irmãos
+    - formatos: formatos dos irmãos ('gz', 'br'); por padrão, formatos_disponiveis() (sem o pacote
+      brotli, com um aviso de que nenhum irmão .br foi gravado)
+
+    Retorna:
+    - dict com arquivos, comprimidos, reaproveitados, removidos, bytes (originais), bytes de cada
+      formato (bytes_gz, bytes_br) e segundos
+    '''
+    inicio = time.perf_counter()
+    if not formatos and brotli is None:
+        # O servidor prefere br quando o navegador aceita: sem o pacote, só gzip chega ao navegador
+        warnings.warn(f"pacote brotli não instalado: nenhum irmão .br gravado em {diretorio} "
+                      "(pip install brotli)", stacklevel=2)
+    formatos = tuple(formatos or formatos_disponiveis())
+    caminho_manifesto = os.path.join(diretorio, ARQUIVO_MANIFESTO)
+    anterior = {}
+    if os.path.exists(caminho_manifesto):
+        with open(caminho_manifesto, encoding="utf-8") as f:
+            anterior = json.load(f)
+    manifesto = {}
+    resumo = {'arquivos': 0, 'comprimidos': 0, 'reaproveitados': 0, 'removidos': 0, 'bytes': 0}
+    resumo.update({f'bytes_{formato}': 0 for formato in formatos})
+    for relativo in _artefatos(diretorio, extensoes):
+        caminho = os.path.join(diretorio, relativo)
+        estado = os.stat(caminho)
+        entrada = anterior.get(relativo)
+        resumo['arquivos'] += 1
+        resumo['bytes'] += estado.st_size
+        irmaos_existem = entrada is not None and all(os.path.exists(f"{caminho}.{formato}")
+                                                     for formato in entrada['formatos'])
+        # Tamanho e data iguais: o conteúdo não foi regravado, nem é preciso ler o arquivo
+        if (irmaos_existem and entrada['tamanho'] == estado.st_size and entrada['mtime_ns'] == estado.st_mtime_ns
+                and set(formatos) <= set(entrada['verificados'])):
+            manifesto[relativo] = entrada
+            resumo['reaproveitados'] += 1
+        else:
+            with open(caminho, "rb") as f:
+                dados = f.read()
+            codigo = hashlib.sha256(dados).hexdigest()
+            if irmaos_existem and entrada['hash'] == codigo and set(formatos) <= set(entrada['verificados']):
+                # Regravado com o mesmo conteúdo (ex.: geração completa): os irmãos continuam valendo
+                resumo['reaproveitados'] += 1
+                gravados = entrada['formatos']
+            else:
+                resumo['comprimidos'] += 1
+                gravados = []
+                for formato in formatos:
+                    irmao = f"{caminho}.{formato}"
+                    comprimido = _comprimir(dados, formato) if len(dados) >= MINIMO_BYTES else None
+                    # Irmão só quando fica menor do que o original
+                    if comprimido is not None and len(comprimido) < len(dados):
+                        with open(irmao, "wb") as f:
+                            f.write(comprimido)
+                        gravados.append(formato)
+                    elif os.path.exists(irmao):
+                        os.remove(irmao)
+            manifesto[relativo] = {'hash': codigo, 'tamanho': estado.st_size, 'mtime_ns': estado.st_mtime_ns,
+                                   'formatos': gravados, 'verificados': list(formatos)}
+        for formato in manifesto[relativo]['formatos']:
+            resumo[f'bytes_{formato}'] = resumo.get(f'bytes_{formato}', 0) + os.path.getsize(f"{caminho}.{formato}")
+    # Irmãos de artefatos que deixaram de existir
+    for relativo, entrada in anterior.items():
+        if relativo not in manifesto:
+            for formato in entrada['formatos']:
+                irmao = os.path.join(diretorio, f"{relativo}.{formato}")
+                if os.path.exists(irmao):
+                    os.remove(irmao)
+            resumo['removidos'] += 1
+    temporario = caminho_manifesto + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(manifesto, f, sort_keys=True)
+    os.replace(temporario, caminho_manifesto)
+    resumo['segundos'] = time.perf_counter() - inicio
+    return resumo
+
+
+# Manifestos já lidos: caminho -> (data do manifesto, conteúdo)
+_manifestos = {}
+
+
+def _manifesto(caminho):
+    # Conteúdo do manifesto (relido só quando a data muda), ou None se não existe
+    try:
+        estado = os.stat(caminho)
+    except FileNotFoundError:
+        return None
+    guardado = _manifestos.get(caminho)
+    if guardado is None or guardado[0] != estado.st_mtime_ns:
+        with open(caminho, encoding="utf-8") as f:
+            guardado = _manifestos[caminho] = (estado.st_mtime_ns, json.load(f))
+    return guardado[1]
+
+
+def irmao_atual(caminho, formato, limite=None):
+    '''
+    Irmão comprimido de um artefato, só se estiver em dia: o manifesto mais próximo acima do artefato que
+    o registra precisa ter o tamanho e a data atuais do artefato e o formato entre os irmãos gravados.
+    Artefato regravado depois da última compressão (ou nunca comprimido) não tem irmão válido.
+
+    Parâmetros:
+    - caminho: caminho do artefato
+    - formato: 'gz' ou 'br'
+    - limite: diretório acima do qual não se procura manifesto (padrão: até a raiz)
+
+    Retorna:
+    - str com o caminho do irmão, ou None
+    '''
+    caminho = os.path.abspath(caminho)
+    estado = os.stat(caminho)
+    irmao = f"{caminho}.{formato}"
+    limite = os.path.abspath(limite) if limite is not None else None
+    diretorio = os.path.dirname(caminho)
+    while True:
+        manifesto = _manifesto(os.path.join(diretorio, ARQUIVO_MANIFESTO))
+        entrada = manifesto.get(os.path.relpath(caminho, diretorio).replace(os.sep, '/')) if manifesto else None
+        if entrada is not None:
+            atual = (entrada['tamanho'] == estado.st_size and entrada['mtime_ns'] == estado.st_mtime_ns
+                     and formato in entrada['formatos'] and os.path.exists(irmao))
+            return irmao if atual else None
+        pai = os.path.dirname(diretorio)
+        if diretorio == limite or pai == diretorio:
+            return None
+        diretorio = pai
+
+
+def _partes_gzip(dados):
+    # Fluxo deflate, CRC-32 e tamanho original de um arquivo gzip de um único membro (RFC 1952)
+    if dados[:3] != b'\x1f\x8b\x08':
+        raise ValueError("Arquivo gzip inválido.")
+    flags = dados[3]
+    posicao = 10
+    if flags & 4:
+        # FEXTRA
+        posicao += 2 + struct.unpack_from('<H', dados, posicao)[0]
+    for flag in (8, 16):
+        # FNAME e FCOMMENT terminam em byte zero
+        if flags & flag:
+            posicao = dados.index(b'\0', posicao) + 1
+    if flags & 2:
+        # FHCRC
+        posicao += 2
+    crc, tamanho = struct.unpack_from('<II', dados, len(dados) - 8)
+    return dados[posicao:-8], crc, tamanho
+
+
+# Data e hora DOS fixas (1980-01-01 00:00) em todas as entradas: o mesmo conteúdo gera o mesmo ZIP
+_HORA_DOS, _DATA_DOS = 0, (1 << 5) | 1
+
+
+def empacotar(diretorio, destino, extensoes=None):
+    '''
+    Monta o ZIP de distribuição do diretório sem recomprimir: artefatos com irmão .gz entram como
+    deflate com o fluxo do irmão; os demais entram armazenados (sem compressão). Os irmãos e o
+    manifesto não entram no ZIP. Só valem irmãos em dia com o artefato (ver irmao_atual); rode
+    comprimir_artefatos antes para aproveitá-los.
+
+    Parâmetros:
+    - diretorio: diretório com os artefatos
+    - destino: caminho do .zip
+    - extensoes: extensões incluídas; None inclui todos os arquivos
+
+    Retorna:
+    - dict com entradas, deflate (reaproveitadas do .gz), armazenadas, bytes (do ZIP) e segundos
+    '''
+    inicio = time.perf_counter()
+    central = []
+    resumo = {'entradas': 0, 'deflate': 0, 'armazenadas': 0}
+    irmaos = ('.gz', '.br')
+    with open(destino, "wb") as zip_:
+        for raiz, pastas, arquivos in os.walk(diretorio):
+            pastas.sort()
+            for nome in sorted(arquivos):
+                caminho = os.path.join(raiz, nome)
+                if (nome == ARQUIVO_MANIFESTO or nome.endswith(irmaos) and os.path.exists(caminho[:-3])
+                        or os.path.abspath(caminho) == os.path.abspath(destino)
+                        or extensoes is not None and not nome.endswith(tuple(extensoes))):
+                    continue
+                irmao = irmao_atual(caminho, 'gz', diretorio)
+                if irmao is not None:
+                    with open(irmao, "rb") as f:
+                        conteudo, crc, tamanho = _partes_gzip(f.read())
+                    metodo = 8
+                    resumo['deflate'] += 1
+                else:
+                    with open(caminho, "rb") as f:
+                        conteudo = f.read()
+                    crc, tamanho, metodo = zlib.crc32(conteudo), len(conteudo), 0
+                    resumo['armazenadas'] += 1
+                if len(conteudo) >= 0xFFFFFFFF or tamanho >= 0xFFFFFFFF:
+                    raise ValueError(f"{caminho}: arquivos acima de 4 GB exigem ZIP64, que não é suportado.")
+                relativo = os.path.relpath(caminho, diretorio).replace(os.sep, '/').encode('utf-8')
+                deslocamento = zip_.tell()
+                # Cabeçalho local (bit 11: nome em UTF-8)
+                campos = (20, 0x0800, metodo, _HORA_DOS, _DATA_DOS, crc, len(conteudo), tamanho, len(relativo), 0)
+                zip_.write(struct.pack('<IHHHHHIIIHH', 0x04034b50, *campos) + relativo)
+                zip_.write(conteudo)
+                central.append(struct.pack('<IH', 0x02014b50, 20) + struct.pack('<HHHHHIIIHH', *campos)
+                               + struct.pack('<HHHII', 0, 0, 0, 0o100644 << 16, deslocamento) + relativo)
+                resumo['entradas'] += 1
+        inicio_central = zip_.tell()
+        for registro in central:
+            zip_.write(registro)
+        zip_.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, len(central), len(central),
+                               zip_.tell() - inicio_central, inicio_central, 0))
+    resumo['bytes'] = os.path.getsize(destino)
+    resumo['segundos'] = time.perf_counter() - inicio
+    return resumo
+
+
+def _empacotar_do_zero(diretorio, destino):
+    # ZIP montado do zero com zipfile (deflate de cada arquivo a cada geração), só para comparação
+    import zipfile
+
+    with zipfile.ZipFile(destino, "w", zipfile.ZIP_DEFLATED, compresslevel=NIVEL_GZIP) as zip_:
+        for relativo in _artefatos(diretorio, EXTENSOES):
+            zip_.write(os.path.join(diretorio, relativo), relativo)
+    return os.path.getsize(destino)
+
+
+# Bloco principal: gera os relatórios (site de indicadores e modais compartilhados) num diretório
+# temporário e mede a compressão inicial, a reaproveitada e os dois jeitos de montar o ZIP
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    import zipfile
+
+    import construirsite
+    import modaiscompartilhados
+    from gerar_html_indicadores import carregar_indicadores
+
+    temporario = tempfile.mkdtemp()
+    try:
+        relatorios = os.path.join(temporario, "relatorios")
+        construirsite.construir_site(carregar_indicadores(), diretorio=os.path.join(relatorios, "site"), comprimir=False)
+        modaiscompartilhados.gerar_variantes(modaiscompartilhados.carregar_registros(),
+                                             os.path.join(relatorios, "modais"), comprimir=False)
+        print(f"Formatos disponíveis: {', '.join(formatos_disponiveis())}")
+        for rotulo in ("primeira compressão", "sem mudança", "regravado igual"):
+            if rotulo == "regravado igual":
+                # Geração completa com o mesmo conteúdo: datas mudam, hashes não
+                modaiscompartilhados.gerar_variantes(modaiscompartilhados.carregar_registros(),
+                                                     os.path.join(relatorios, "modais"), comprimir=False)
+            resumo = comprimir_artefatos(relatorios)
+            bytes_formatos = ' | '.join(f"{formato}: {resumo[f'bytes_{formato}'] / 1024:.0f} KB"
+                                        for formato in formatos_disponiveis())
+            print(f"{rotulo}: {resumo['arquivos']} artefatos ({resumo['bytes'] / 1024:.0f} KB), {resumo['comprimidos']} "
+                  f"comprimidos, {resumo['reaproveitados']} reaproveitados em {resumo['segundos']:.3f} s | {bytes_formatos}")
+        destino = os.path.join(temporario, "distribuicao.zip")
+        resumo = empacotar(relatorios, destino)
+        with zipfile.ZipFile(destino) as zip_:
+            assert zip_.testzip() is None
+        # Artefato regravado depois da compressão: entra armazenado com o conteúdo novo, não pelo .gz antigo
+        pagina = os.path.join(relatorios, "site", "index.html")
+        with open(pagina, "a", encoding="utf-8") as f:
+            f.write("<!-- regravado -->\n")
+        empacotar(relatorios, os.path.join(temporario, "regravado.zip"))
+        with zipfile.ZipFile(os.path.join(temporario, "regravado.zip")) as zip_, open(pagina, "rb") as f:
+            assert zip_.read("site/index.html") == f.read()
+        inicio = time.perf_counter()
+        tamanho = _empacotar_do_zero(relatorios, os.path.join(temporario, "do_zero.zip"))
+        tempo = time.perf_counter() - inicio
+        print(f"ZIP reaproveitando os .gz: {resumo['entradas']} entradas ({resumo['deflate']} deflate, "
+              f"{resumo['armazenadas']} armazenadas), {resumo['bytes'] / 1024:.0f} KB em {resumo['segundos']:.3f} s | "
+              f"do zero com zipfile: {tamanho / 1024:.0f} KB em {tempo:.3f} s")
+    finally:
+        shutil.rmtree(temporario)
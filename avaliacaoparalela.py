@@ -0,0 +1,170 @@
+# Execução paralela das avaliações para universos grandes e varreduras de cenários.
+# Razão: robov8 avalia dentro da thread de coleta e os roteiros de logicav4.py e
+# extract_and_save_to_excel (roboteste.py) percorrem classes × entradas em série.
+# Aqui o trabalho (indicador, bloco de ativos) é dividido entre processos de um ProcessPoolExecutor,
+# em blocos grandes para amortizar a serialização, e cada processo devolve só códigos compactos de
+# classificação (int8) em vez de objetos ResultadoIND completos com todos os textos.
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import analiseativos
+
+
+# Classificações usadas pelos avaliadores, da pior para a melhor; o código é a posição na tupla
+CLASSIFICACOES = ('Erro', 'Muito Crítico', 'Crítico', 'Ruim', 'Moderado', 'Bom', 'Muito Bom', 'Ótimo')
+CODIGOS_CLASSIFICACAO = {classificacao: codigo for codigo, classificacao in enumerate(CLASSIFICACOES)}
+# Código para quando o avaliador não devolve resultado (valor fora de todas as faixas, ex.: NaN)
+CODIGO_SEM_FAIXA = -1
+
+# Indicadores já publicados em stocks_data.xlsx e o avaliador de um argumento que classifica cada um
+AVALIACOES_PADRAO = {
+    'P/L': ('PLEvaluator', 'avaliar'),
+    'P/VP': ('PVPEvaluator', 'avaliar'),
+    'EV/EBITDA': ('EVEBITDAEvaluator', 'avaliar'),
+    'EV/EBIT': ('EVEBITEvaluator', 'avaliar'),
+    'P/EBITDA': ('PEBITDAEvaluator', 'avaliar'),
+    'P/EBIT': ('PEBITEvaluator', 'avaliar'),
+    'P/Ativo': ('PAtivoEvaluator', 'avaliar'),
+    'P/SR': ('PSREvaluator', 'avaliar'),
+    'Div. liquida/PL': ('DivLiquidaPatrimonioLiquidoEvaluator', 'avaliar'),
+    'Div. liquida/EBITDA': ('DivLiquidaEBITDAEvaluator', 'avaliar'),
+    'Div. liquida/EBIT': ('DivLiquidaEBITEvaluator', 'avaliar'),
+    'PL/Ativos': ('PLAtivosEvaluator', 'avaliar'),
+    'Liq. corrente': ('LiquidezCorrenteEvaluator', 'avaliar'),
+    'M. Bruta': ('MargemBrutaEvaluator', 'avaliar'),
+    'M. EBITDA': ('MargemEBITDAEvaluator', 'avaliar'),
+    'M. EBIT': ('MargemEBITEvaluator', 'avaliar'),
+    'M. Liquida': ('MargemLiquidaEvaluator', 'avaliar'),
+    'ROE': ('ROEEvaluator', 'avaliar'),
+    'ROA': ('ROAEvaluator', 'avaliar'),
+    'ROIC': ('ROICEvaluator', 'avaliar'),
+    'Giro ativos': ('GiroAtivoEvaluator', 'avaliar'),
+    'Dividend Yield': ('DividendYieldEvaluator', 'avaliar'),
+}
+
+# Avaliadores já instanciados neste processo (cada processo do pool monta o seu uma única vez)
+_avaliadores = {}
+
+
+def _avaliador(nome_classe, metodo):
+    # Instancia o avaliador na primeira vez que o processo o usa
+    chave = (nome_classe, metodo)
+    if chave not in _avaliadores:
+        _avaliadores[chave] = getattr(getattr(analiseativos, nome_classe)(), metodo)
+    return _avaliadores[chave]
+
+
+def avaliar_bloco(nome_classe, metodo, valores):
+    '''
+    Avalia um bloco de valores com um avaliador e devolve os códigos de classificação.
+
+    Parâmetros:
+    - nome_classe: nome da classe em analiseativos (ex.: 'ROEEvaluator')
+    - metodo: método de um argumento que classifica o valor (ex.: 'avaliar', 'avaliar_wacc')
+    - valores: np.ndarray de float (NaN = dado ausente)
+
+    Retorna:
+    - np.ndarray int8 com um código de CLASSIFICACOES por valor
+    '''
+    avaliar = _avaliador(nome_classe, metodo)
+    codigos = np.empty(len(valores), dtype=np.int8)
+    for i, valor in enumerate(valores):
+        # NaN vira None para cair no tratamento de erro do avaliador
+        resultado = avaliar(None if valor != valor else float(valor))
+        codigos[i] = CODIGO_SEM_FAIXA if resultado is None else \
+            CODIGOS_CLASSIFICACAO.get(resultado.classificacao, CODIGO_SEM_FAIXA)
+    return codigos
+
+
+def preparar_valores(df, indicadores=None):
+    '''
+    Converte o DataFrame indicadores × tickers de stocks_data.xlsx em ativos × indicadores numéricos.
+    Percentuais ('15.95%') viram números (15.95); entradas inválidas viram NaN.
+    '''
+    indicadores = list(AVALIACOES_PADRAO) if indicadores is None else indicadores
+    linhas = df.loc[[indicador for indicador in indicadores if indicador in df.index]]
+    return linhas.apply(lambda linha: pd.to_numeric(linha.astype(str).str.rstrip('%'), errors='coerce'), axis=1).T
+
+
+def dividir_tarefas(valores, avaliacoes, tamanho_bloco):
+    # Gera (coluna, início, classe, método, bloco de valores); blocos grandes diluem o custo de serialização
+    for posicao, indicador in enumerate(valores.columns):
+        nome_classe, metodo = avaliacoes[indicador]
+        coluna = valores[indicador].to_numpy(dtype=float)
+        for inicio in range(0, len(coluna), tamanho_bloco):
+            yield posicao, inicio, nome_classe, metodo, coluna[inicio:inicio + tamanho_bloco]
+
+
+def avaliar_universo(valores, avaliacoes=None, processos=None, tamanho_bloco=2000):
+    '''
+    Avalia todos os ativos × indicadores, em paralelo quando processos > 1.
+
+    Parâmetros:
+    - valores: pd.DataFrame ativos × indicadores (ver preparar_valores)
+    - avaliacoes: dict {indicador: (nome da classe, método)} (padrão AVALIACOES_PADRAO)
+    - processos: número de processos (padrão os.cpu_count()); 1 avalia no próprio processo
+    - tamanho_bloco: número de ativos por tarefa enviada ao pool
+
+    Retorna:
+    - pd.DataFrame int8 ativos × indicadores com os códigos de classificação (ver decodificar)
+    '''
+    avaliacoes = AVALIACOES_PADRAO if avaliacoes is None else avaliacoes
+    processos = processos or os.cpu_count() or 1
+    valores = valores[[indicador for indicador in valores.columns if indicador in avaliacoes]]
+    codigos = np.empty(valores.shape, dtype=np.int8, order='F')
+    tarefas = list(dividir_tarefas(valores, avaliacoes, tamanho_bloco))
+    if processos == 1:
+        # Sem pool: evita o custo de subir processos em universos pequenos
+        blocos = (avaliar_bloco(classe, metodo, bloco) for _, _, classe, metodo, bloco in tarefas)
+        for (posicao, inicio, _, _, _), bloco in zip(tarefas, blocos):
+            codigos[inicio:inicio + len(bloco), posicao] = bloco
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            futuros = [(posicao, inicio, executor.submit(avaliar_bloco, classe, metodo, bloco))
+                       for posicao, inicio, classe, metodo, bloco in tarefas]
+            for posicao, inicio, futuro in futuros:
+                bloco = futuro.result()
+                codigos[inicio:inicio + len(bloco), posicao] = bloco
+    return pd.DataFrame(codigos, index=valores.index, columns=valores.columns)
+
+
+def decodificar(codigos):
+    '''
+    Converte os códigos int8 de volta nas classificações ('Ótimo', 'Bom', ...); CODIGO_SEM_FAIXA vira None.
+    '''
+    tabela = np.array(list(CLASSIFICACOES) + [None], dtype=object)
+    return pd.DataFrame(tabela[codigos.to_numpy()], index=codigos.index, columns=codigos.columns)
+
+
+# Bloco principal para testes e benchmark
+if __name__ == "__main__":
+    from leituraplanilhas import ler_planilha
+
+    # Universo real coletado pelo robô
+    stocks = ler_planilha('stocks_data.xlsx', index_col='indicadores')
+    valores = preparar_valores(stocks)
+    print(decodificar(avaliar_universo(valores, processos=1)).head(5).to_string())
+
+    # Universo sintético de 10 mil ativos amostrando os valores reais de cada indicador
+    rng = np.random.default_rng(42)
+    n = 10000
+    sinteticos = pd.DataFrame({indicador: rng.choice(valores[indicador].to_numpy(), n) * rng.uniform(0.5, 1.5, n)
+                               for indicador in valores.columns},
+                              index=[f'SINT{i:05d}' for i in range(n)])
+    total = sinteticos.size
+    referencia = None
+    maximo = os.cpu_count() or 1
+    for processos in sorted({1, 2, 4, maximo}):
+        inicio = time.perf_counter()
+        codigos = avaliar_universo(sinteticos, processos=processos)
+        tempo = time.perf_counter() - inicio
+        # Todas as configurações devem produzir exatamente os mesmos códigos
+        referencia = codigos if referencia is None else referencia
+        assert referencia.equals(codigos)
+        print(f"{processos} processo(s): {tempo:.2f} s | {total / tempo:,.0f} avaliações/s "
+              f"| {codigos.memory_usage(index=False).sum() / 1024:.0f} KiB de códigos")
+    print(f"Núcleos disponíveis: {maximo}")
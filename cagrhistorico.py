@@ -0,0 +1,191 @@
+# Motor de CAGR sobre séries históricas anuais (receita, lucro líquido) de muitos ativos.
+# Razão: CAGREvaluator.calcular_cagr e CAGRLucrosEvaluator usam só o valor inicial e o final com
+# anos=5 fixo, então pontas ruidosas dominam o resultado. Aqui a série inteira é usada:
+#   - CAGR das pontas: (VF / VI)^(1/n) - 1 com n = distância real em anos
+#   - CAGR por regressão log-linear: ln(V) = a + b × ano, CAGR = e^b - 1 (só pontos positivos)
+#   - CAGRs móveis de 3, 5 e 10 anos para cada ano final
+# Tudo vetorizado sobre a matriz ativos × anos.
+#
+# Comportamento definido para pontas zero/negativas (status_pontas):
+#   'ok'                        -> ambas as pontas positivas, CAGR normal
+#   'final_zero_ou_negativo'    -> VI > 0 e VF <= 0: CAGR = -100% (perda total do crescimento)
+#   'inicial_zero_ou_negativo'  -> VI <= 0: CAGR indefinido (NaN), como em calcular_cagr
+#   'dados_insuficientes'       -> menos de dois anos com dados: NaN
+import numpy as np
+import pandas as pd
+
+from analiseativos import CAGREvaluator, CAGRLucrosEvaluator
+
+
+# Janelas padrão dos CAGRs móveis
+JANELAS_PADRAO = (3, 5, 10)
+
+STATUS_OK = 'ok'
+STATUS_FINAL_NAO_POSITIVO = 'final_zero_ou_negativo'
+STATUS_INICIAL_NAO_POSITIVO = 'inicial_zero_ou_negativo'
+STATUS_DADOS_INSUFICIENTES = 'dados_insuficientes'
+
+
+def _matriz_anual(series):
+    '''
+    Normaliza a entrada em matriz ativos × anos consecutivos (anos faltantes viram NaN).
+
+    Parâmetros:
+    - series: pd.DataFrame com tickers nas linhas e anos (int) nas colunas
+
+    Retorna:
+    - tuple: (índice de tickers, array de anos, matriz de valores float)
+    '''
+    # Garante colunas inteiras, ordenadas e sem buracos entre o primeiro e o último ano
+    series = series.rename(columns=int)
+    anos = np.arange(min(series.columns), max(series.columns) + 1)
+    series = series.reindex(columns=anos)
+    return series.index, anos, series.to_numpy(dtype=float)
+
+
+def _cagr_pontas(inicial, final, anos):
+    '''
+    CAGR entre dois valores com o tratamento definido para pontas zero/negativas.
+    Retorna (cagr, status) como arrays do mesmo formato.
+    '''
+    inicial = np.asarray(inicial, dtype=float)
+    final = np.asarray(final, dtype=float)
+    anos = np.asarray(anos, dtype=float)
+    # Status de cada par de pontas
+    status = np.full(np.broadcast(inicial, final, anos).shape, STATUS_OK, dtype=object)
+    insuficiente = np.isnan(inicial) | np.isnan(final) | ~(anos > 0)
+    inicial_invalido = ~insuficiente & (inicial <= 0)
+    final_invalido = ~insuficiente & ~inicial_invalido & (final <= 0)
+    status[final_invalido] = STATUS_FINAL_NAO_POSITIVO
+    status[inicial_invalido] = STATUS_INICIAL_NAO_POSITIVO
+    status[insuficiente] = STATUS_DADOS_INSUFICIENTES
+    # Calcula só onde as duas pontas são positivas; as demais recebem o valor definido acima
+    validas = status == STATUS_OK
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cagr = np.where(validas, (final / inicial) ** (1 / anos) - 1, np.nan)
+    cagr = np.where(final_invalido, -1.0, cagr)
+    return cagr, status
+
+
+def cagr_pontas(series):
+    '''
+    CAGR entre o primeiro e o último ano com dado de cada ativo, usando a distância real em anos.
+
+    Retorna:
+    - pd.DataFrame indexado por ticker com 'cagr_pontas', 'status_pontas', 'ano_inicial', 'ano_final'
+    '''
+    tickers, anos, valores = _matriz_anual(series)
+    presente = ~np.isnan(valores)
+    linhas = np.arange(len(valores))
+    # Posição do primeiro e do último ano com dado em cada linha
+    primeiro = np.argmax(presente, axis=1)
+    ultimo = valores.shape[1] - 1 - np.argmax(presente[:, ::-1], axis=1)
+    tem_dado = presente.any(axis=1)
+    inicial = np.where(tem_dado, valores[linhas, primeiro], np.nan)
+    final = np.where(tem_dado, valores[linhas, ultimo], np.nan)
+    distancia = np.where(tem_dado, anos[ultimo] - anos[primeiro], 0)
+    cagr, status = _cagr_pontas(inicial, final, distancia)
+    return pd.DataFrame({
+        'cagr_pontas': cagr,
+        'status_pontas': status,
+        'ano_inicial': np.where(tem_dado, anos[primeiro], np.nan),
+        'ano_final': np.where(tem_dado, anos[ultimo], np.nan),
+    }, index=tickers)
+
+
+def cagr_regressao(series):
+    '''
+    CAGR pela inclinação da regressão de mínimos quadrados de ln(valor) contra o ano.
+    Usa apenas anos com valor positivo; exige ao menos dois pontos.
+
+    Retorna:
+    - pd.Series indexada por ticker
+    '''
+    tickers, anos, valores = _matriz_anual(series)
+    # Pontos usados na regressão: valores positivos (o log não existe para zero/negativos)
+    usado = valores > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_valores = np.where(usado, np.log(np.where(usado, valores, 1.0)), 0.0)
+    x = np.where(usado, anos[None, :].astype(float), 0.0)
+    n = usado.sum(axis=1)
+    # Somatórios das equações normais, todos por linha
+    soma_x = x.sum(axis=1)
+    soma_y = log_valores.sum(axis=1)
+    soma_xx = (x * x).sum(axis=1)
+    soma_xy = (x * log_valores).sum(axis=1)
+    denominador = n * soma_xx - soma_x ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inclinacao = np.where((n >= 2) & (denominador != 0), (n * soma_xy - soma_x * soma_y) / denominador, np.nan)
+    return pd.Series(np.expm1(inclinacao), index=tickers, name='cagr_regressao')
+
+
+def cagr_movel(series, janela):
+    '''
+    CAGR móvel de 'janela' anos para cada ano final (VF = ano t, VI = ano t - janela).
+
+    Retorna:
+    - pd.DataFrame tickers × anos finais (NaN onde a janela não cabe ou as pontas são inválidas)
+    '''
+    tickers, anos, valores = _matriz_anual(series)
+    if janela >= len(anos):
+        return pd.DataFrame(index=tickers)
+    # Desloca a matriz para comparar cada ano com o de 'janela' anos antes
+    cagr, _ = _cagr_pontas(valores[:, :-janela], valores[:, janela:], janela)
+    return pd.DataFrame(cagr, index=tickers, columns=anos[janela:])
+
+
+def calcular_cagrs(series, janelas=JANELAS_PADRAO):
+    '''
+    Consolida, por ativo, o CAGR das pontas, o CAGR por regressão e o CAGR móvel mais recente de cada janela.
+
+    Retorna:
+    - pd.DataFrame indexado por ticker
+    '''
+    resultado = cagr_pontas(series)
+    resultado['cagr_regressao'] = cagr_regressao(series)
+    for janela in janelas:
+        moveis = cagr_movel(series, janela)
+        # CAGR móvel da janela que termina no último ano com dado de cada ativo
+        resultado[f'cagr_{janela}a'] = [
+            moveis.at[ticker, int(ano)] if ano == ano and int(ano) in moveis.columns else np.nan
+            for ticker, ano in resultado['ano_final'].items()
+        ]
+    return resultado
+
+
+def classificar_cagrs(resultado, avaliador=None, coluna='cagr_regressao'):
+    '''
+    Classifica uma coluna de CAGR pelas faixas de CAGREvaluator (receitas) ou CAGRLucrosEvaluator (lucros).
+
+    Retorna:
+    - pd.DataFrame com as colunas 'Classificacao' e 'Faixa' acrescentadas
+    '''
+    avaliador = avaliador or CAGREvaluator()
+    avaliacoes = [avaliador.avaliar_cagr(float(cagr)) for cagr in resultado[coluna]]
+    resultado = resultado.copy()
+    resultado['Classificacao'] = [a.classificacao for a in avaliacoes]
+    resultado['Faixa'] = [a.faixa for a in avaliacoes]
+    return resultado
+
+
+# Bloco principal para testes
+if __name__ == "__main__":
+    anos = list(range(2014, 2025))
+    receitas = pd.DataFrame({
+        'ABEV3': [46.7e9 * 1.06 ** i for i in range(len(anos))],
+        'WEGE3': [7.8e9 * 1.15 ** i for i in range(len(anos))],
+    }, index=anos).T
+    lucros = pd.DataFrame([
+        [1.0, 1.2, 0.9, 1.4, 1.3, 1.6, 1.5, 1.9, 1.7, 2.1, 2.0],     # crescimento ruidoso
+        [1.0, 0.8, 0.5, 0.1, -0.2, -0.5, -0.3, -0.1, -0.4, -0.6, -0.8],  # virou prejuízo
+        [-1.0, -0.5, 0.1, 0.4, 0.6, 0.8, 1.0, 1.1, 1.3, 1.4, 1.5],  # começou com prejuízo
+        [np.nan] * 10 + [1.0],                                     # só um ano de dado
+    ], index=['RUID3', 'PREJ3', 'VIRA3', 'NOVO3'], columns=anos)
+
+    # Crescimento exato de 6% e 15% deve ser recuperado por todos os métodos
+    cagrs_receita = calcular_cagrs(receitas)
+    print(classificar_cagrs(cagrs_receita).to_string())
+    assert np.allclose(cagrs_receita[['cagr_pontas', 'cagr_regressao', 'cagr_3a', 'cagr_5a', 'cagr_10a']].loc['ABEV3'], 0.06)
+
+    # Séries com pontas zero/negativas seguem o comportamento definido
+    print(classificar_cagrs(calcular_cagrs(lucros), CAGRLucrosEvaluator()).to_string())
@@ -0,0 +1,164 @@
+# Motor de cenários (pessimista/base/otimista) para valuation em lote.
+# Cada cenário sobrescreve apenas premissas macro (Selic como taxa livre de risco, prêmio de risco de
+# mercado, crescimento perpétuo e um choque no crescimento explícito). Tudo que não depende dessas
+# premissas (custo da dívida após impostos, pesos E/V e D/V, CAGR histórico) é calculado uma única vez
+# por ativo e reaproveitado por todos os cenários. Os FCFFs crescem a taxa constante, então o FCD sai da
+# forma fechada do núcleo de desconto, sem projetar e descontar ano a ano.
+import pandas as pd
+
+from analiseativos import WACCEvaluator, FCDEvaluator, CAGREvaluator
+from analiseativos.cache import resultado_erro
+from custocapital import custo_equity_capm
+
+
+# Cenários padrão: Selic usada como taxa livre de risco no CAPM
+CENARIOS_PADRAO = {
+    'pessimista': {'selic': 0.1575, 'premio_risco': 0.065, 'crescimento_terminal': 0.02, 'choque_crescimento': -0.02},
+    'base': {'selic': 0.15, 'premio_risco': 0.055, 'crescimento_terminal': 0.03, 'choque_crescimento': 0.0},
+    'otimista': {'selic': 0.1225, 'premio_risco': 0.045, 'crescimento_terminal': 0.035, 'choque_crescimento': 0.02},
+}
+
+
+class MotorCenarios:
+    # Construtor que recebe os dados por ativo e prepara os caches compartilhados entre cenários
+    def __init__(self, dados_ativos, anos=5):
+        '''
+        Parâmetros:
+        - dados_ativos: dict {ticker: {campo: valor}} com os campos
+          'beta', 'valor_mercado', 'divida_bruta', 'custo_divida', 'taxa_imposto',
+          'fcf_atual', 'crescimento', 'valor_firma', 'receita_inicial', 'receita_final'
+        - anos: número de anos do período explícito do FCD
+        '''
+        self.dados_ativos = dados_ativos
+        self.anos = anos
+        # Avaliadores reaproveitados em todas as chamadas
+        self.avaliador_wacc = WACCEvaluator()
+        self.avaliador_fcd = FCDEvaluator()
+        self.avaliador_cagr = CAGREvaluator()
+        # Caches de resultados intermediários, chaveados pelas entradas que realmente os determinam
+        self._cache = {}
+        # Contadores expostos para conferir o reaproveitamento
+        self.calculos = 0
+        self.acertos_cache = 0
+
+    # Retorna o valor em cache ou calcula e guarda
+    def _memorizar(self, chave, calcular):
+        if chave in self._cache:
+            self.acertos_cache += 1
+            return self._cache[chave]
+        self.calculos += 1
+        valor = calcular()
+        self._cache[chave] = valor
+        return valor
+
+    # Estrutura de capital independente de cenário: pesos E/V, D/V e custo da dívida após impostos
+    def estrutura_capital(self, ticker):
+        dados = self.dados_ativos[ticker]
+
+        def calcular():
+            equity = float(dados['valor_mercado'])
+            divida = float(dados['divida_bruta'])
+            valor_total = equity + divida
+            if valor_total == 0:
+                raise ValueError("O valor total (Equity + Dívida) não pode ser zero.")
+            custo_divida_liquido = float(dados['custo_divida']) * (1 - float(dados['taxa_imposto']))
+            return equity / valor_total, divida / valor_total, custo_divida_liquido
+
+        return self._memorizar(('estrutura', ticker), calcular)
+
+    # CAGR histórico de receitas: não depende de nenhuma premissa macro
+    def avaliacao_cagr(self, ticker):
+        dados = self.dados_ativos[ticker]
+
+        def calcular():
+            resultado = self.avaliador_cagr.avaliar(dados['receita_inicial'], dados['receita_final'])
+            try:
+                cagr = self.avaliador_cagr.calcular_cagr(dados['receita_inicial'], dados['receita_final'])
+            except ValueError:
+                cagr = None
+            return cagr, resultado
+
+        return self._memorizar(('cagr', ticker), calcular)
+
+    # Avalia um ativo em um cenário, reaproveitando os intermediários compartilhados
+    def avaliar_ativo(self, ticker, nome_cenario, cenario):
+        dados = self.dados_ativos[ticker]
+        linha = {'Ativo': ticker, 'Cenario': nome_cenario}
+        try:
+            # Custo do capital próprio via CAPM com a Selic do cenário
+            custo_equity = self._memorizar(
+                ('capm', cenario['selic'], float(dados['beta']), cenario['premio_risco']),
+                lambda: custo_equity_capm(cenario['selic'], float(dados['beta']), cenario['premio_risco']))
+            peso_equity, peso_divida, custo_divida_liquido = self.estrutura_capital(ticker)
+            wacc = peso_equity * custo_equity + peso_divida * custo_divida_liquido
+            # Classifica o WACC já calculado, sem repetir o cálculo dentro do avaliador
+            resultado_wacc = self.avaliador_wacc.avaliar_wacc(wacc)
+            linha.update({'Custo Equity': custo_equity, 'WACC': wacc,
+                          'Classificacao WACC': resultado_wacc.classificacao})
+            # FCD dos FCFFs com crescimento constante (forma fechada, ver descontos.py)
+            fcf_atual = float(dados['fcf_atual'])
+            crescimento = float(dados['crescimento']) + cenario.get('choque_crescimento', 0.0)
+            g_terminal = cenario['crescimento_terminal']
+            # O FCD é calculado uma vez e o avaliador só classifica o valor já calculado
+            try:
+                fcd = self.avaliador_fcd.calcular_fcd_crescimento_constante(
+                    fcf_atual, crescimento, wacc, g_terminal, self.anos)
+            except ValueError as e:
+                fcd = None
+                resultado_fcd = resultado_erro(self.avaliador_fcd, e)
+            else:
+                resultado_fcd = self.avaliador_fcd.avaliar_fcd(fcd, dados['valor_firma'])
+            linha.update({'FCD': fcd,
+                          'FCD/EV': fcd / float(dados['valor_firma']) if fcd is not None else None,
+                          'Classificacao FCD': resultado_fcd.classificacao})
+        except Exception as e:
+            # Dados incompletos não interrompem o lote: o erro fica registrado na linha
+            linha['Erro'] = str(e)
+        cagr, resultado_cagr = self.avaliacao_cagr(ticker)
+        linha.update({'CAGR Receitas': cagr, 'Classificacao CAGR': resultado_cagr.classificacao})
+        return linha
+
+    # Avalia todos os cenários × ativos em um único lote
+    def avaliar(self, cenarios=None):
+        '''
+        Retorna:
+        - pd.DataFrame em formato longo (uma linha por ativo e cenário)
+        '''
+        cenarios = cenarios or CENARIOS_PADRAO
+        linhas = [
+            self.avaliar_ativo(ticker, nome, cenario)
+            for nome, cenario in cenarios.items()
+            for ticker in self.dados_ativos
+        ]
+        return pd.DataFrame(linhas)
+
+
+def exportar_comparacao_cenarios(df, nome_arquivo="comparacao_cenarios.xlsx"):
+    '''
+    Grava a comparação de cenários: aba 'Cenarios' (formato longo) e aba 'Comparacao'
+    (uma linha por ativo, colunas indicador × cenário).
+    '''
+    colunas = [c for c in ['Custo Equity', 'WACC', 'Classificacao WACC', 'FCD', 'FCD/EV', 'Classificacao FCD']
+               if c in df.columns]
+    comparacao = df.pivot(index='Ativo', columns='Cenario', values=colunas)
+    comparacao.columns = [f"{indicador} ({cenario})" for indicador, cenario in comparacao.columns]
+    with pd.ExcelWriter(nome_arquivo, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Cenarios', index=False)
+        comparacao.to_excel(writer, sheet_name='Comparacao')
+    print(f"Comparação de cenários salva em {nome_arquivo}")
+
+
+# Bloco principal para testes
+if __name__ == "__main__":
+    dados = {
+        'PETR4': {'beta': 0.32, 'valor_mercado': 390e9, 'divida_bruta': 300e9, 'custo_divida': 0.12,
+                  'taxa_imposto': 0.34, 'fcf_atual': 84.69e9, 'crescimento': 0.03, 'valor_firma': 552e9,
+                  'receita_inicial': 300e9, 'receita_final': 490e9},
+        'ABEV3': {'beta': 0.65, 'valor_mercado': 195e9, 'divida_bruta': 3.2e9, 'custo_divida': 0.13,
+                  'taxa_imposto': 0.34, 'fcf_atual': 15e9, 'crescimento': 0.05, 'valor_firma': 181e9,
+                  'receita_inicial': 47e9, 'receita_final': 85e9},
+    }
+    motor = MotorCenarios(dados)
+    resultado = motor.avaliar()
+    print(resultado.to_string())
+    print(f"Intermediários calculados: {motor.calculos} | reaproveitados do cache: {motor.acertos_cache}")
@@ -0,0 +1,219 @@
+# Varredura de cobertura das faixas de todos os avaliadores (classes de analiseativos e funções evaluate_*).
+# Razão: coletar_resultados_avaliacao (logicav4.py) testa à mão uns poucos valores por avaliador, e boa
+# parte dos testes está comentada. Aqui cada regra da tabela (analiseativos/regras.json) é varrida com
+# milhões de valores pelo caminho vetorizado (Regra.condicoes/Regra.indices): faixa densa em torno dos
+# limites, caudas em escala logarítmica, ±inf, NaN e cada limite ±ε. O relatório aponta pontos sem faixa
+# (o avaliador devolveria None), faixas sobrepostas (mais de uma condição verdadeira; a primeira vence),
+# faixas que nunca são alcançadas, divergências entre o caminho vetorizado e o escalar e resultados 'Erro'
+# ou None do avaliador real nos pontos especiais.
+import contextlib
+import io
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+import analiseativos
+import analisefundamentalista
+from analiseativos.regras import SEM_FAIXA, tabela_regras
+from manifestoavaliadores import carregar_manifesto
+
+
+ARQUIVO_RELATORIO = 'cobertura_faixas.csv'
+# Pontos densos por variável (as regras de duas variáveis recebem a mesma quantidade de pares aleatórios)
+PONTOS_PADRAO = 1_000_000
+# Exemplos guardados por problema no relatório
+EXEMPLOS = 3
+
+
+def pontos_especiais(limites):
+    '''
+    Valores de fronteira de uma variável: zero com os dois sinais, ±inf, NaN, extremos do float e, para
+    cada limite, o próprio limite, os floats vizinhos (nextafter) e limite ±ε (ε relativo de 1e-9).
+
+    Retorna:
+    - np.ndarray de float
+    '''
+    pontos = [0.0, -0.0, np.inf, -np.inf, np.nan, 1e308, -1e308, 1e-300, -1e-300]
+    for limite in limites:
+        epsilon = max(abs(limite), 1) * 1e-9
+        pontos += [limite, np.nextafter(limite, -np.inf), np.nextafter(limite, np.inf),
+                   limite - epsilon, limite + epsilon]
+    return np.array(pontos, dtype=float)
+
+
+def pontos_varredura(limites, quantidade=PONTOS_PADRAO):
+    '''
+    Pontos de varredura de uma variável: os especiais, uma grade densa que cobre os limites com folga
+    e caudas logarítmicas (±1e-12 a ±1e308).
+
+    Retorna:
+    - np.ndarray de float
+    '''
+    inferior, superior = (min(limites), max(limites)) if limites else (-1.0, 1.0)
+    folga = max(superior - inferior, 1.0)
+    caudas = np.logspace(-12, 308, 4_000)
+    return np.concatenate([pontos_especiais(limites),
+                           np.linspace(inferior - folga, superior + folga, quantidade),
+                           caudas, -caudas])
+
+
+def _entradas(compilada, quantidade, gerador):
+    # Uma variável: a varredura completa. Mais de uma: produto dos pontos especiais de cada variável
+    # mais pares aleatórios na faixa de interesse
+    if len(compilada.variaveis) == 1:
+        return [pontos_varredura(compilada.limites, quantidade)]
+    especiais = [pontos_especiais(compilada.limites)] * len(compilada.variaveis)
+    grade = [np.array(coluna) for coluna in zip(*itertools.product(*especiais))]
+    inferior, superior = (min(compilada.limites), max(compilada.limites)) if compilada.limites else (-1.0, 1.0)
+    folga = max(superior - inferior, 1.0)
+    return [np.concatenate([coluna, gerador.uniform(inferior - folga, superior + folga, quantidade)])
+            for coluna in grade]
+
+
+def _exemplos(variaveis, entradas, mascara):
+    # Até EXEMPLOS pontos da máscara, em texto ('x=0; x=5')
+    posicoes = np.flatnonzero(mascara)[:EXEMPLOS]
+    return '; '.join(', '.join(f'{variavel}={entrada[posicao]:g}' for variavel, entrada in zip(variaveis, entradas))
+                     for posicao in posicoes)
+
+
+def _avaliador_real(nome, manifesto):
+    # Função que recebe as variáveis da regra e devolve (classificação ou None); None quando o avaliador
+    # não tem um método que classifique direto essas variáveis (ex.: regras de proporções calculadas)
+    if '#' in nome:
+        # Definição sombreada de evaluate_*: não existe mais como função
+        return None
+    if nome.startswith('evaluate_'):
+        funcao = getattr(analisefundamentalista, nome)
+
+        def chamar(valor):
+            # As funções imprimem os erros; a varredura só conta
+            with contextlib.redirect_stdout(io.StringIO()):
+                resultado = funcao(valor)
+            return None if resultado is None else resultado['classificacao']
+        return chamar
+    classe = manifesto['classes'].get(nome)
+    if classe is None:
+        return None
+    variaveis = tabela_regras()[nome].variaveis
+    for metodo, parametros in classe['metodos'].items():
+        if metodo.startswith('avaliar') and [p['nome'] for p in parametros if p['padrao'] is None] == variaveis:
+            avaliar = getattr(getattr(analiseativos, nome)(), metodo)
+
+            def chamar(*valores):
+                resultado = avaliar(*valores)
+                return None if resultado is None else resultado.classificacao
+            return chamar
+    return None
+
+
+def varrer_regra(compilada, quantidade=PONTOS_PADRAO, manifesto=None, gerador=None):
+    '''
+    Varre uma regra e devolve os problemas de cobertura encontrados.
+
+    Parâmetros:
+    - compilada: Regra (analiseativos.regras)
+    - quantidade: pontos densos por variável
+    - manifesto: manifesto dos avaliadores (para achar o método que classifica as variáveis da regra)
+
+    Retorna:
+    - dict com uma linha do relatório de cobertura
+    '''
+    gerador = gerador or np.random.default_rng(0)
+    variaveis = compilada.variaveis
+    entradas = _entradas(compilada, quantidade, gerador)
+    mascaras = compilada.condicoes(*entradas)
+    indices = np.select(mascaras, range(len(mascaras)), default=SEM_FAIXA)
+    # NaN sem faixa é o comportamento esperado (as cadeias originais devolvem None); o resto é lacuna
+    nan = np.zeros(indices.shape, dtype=bool)
+    infinito = np.zeros(indices.shape, dtype=bool)
+    for entrada in entradas:
+        nan |= np.isnan(entrada)
+        infinito |= np.isinf(entrada)
+    sem_faixa = indices == SEM_FAIXA
+    lacunas = sem_faixa & ~nan & ~infinito
+    # Sobreposição: pontos em que duas faixas com condição valem ao mesmo tempo
+    com_condicao = [i for i, faixa in enumerate(compilada.faixas) if faixa['condicao'] is not None]
+    sobreposicoes = []
+    pontos_sobrepostos = np.zeros(indices.shape, dtype=bool)
+    for i, j in itertools.combinations(com_condicao, 2):
+        ambas = mascaras[i] & mascaras[j]
+        if ambas.any():
+            pontos_sobrepostos |= ambas
+            sobreposicoes.append(f"{compilada.faixas[i]['faixa']} ∩ {compilada.faixas[j]['faixa']}: "
+                                 f"{int(ambas.sum())} pts ({_exemplos(variaveis, entradas, ambas)})")
+    alcancadas = set(np.unique(indices).tolist())
+    nunca = [faixa['faixa'] for i, faixa in enumerate(compilada.faixas) if i not in alcancadas]
+    # Pontos especiais (o início de cada entrada) conferidos pelo caminho escalar e pelo avaliador real
+    quantidade_especiais = len(pontos_especiais(compilada.limites)) ** len(variaveis)
+    especiais = [entrada[:quantidade_especiais] for entrada in entradas]
+    divergentes = [valores for posicao, valores in enumerate(zip(*especiais))
+                   if compilada.indice(*valores) != indices[posicao]]
+    avaliador = _avaliador_real(compilada.nome, manifesto or carregar_manifesto(verificar=False))
+    erros = nenhum = 0
+    if avaliador is not None:
+        for valores in zip(*especiais):
+            classificacao = avaliador(*valores)
+            # Com NaN, 'Erro' (validação da entrada) e None são os resultados esperados: só os demais
+            # pontos contam como erro ou lacuna vista pelo avaliador real
+            if any(valor != valor for valor in valores):
+                continue
+            erros += classificacao == 'Erro'
+            nenhum += classificacao is None
+    return {
+        'regra': compilada.nome,
+        'tipo': 'sombreada' if '#' in compilada.nome else ('função' if compilada.nome.startswith('evaluate_') else 'classe'),
+        'variaveis': ', '.join(variaveis),
+        'pontos': int(indices.size),
+        'faixas': len(compilada.faixas),
+        'sem_faixa_finitos': int(lacunas.sum()),
+        'exemplos_sem_faixa': _exemplos(variaveis, entradas, lacunas),
+        'sem_faixa_infinitos': int((sem_faixa & infinito & ~nan).sum()),
+        'nan_com_faixa': int((~sem_faixa & nan).sum()),
+        'pontos_sobrepostos': int(pontos_sobrepostos.sum()),
+        'sobreposicoes': ' | '.join(sobreposicoes),
+        'faixas_nunca_alcancadas': ' | '.join(nunca),
+        'divergencias_escalar': len(divergentes),
+        'avaliador_verificado': avaliador is not None,
+        'erros_avaliador': int(erros),
+        'none_avaliador': int(nenhum),
+    }
+
+
+def relatorio_cobertura(quantidade=PONTOS_PADRAO, regras=None):
+    '''
+    Varre todas as regras da tabela e monta o relatório de cobertura.
+
+    Parâmetros:
+    - quantidade: pontos densos por variável em cada regra
+    - regras: dict {nome: Regra}; por padrão, a tabela inteira
+
+    Retorna:
+    - pd.DataFrame com uma linha por regra
+    '''
+    regras = tabela_regras() if regras is None else regras
+    manifesto = carregar_manifesto(verificar=False)
+    gerador = np.random.default_rng(0)
+    return pd.DataFrame([varrer_regra(compilada, quantidade, manifesto, gerador) for compilada in regras.values()])
+
+
+# Bloco principal: varre a tabela inteira, imprime o resumo e grava o relatório completo em CSV
+if __name__ == "__main__":
+    inicio = time.perf_counter()
+    relatorio = relatorio_cobertura()
+    duracao = time.perf_counter() - inicio
+    pd.set_option('display.width', 200)
+    pd.set_option('display.max_colwidth', 90)
+    problemas = relatorio[(relatorio['sem_faixa_finitos'] > 0) | (relatorio['sem_faixa_infinitos'] > 0) |
+                          (relatorio['pontos_sobrepostos'] > 0) | (relatorio['faixas_nunca_alcancadas'] != '') |
+                          (relatorio['divergencias_escalar'] > 0) | (relatorio['erros_avaliador'] > 0) |
+                          (relatorio['none_avaliador'] > 0)]
+    print(problemas[['regra', 'sem_faixa_finitos', 'sem_faixa_infinitos', 'pontos_sobrepostos',
+                     'faixas_nunca_alcancadas', 'erros_avaliador', 'none_avaliador']].to_string(index=False))
+    print(f"\n{relatorio['pontos'].sum():,} pontos em {len(relatorio)} regras em {duracao:.1f} s; "
+          f"{len(problemas)} regras com lacunas, sobreposições ou faixas inalcançáveis")
+    print(f"Divergências entre o caminho vetorizado e o escalar: {relatorio['divergencias_escalar'].sum()}")
+    relatorio.to_csv(ARQUIVO_RELATORIO, index=False)
+    print(f"Relatório completo em {ARQUIVO_RELATORIO}")
@@ -0,0 +1,206 @@
+# Site estático com as páginas de indicadores de todos os ativos, em todos os modelos de página.
+# Razão: as páginas (indicadores_ABEV3*.html, modelo*.html) eram geradas rodando os scripts à mão, um
+# ticker e um modelo por vez, e qualquer mudança exigia gerar tudo de novo. Aqui cada página
+# (modelo/ticker.html) tem um hash de entrada (linhas do ticker nas colunas do modelo + versão do
+# modelo, ver gerar_html_indicadores.MODELOS) guardado num manifesto ao lado do site; na reconstrução só
+# as páginas com hash diferente (ou sem arquivo) são geradas, num pool de processos quando são muitas, e
+# o índice é refeito. Ativos que saíram da planilha têm as páginas removidas (nos modelos construídos;
+# os demais modelos seguem no manifesto como estavam). As páginas pendentes de um
+# mesmo ativo são geradas juntas, numa única passada pela visão preparada do ativo (ver
+# gerar_html_indicadores.escrever_paginas).
+import contextlib
+import hashlib
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from artefatoscomprimidos import comprimir_artefatos
+from gerar_html_indicadores import (BUFFER_ARQUIVO, MODELOS, carregar_indicadores, escrever_paginas,
+                                    preparar_visao)
+
+
+# Diretório do site e manifesto com o hash de entrada de cada página gerada
+DIRETORIO_SITE = "site_indicadores"
+ARQUIVO_HASHES = "hashes.json"
+ARQUIVO_INDICE = "index.html"
+# Abaixo desse número de páginas pendentes, o pool de processos custa mais do que gerar direto
+MINIMO_POOL = 64
+
+
+def hashes_paginas(df, modelos=None):
+    '''
+    Hash de entrada de cada página: linhas do ticker (na ordem da planilha) nas colunas do modelo,
+    mais a versão do modelo.
+
+    Parâmetros:
+    - df: DataFrame de indicadores com a coluna Ativo
+    - modelos: nomes dos modelos; por padrão, todos de MODELOS
+
+    Retorna:
+    - dict {'modelo/ticker': hash}
+    '''
+    modelos = modelos or list(MODELOS)
+    # Posições das linhas de cada ativo, calculadas uma única vez para todos os modelos
+    posicoes = df.groupby("Ativo", sort=False).indices
+    hashes = {}
+    for modelo in modelos:
+        versao = MODELOS[modelo]['versao'].encode()
+        # Um hash por linha, vetorizado, só das colunas que entram no modelo
+        linhas = pd.util.hash_pandas_object(df[list(MODELOS[modelo]['colunas'])], index=False).to_numpy()
+        for ticker, posicao in posicoes.items():
+            hashes[f"{modelo}/{ticker}"] = hashlib.blake2b(linhas[posicao].tobytes() + versao,
+                                                           digest_size=16).hexdigest()
+    return hashes
+
+
+def _gerar(tarefa):
+    # Gera as páginas pendentes de um ativo (executado no pool de processos ou direto)
+    ticker, visao, destinos = tarefa
+    with contextlib.ExitStack() as pilha:
+        arquivos = {modelo: pilha.enter_context(open(destino, "w", encoding="utf-8", buffering=BUFFER_ARQUIVO))
+                    for modelo, destino in destinos.items()}
+        escrever_paginas(arquivos, ticker, visao)
+    return list(destinos.values())
+
+
+def _escrever_indice(df, modelos, paginas, diretorio):
+    # Índice: um ativo por linha, com o link de cada modelo que tem a página do ativo (paginas: chaves
+    # 'modelo/ticker' do manifesto) e a contagem por classificação
+    contagens = df.groupby(["Ativo", "Classificacao"], sort=False).size().unstack(fill_value=0)
+    classificacoes = list(contagens.columns)
+    partes = ['<!DOCTYPE html>\n<html lang="pt-br">\n<head>\n    <meta charset="utf-8">\n'
+              '    <title>Indicadores Financeiros - Ativos</title>\n    <style>\n'
+              '        body { font-family: Arial, sans-serif; padding: 20px; }\n'
+              '        table { border-collapse: collapse; }\n'
+              '        th, td { border: 1px solid #ccc; padding: 6px 10px; text-align: left; }\n'
+              '    </style>\n</head>\n<body>\n<h1>Indicadores Financeiros - Ativos</h1>\n<table>\n<tr><th>Ativo</th>',
+              ''.join(f'<th>{html.escape(modelo)}</th>' for modelo in modelos),
+              ''.join(f'<th>{html.escape(str(c))}</th>' for c in classificacoes), '</tr>\n']
+    for ticker, linha in zip(contagens.index, contagens.to_numpy().tolist()):
+        nome = html.escape(str(ticker))
+        partes.append(f'<tr><td>{nome}</td>')
+        partes.append(''.join(f'<td><a href="{modelo}/{nome}.html">{modelo}</a></td>'
+                              if f"{modelo}/{ticker}" in paginas else '<td></td>' for modelo in modelos))
+        partes.append(''.join(f'<td>{quantidade}</td>' for quantidade in linha))
+        partes.append('</tr>\n')
+    partes.append('</table>\n</body>\n</html>\n')
+    with open(os.path.join(diretorio, ARQUIVO_INDICE), "w", encoding="utf-8") as f:
+        f.write(''.join(partes))
+
+
+def construir_site(df, modelos=None, diretorio=DIRETORIO_SITE, processos=None, forcar=False, comprimir=True):
+    '''
+    Gera (ou atualiza) o site: uma página por ativo e modelo, mais o índice.
+
+    Parâmetros:
+    - df: DataFrame de indicadores com a coluna Ativo
+    - modelos: nomes dos modelos; por padrão, todos de MODELOS
+    - diretorio: diretório do site
+    - processos: processos do pool (padrão: os.cpu_count()); 1 gera tudo no processo atual
+    - forcar: se True, gera todas as páginas dos modelos mesmo com o hash igual
+    - comprimir: se True, grava os irmãos .gz/.br das páginas novas (ver artefatoscomprimidos)
+
+    Retorna:
+    - dict com páginas, geradas, puladas, removidas e segundos
+    '''
+    inicio = time.perf_counter()
+    modelos = modelos or list(MODELOS)
+    processos = processos or os.cpu_count() or 1
+    df = df.reset_index(drop=True)
+    hashes = hashes_paginas(df, modelos)
+    caminho_hashes = os.path.join(diretorio, ARQUIVO_HASHES)
+    # O manifesto anterior é lido mesmo com forcar: é ele que aponta as páginas de ativos que saíram
+    anteriores = {}
+    if os.path.exists(caminho_hashes):
+        with open(caminho_hashes, encoding="utf-8") as f:
+            anteriores = json.load(f)
+    # Páginas pendentes: hash novo ou diferente, ou arquivo apagado (com forcar, todas)
+    pendentes = [pagina for pagina, valor in hashes.items()
+                 if forcar or anteriores.get(pagina) != valor
+                 or not os.path.exists(os.path.join(diretorio, f"{pagina}.html"))]
+    # Páginas de ativos que saíram, só nos modelos desta construção: os demais modelos ficam como estão
+    removidas = [pagina for pagina in anteriores
+                 if pagina.split('/', 1)[0] in modelos and pagina not in hashes]
+    for pagina in removidas:
+        caminho = os.path.join(diretorio, f"{pagina}.html")
+        if os.path.exists(caminho):
+            os.remove(caminho)
+    for modelo in modelos:
+        os.makedirs(os.path.join(diretorio, modelo), exist_ok=True)
+    if pendentes:
+        # Páginas pendentes agrupadas por ativo; só as linhas dos ativos pendentes são preparadas
+        destinos = {}
+        for pagina in pendentes:
+            modelo, ticker = pagina.split('/', 1)
+            destinos.setdefault(ticker, {})[modelo] = os.path.join(diretorio, f"{pagina}.html")
+        posicoes = df.groupby("Ativo", sort=False).indices
+        tarefas = [(ticker, preparar_visao(df.iloc[posicoes[ticker]]), paginas) for ticker, paginas in destinos.items()]
+        if processos == 1 or len(pendentes) < MINIMO_POOL:
+            for tarefa in tarefas:
+                _gerar(tarefa)
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                # Lotes de tarefas por envio, para não pagar a comunicação página a página
+                list(executor.map(_gerar, tarefas, chunksize=max(1, len(tarefas) // (processos * 4))))
+    # Manifesto com as páginas desta construção mais as dos modelos que ficaram de fora dela
+    manifesto = {pagina: valor for pagina, valor in anteriores.items() if pagina.split('/', 1)[0] not in modelos}
+    manifesto.update(hashes)
+    if pendentes or removidas or not os.path.exists(os.path.join(diretorio, ARQUIVO_INDICE)):
+        modelos_site = [modelo for modelo in MODELOS
+                        if modelo in modelos or any(pagina.startswith(f"{modelo}/") for pagina in manifesto)]
+        _escrever_indice(df, modelos_site, manifesto, diretorio)
+    # O manifesto só é gravado depois das páginas: uma geração interrompida é refeita na próxima vez
+    temporario = caminho_hashes + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(manifesto, f, sort_keys=True)
+    os.replace(temporario, caminho_hashes)
+    if comprimir:
+        comprimir_artefatos(diretorio)
+    return {'paginas': len(hashes), 'geradas': len(pendentes), 'puladas': len(hashes) - len(pendentes),
+            'removidas': len(removidas), 'segundos': time.perf_counter() - inicio}
+
+
+def universo_sintetico(df, quantidade=400):
+    '''
+    Universo de teste com quantidade de ativos: as linhas reais de cada ativo repetidas com tickers
+    derivados (ABEV3, ABEV3_1, ABEV3_2...).
+    '''
+    ativos = df["Ativo"].unique().tolist()
+    partes = []
+    for i in range(quantidade):
+        linhas = df[df["Ativo"] == ativos[i % len(ativos)]].copy()
+        repeticao = i // len(ativos)
+        if repeticao:
+            linhas["Ativo"] = f"{ativos[i % len(ativos)]}_{repeticao}"
+        partes.append(linhas)
+    return pd.concat(partes, ignore_index=True)
+
+
+def _resumir(rotulo, resumo):
+    # Linha do benchmark
+    print(f"  {rotulo} {resumo['geradas']} geradas, {resumo['puladas']} puladas em {resumo['segundos']:.3f} s")
+
+
+# Bloco principal: site do universo da planilha e benchmark com 400 ativos × todos os modelos (geração
+# completa, reconstrução sem mudança e reconstrução depois de mudar um único ativo). Os tempos não
+# incluem a leitura da planilha.
+if __name__ == "__main__":
+    import shutil
+
+    dados = carregar_indicadores()
+    resumo = construir_site(dados)
+    print(f"Site em {DIRETORIO_SITE}/: {resumo['paginas']} páginas, {resumo['geradas']} geradas em {resumo['segundos']:.2f} s")
+    universo = universo_sintetico(dados, 400)
+    diretorio = os.path.join(DIRETORIO_SITE, "benchmark")
+    shutil.rmtree(diretorio, ignore_errors=True)
+    print(f"Benchmark: {universo['Ativo'].nunique()} ativos × {len(MODELOS)} modelos ({len(universo)} linhas)")
+    _resumir("geração completa:", construir_site(universo, diretorio=diretorio))
+    _resumir("sem mudança:     ", construir_site(universo, diretorio=diretorio))
+    # Revisão dos valores de um único ativo
+    universo.loc[universo["Ativo"] == "ABEV3", "Valor"] *= 1.01
+    _resumir("um ativo mudou:  ", construir_site(universo, diretorio=diretorio))
+    shutil.rmtree(diretorio, ignore_errors=True)
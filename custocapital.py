@@ -0,0 +1,141 @@
+# Cálculo em lote do custo de capital (CAPM e WACC) para todo o universo de ativos.
+# Razão: WACCEvaluator.calcular_wacc é escalar e exige o custo do equity calculado à mão.
+# Aqui o custo do equity vem do CAPM a partir do beta de cada ativo e o WACC é calculado de uma vez
+# para todos os ativos a partir das colunas 'Valor de mercado' e 'Divida bruta' já coletadas por
+# soup_to_dict (robov8), com o resultado classificado pelas faixas de WACCEvaluator e pronto para
+# alimentar o FCD em lote (fluxodecaixareverso).
+import numpy as np
+import pandas as pd
+
+from analiseativos import WACCEvaluator
+
+
+# Chaves de soup_to_dict usadas na estrutura de capital
+CHAVE_VALOR_MERCADO = 'Valor de mercado'
+CHAVE_DIVIDA_BRUTA = 'Divida bruta'
+
+
+def custo_equity_capm(taxa_livre_risco, beta, premio_risco):
+    '''
+    Custo do capital próprio pelo CAPM: Re = Rf + β × (prêmio de risco de mercado).
+    Aceita escalares ou arrays (um beta por ativo).
+    '''
+    return taxa_livre_risco + beta * premio_risco
+
+
+def betas_de_retornos(retornos_acoes, retornos_mercado):
+    '''
+    Beta de todos os ativos de uma vez: Cov(Rₐ, Rₘ) / Var(Rₘ), mesma fórmula de BetaEvaluator.calcular_beta.
+
+    Parâmetros:
+    - retornos_acoes: pd.DataFrame (períodos × tickers) de retornos
+    - retornos_mercado: pd.Series com os retornos do índice nos mesmos períodos
+
+    Retorna:
+    - pd.Series com o beta por ticker
+    '''
+    # Centraliza as séries e calcula covariâncias amostrais de todas as colunas em uma operação
+    acoes = retornos_acoes.to_numpy(dtype=float)
+    mercado = np.asarray(retornos_mercado, dtype=float)
+    desvio_mercado = mercado - mercado.mean()
+    covariancias = (desvio_mercado @ (acoes - acoes.mean(axis=0))) / (len(mercado) - 1)
+    variancia_mercado = desvio_mercado @ desvio_mercado / (len(mercado) - 1)
+    return pd.Series(covariancias / variancia_mercado, index=retornos_acoes.columns)
+
+
+def calcular_wacc_lote(equity, divida, custo_equity, custo_divida, taxa_imposto):
+    '''
+    WACC = (E/V) × Re + (D/V) × Rd × (1 - Tc) para arrays de ativos.
+    Ativos com V = E + D igual a zero (ou dados ausentes) recebem NaN em vez de gerar erro.
+    '''
+    # Converte as entradas em arrays de float
+    equity = np.asarray(equity, dtype=float)
+    divida = np.asarray(divida, dtype=float)
+    valor_total = equity + divida
+    # Protege a divisão por zero: V = 0 vira NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valor_total = np.where(valor_total == 0, np.nan, valor_total)
+        return (equity / valor_total) * np.asarray(custo_equity, dtype=float) + \
+            (divida / valor_total) * np.asarray(custo_divida, dtype=float) * (1 - np.asarray(taxa_imposto, dtype=float))
+
+
+def estrutura_capital(dict_stocks):
+    '''
+    Extrai valor de mercado e dívida bruta de todos os ativos.
+
+    Parâmetros:
+    - dict_stocks: dict {ticker: dict de soup_to_dict} ou o DataFrame indicadores × tickers
+      gravado em stocks_data.xlsx
+
+    Retorna:
+    - pd.DataFrame indexado por ticker com as colunas 'valor_mercado' e 'divida_bruta'
+    '''
+    # Mesmo formato de stocks_data.xlsx: linhas = indicadores, colunas = tickers
+    df = dict_stocks if isinstance(dict_stocks, pd.DataFrame) else pd.DataFrame(dict_stocks)
+    # Valores de soup_to_dict já vêm sem separador de milhar; demais entradas inválidas viram NaN
+    return pd.DataFrame({
+        'valor_mercado': pd.to_numeric(df.loc[CHAVE_VALOR_MERCADO], errors='coerce'),
+        'divida_bruta': pd.to_numeric(df.loc[CHAVE_DIVIDA_BRUTA], errors='coerce'),
+    })
+
+
+def calcular_wacc_universo(dict_stocks, betas, taxa_livre_risco, premio_risco, custo_divida, taxa_imposto=0.34):
+    '''
+    Calcula custo do equity (CAPM) e WACC de todos os ativos e classifica pelas faixas de WACCEvaluator.
+
+    Parâmetros:
+    - dict_stocks: dados de soup_to_dict (ver estrutura_capital)
+    - betas: pd.Series/dict {ticker: beta}
+    - taxa_livre_risco: taxa livre de risco (ex.: Selic)
+    - premio_risco: prêmio de risco de mercado
+    - custo_divida: custo da dívida antes de impostos (escalar ou pd.Series por ticker)
+    - taxa_imposto: alíquota efetiva (escalar ou pd.Series por ticker)
+
+    Retorna:
+    - pd.DataFrame indexado por ticker com 'beta', 'custo_equity', 'wacc', 'Classificacao' e 'Faixa'
+    '''
+    df = estrutura_capital(dict_stocks)
+    # Alinha beta, custo da dívida e imposto pelo ticker (valores ausentes viram NaN)
+    df['beta'] = pd.Series(betas, dtype=float).reindex(df.index)
+    custo_divida = pd.Series(custo_divida, index=df.index, dtype=float) if np.isscalar(custo_divida) \
+        else pd.Series(custo_divida, dtype=float).reindex(df.index)
+    taxa_imposto = pd.Series(taxa_imposto, index=df.index, dtype=float) if np.isscalar(taxa_imposto) \
+        else pd.Series(taxa_imposto, dtype=float).reindex(df.index)
+    # CAPM e WACC vetorizados para o universo inteiro
+    df['custo_equity'] = custo_equity_capm(taxa_livre_risco, df['beta'].to_numpy(), premio_risco)
+    df['wacc'] = calcular_wacc_lote(df['valor_mercado'], df['divida_bruta'], df['custo_equity'],
+                                    custo_divida, taxa_imposto)
+    # Classifica o WACC já calculado pelas faixas de WACCEvaluator (sem recalcular)
+    avaliador = WACCEvaluator()
+    resultados = [avaliador.avaliar_wacc(float(wacc)) for wacc in df['wacc']]
+    df['Classificacao'] = [r.classificacao for r in resultados]
+    df['Faixa'] = [r.faixa for r in resultados]
+    return df
+
+
+# Bloco principal para testes
+if __name__ == "__main__":
+    from fluxodecaixareverso import resolver_crescimento_implicito
+    from leituraplanilhas import ler_planilha
+
+    # Usa os dados coletados pelo robô (linhas = indicadores, colunas = tickers)
+    stocks = ler_planilha('stocks_data.xlsx', index_col='indicadores')
+    tickers = stocks.columns[:6]
+    betas = pd.Series(np.linspace(0.5, 1.5, len(tickers)), index=tickers)
+    universo = calcular_wacc_universo(stocks[tickers], betas, taxa_livre_risco=0.15, premio_risco=0.055,
+                                      custo_divida=0.13)
+    print(universo.to_string())
+
+    # Conferência com o cálculo escalar de WACCEvaluator
+    avaliador = WACCEvaluator()
+    for ticker, linha in universo.dropna(subset=['wacc']).iterrows():
+        escalar = avaliador.calcular_wacc(linha['valor_mercado'], linha['divida_bruta'],
+                                          linha['custo_equity'], 0.13, 0.34)
+        assert abs(escalar - linha['wacc']) < 1e-12, ticker
+
+    # O WACC em lote alimenta diretamente o FCD em lote (crescimento implícito no preço)
+    valor_firma = pd.to_numeric(stocks.loc['Valor de firma', tickers], errors='coerce').to_numpy()
+    fcf_estimado = 0.08 * universo['valor_mercado'].to_numpy()
+    implicito = resolver_crescimento_implicito(fcf_estimado, valor_firma, universo['wacc'].to_numpy(), 0.03)
+    print(pd.DataFrame({'crescimento_implicito': implicito['crescimento'], 'status': implicito['status']},
+                       index=tickers))
@@ -0,0 +1,190 @@
+# Núcleo de desconto de fluxos de caixa compartilhado por FCDEvaluator, FCFEvaluator e dcf_valuation.
+# Razão: cada rotina recalculava (1 + WACC)ᵗ com exponenciação a cada fluxo e a cada chamada.
+# Aqui o vetor de fatores de desconto é calculado uma única vez por (WACC, anos) com multiplicação
+# acumulada e reaproveitado, e projeções de crescimento constante usam a soma da série geométrica.
+import math
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def fatores_desconto(wacc, anos):
+    '''
+    Retorna a tupla (1/(1+WACC)¹, ..., 1/(1+WACC)ⁿ), calculada uma vez por (WACC, anos).
+
+    Parâmetros:
+    - wacc: taxa de desconto (decimal, ex.: 0.10)
+    - anos: número de períodos
+
+    Retorna:
+    - tuple: fatores de desconto de cada ano
+    '''
+    # Multiplicação acumulada evita exponenciação repetida a cada fluxo
+    fator = 1.0 / (1.0 + wacc)
+    fatores = []
+    acumulado = 1.0
+    for _ in range(anos):
+        acumulado *= fator
+        fatores.append(acumulado)
+    return tuple(fatores)
+
+
+def fluxo_caixa_livre(ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex):
+    '''
+    FCF/FCFF de um ano: EBIT × (1 - Taxa de Imposto) + D&A - Variação do Capital de Giro - CAPEX.
+    '''
+    # Fórmula única usada por FCDEvaluator.calcular_fcff e FCFEvaluator.calcular_fcf
+    return (ebit * (1 - taxa_imposto)) + depreciacao_amortizacao - variacao_capital_giro - capex
+
+
+def projetar_fluxos(fluxo_atual, crescimento, anos):
+    '''
+    Projeta FCF₀ × (1 + g)ᵗ para t = 1..n com multiplicação acumulada.
+    '''
+    # Cada ano multiplica o anterior por (1 + g), sem recalcular a potência
+    fluxos = []
+    fluxo = fluxo_atual
+    for _ in range(anos):
+        fluxo *= (1 + crescimento)
+        fluxos.append(fluxo)
+    return fluxos
+
+
+def valor_presente(fluxos, wacc):
+    '''
+    Σ fluxoₜ / (1 + WACC)ᵗ usando o vetor de fatores em cache.
+    '''
+    # Produto escalar entre os fluxos e os fatores pré-calculados
+    return math.fsum(f * d for f, d in zip(fluxos, fatores_desconto(wacc, len(fluxos))))
+
+
+def soma_geometrica(razao, anos):
+    '''
+    Σ razãoᵗ para t = 1..n em forma fechada: razão × (1 - razãoⁿ) / (1 - razão).
+    '''
+    # Caso degenerado razão = 1: a soma é simplesmente n
+    if abs(razao - 1.0) < 1e-12:
+        return float(anos)
+    return razao * (1 - razao ** anos) / (1 - razao)
+
+
+def valor_presente_crescimento_constante(fluxo_atual, crescimento, wacc, anos):
+    '''
+    Valor presente de FCF₀ × (1 + g)ᵗ descontado a WACC para t = 1..n, sem laço.
+
+    Com q = (1 + g) / (1 + WACC): VP = FCF₀ × q × (1 - qⁿ) / (1 - q).
+    '''
+    # Uma única série geométrica substitui a projeção e o desconto ano a ano
+    return fluxo_atual * soma_geometrica((1 + crescimento) / (1 + wacc), anos)
+
+
+def valor_terminal_gordon(ultimo_fluxo, wacc, crescimento_terminal):
+    '''
+    Valor terminal de Gordon: fluxoₙ × (1 + gₜ) / (WACC - gₜ).
+    '''
+    # O chamador é responsável por garantir WACC > gₜ
+    return ultimo_fluxo * (1 + crescimento_terminal) / (wacc - crescimento_terminal)
+
+
+def valor_fcd(fluxos, wacc, crescimento_terminal):
+    '''
+    FCD de fluxos explícitos arbitrários mais perpetuidade de Gordon.
+
+    Retorna:
+    - tuple: (VP dos fluxos explícitos, valor terminal, VP do valor terminal)
+    '''
+    # Reaproveita o mesmo vetor de fatores para os fluxos e para o valor terminal
+    fatores = fatores_desconto(wacc, len(fluxos))
+    vp_fluxos = math.fsum(f * d for f, d in zip(fluxos, fatores))
+    valor_terminal = valor_terminal_gordon(fluxos[-1], wacc, crescimento_terminal)
+    return vp_fluxos, valor_terminal, valor_terminal * fatores[-1]
+
+
+def valor_fcd_crescimento_constante(fluxo_atual, crescimento, wacc, crescimento_terminal, anos):
+    '''
+    FCD completo (período explícito com crescimento constante + perpetuidade) em forma fechada.
+
+    Retorna:
+    - tuple: (VP dos fluxos explícitos, valor terminal, VP do valor terminal)
+    '''
+    # Fluxos explícitos pela série geométrica; último fluxo e desconto pelas potências diretas
+    vp_fluxos = valor_presente_crescimento_constante(fluxo_atual, crescimento, wacc, anos)
+    ultimo_fluxo = fluxo_atual * (1 + crescimento) ** anos
+    valor_terminal = valor_terminal_gordon(ultimo_fluxo, wacc, crescimento_terminal)
+    return vp_fluxos, valor_terminal, valor_terminal * fatores_desconto(wacc, anos)[-1]
+
+
+# Bloco principal para testes de paridade e benchmark
+if __name__ == "__main__":
+    import random
+    import timeit
+
+    # Implementação original (laço com exponenciação), mantida aqui apenas como referência
+    def fcd_original(fcffs, wacc, g_terminal):
+        vp = 0
+        for t in range(1, len(fcffs) + 1):
+            vp += fcffs[t - 1] / ((1 + wacc) ** t)
+        vt = fcffs[-1] * (1 + g_terminal) / (wacc - g_terminal)
+        return vp + vt / ((1 + wacc) ** len(fcffs))
+
+    def dcf_original(fcf, g, anos, wacc, g_terminal):
+        projetados = [fcf * (1 + g) ** (i + 1) for i in range(anos)]
+        return fcd_original(projetados, wacc, g_terminal)
+
+    # Paridade numérica em entradas aleatórias
+    random.seed(42)
+    pior_erro = 0.0
+    for _ in range(10000):
+        fcf = random.uniform(1e6, 1e11)
+        g = random.uniform(0, 0.5)
+        wacc = random.uniform(0.06, 0.20)
+        g_terminal = random.uniform(0, 0.05)
+        anos = random.randint(1, 15)
+        referencia = dcf_original(fcf, g, anos, wacc, g_terminal)
+        fechado = sum(valor_fcd_crescimento_constante(fcf, g, wacc, g_terminal, anos)[::2])
+        explicito = sum(valor_fcd(projetar_fluxos(fcf, g, anos), wacc, g_terminal)[::2])
+        pior_erro = max(pior_erro, abs(fechado - referencia) / referencia, abs(explicito - referencia) / referencia)
+    print(f"Paridade: maior erro relativo = {pior_erro:.2e}")
+    assert pior_erro < 1e-12
+
+    # Benchmark: custo por avaliação com o mesmo WACC (cenário típico de varredura de crescimento)
+    n = 20000
+    antes = timeit.timeit(lambda: dcf_original(84.69e9, 0.03, 10, 0.10, 0.02), number=n)
+    depois = timeit.timeit(lambda: valor_fcd_crescimento_constante(84.69e9, 0.03, 0.10, 0.02, 10), number=n)
+    print(f"Laço original:  {antes / n * 1e6:.2f} µs por avaliação")
+    print(f"Forma fechada:  {depois / n * 1e6:.2f} µs por avaliação ({antes / depois:.1f}x)")
+
+    # Benchmark nos pontos de chamada reais: FCDEvaluator (fluxos projetados × forma fechada),
+    # MotorCenarios e as duas cópias de dcf_valuation (saída de depuração descartada)
+    import contextlib
+    import io
+
+    from analiseativos import FCDEvaluator
+    from cenarios import MotorCenarios
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Os dois scripts executam o exemplo ao serem importados
+        import fluxodecaixagrok3
+        import fluxodecaixagrok3brasil
+
+    avaliador = FCDEvaluator()
+    explicito = avaliador.calcular_fcd(projetar_fluxos(84.69e9, 0.03, 10), 0.10, 0.02, 10)
+    fechado = avaliador.calcular_fcd_crescimento_constante(84.69e9, 0.03, 0.10, 0.02, 10)
+    assert abs(fechado - explicito) / explicito < 1e-12
+    antes = timeit.timeit(
+        lambda: avaliador.calcular_fcd(projetar_fluxos(84.69e9, 0.03, 10), 0.10, 0.02, 10), number=n)
+    depois = timeit.timeit(
+        lambda: avaliador.calcular_fcd_crescimento_constante(84.69e9, 0.03, 0.10, 0.02, 10), number=n)
+    print(f"FCDEvaluator.calcular_fcd (fluxos projetados):           {antes / n * 1e6:.2f} µs")
+    print(f"FCDEvaluator.calcular_fcd_crescimento_constante:         {depois / n * 1e6:.2f} µs ({antes / depois:.1f}x)")
+
+    dados = {f"ATV{i}": {'beta': 0.8 + i % 7 / 10, 'valor_mercado': 1e10 + i * 1e7, 'divida_bruta': 4e9,
+                         'custo_divida': 0.12, 'taxa_imposto': 0.34, 'fcf_atual': 1e9 + i * 1e6,
+                         'crescimento': 0.02 + i % 11 / 100, 'valor_firma': 1.4e10,
+                         'receita_inicial': 8e9, 'receita_final': 1e10} for i in range(2000)}
+    tempo = timeit.timeit(lambda: MotorCenarios(dados).avaliar(), number=3) / 3
+    print(f"MotorCenarios.avaliar (2.000 ativos × 3 cenários):       {tempo * 1e3:.1f} ms")
+
+    for modulo in (fluxodecaixagrok3, fluxodecaixagrok3brasil):
+        with contextlib.redirect_stdout(io.StringIO()):
+            tempo = timeit.timeit(lambda: modulo.dcf_valuation(84.69e9, 0.03, 10, 0.10, 0.02, 12.89e9, 162e9),
+                                  number=n)
+        print(f"{modulo.__name__}.dcf_valuation:{' ' * (33 - len(modulo.__name__))}{tempo / n * 1e6:.2f} µs")
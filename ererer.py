@@ -1,13 +1,18 @@
 import ast
 import json
+import os
 
 def extrair_classes_e_parametros(arquivo_codigo):
     """
     Analisa um arquivo Python usando AST para extrair classes, métodos e seus parâmetros.
     Retorna uma lista de dicionários com as informações.
     """
-    with open('analiseativos.py', 'r', encoding='utf-8') as f:
-        codigo_fonte = f.read()
+    # analiseativos agora é um pacote: junta o código de todos os submódulos
+    codigo_fonte = ''
+    for nome in sorted(os.listdir('analiseativos')):
+        if nome.endswith('.py'):
+            with open(os.path.join('analiseativos', nome), 'r', encoding='utf-8') as f:
+                codigo_fonte += f.read() + '\n'
 
     # Parsear o código fonte em uma AST
     arvore = ast.parse(codigo_fonte)
@@ -4,6 +4,9 @@
 # Implicação financeira: Evita erros de precisão em cálculos com números grandes, comum em valuations de megacaps como AAPL.
 import numpy as np
 
+# Núcleo de desconto compartilhado com FCDEvaluator/FCFEvaluator (fatores de desconto em cache por WACC).
+from descontos import projetar_fluxos, valor_fcd_crescimento_constante
+
 
 # Definindo a função principal para calcular o valuation por Fluxo de Caixa Descontado (DCF).
 # Esta função encapsula toda a lógica do modelo DCF, permitindo reutilização para diferentes empresas.
@@ -79,7 +82,7 @@ def dcf_valuation(current_fcf, growth_rate, years, wacc, terminal_growth_rate, s
     #   ... até t=5: $122.753B
     # Implicação financeira: Captura o "alto crescimento" inicial; sensível a growth_rate – pequeno aumento pode dobrar o valor final.
     # Depuração: Imprime os FCFs projetados para verificação.
-    projected_fcfs = [current_fcf * (1 + growth_rate) ** (i + 1) for i in range(years)]
+    projected_fcfs = projetar_fluxos(current_fcf, growth_rate, years)
     print("[Depuração] Fluxos de Caixa Projetados:",
           [f"${fcf:,.2f}" for fcf in projected_fcfs])  # Logging opcional para rastrear
 
@@ -99,34 +102,32 @@ def dcf_valuation(current_fcf, growth_rate, years, wacc, terminal_growth_rate, s
     #   TV = 126.436B / 0.06 = $2,107.255B
     # Implicação financeira: TV captura o "valor residual" da empresa; sensível ao denominador – pequena redução em wacc aumenta TV dramaticamente.
     # Referência: Modelo de Gordon (1959), amplamente usado em finanças corporativas.
-    terminal_value = last_fcf * (1 + terminal_growth_rate) / (wacc - terminal_growth_rate)
+    # Valor Terminal, VP dos fluxos explícitos e VP do TV saem juntos da forma fechada do núcleo de desconto
+    # (série geométrica com q = (1 + growth_rate) / (1 + wacc)), sem descontar ano a ano.
+    explicit_pv, terminal_value, terminal_pv = valor_fcd_crescimento_constante(
+        current_fcf, growth_rate, wacc, terminal_growth_rate, years)
     print(f"[Depuração] Valor Terminal Calculado: ${terminal_value:,.2f}")  # Logging para rastrear
 
-    # Passo 4: Combina os fluxos de caixa explícitos com o Valor Terminal no último ano.
-    # Razão: O TV é recebido no final do último ano explícito, então é somado ao FCF desse ano para desconto conjunto.
-    # Exemplo: all_cash_flows = [$100.989B, $106.038B, $111.340B, $116.907B, ($122.753B + $2,107.255B)]
+    # Passo 4: Desconta o Valor Terminal junto com o último ano explícito.
+    # Razão: O TV é recebido no final do último ano explícito, então usa o mesmo fator de desconto desse ano: TV / (1 + wacc)^years.
     # Implicação: Garante que o TV seja descontado corretamente como um fluxo futuro.
-    all_cash_flows = projected_fcfs[:-1] + [projected_fcfs[-1] + terminal_value]
-    print("[Depuração] Todos os Fluxos de Caixa (incluindo TV):",
-          [f"${cf:,.2f}" for cf in all_cash_flows])  # Logging para verificação
+    print(f"[Depuração] VP dos Fluxos Explícitos: ${explicit_pv:,.2f}")
+    print(f"[Depuração] VP do Valor Terminal: ${terminal_pv:,.2f}")
 
-    # Passo 5: Calcula o Valor Presente (PV) total dos fluxos de caixa usando desconto composto.
-    # Fórmula matemática: PV = Σ [cash_flow_t / (1 + wacc)^t] para t=1 a years, onde cash_flow_years inclui TV.
+    # Passo 5: Calcula o Valor Presente (PV) total: VP dos fluxos explícitos + VP do Valor Terminal.
+    # Fórmula matemática: PV = Σ [FCF_t / (1 + wacc)^t] + TV / (1 + wacc)^years, com a soma em forma fechada:
+    #   Σ FCF_t / (1 + wacc)^t = current_fcf * q * (1 - q^years) / (1 - q), q = (1 + growth_rate) / (1 + wacc).
     # Razão: Reflete o "valor do dinheiro no tempo" – fluxos futuros valem menos hoje devido a risco e oportunidade.
-    # Exemplo detalhado para AAPL:
+    # Exemplo detalhado (ano a ano, mesmo total da forma fechada):
     #   t=1: $100.989B / (1+0.09)^1 ≈ $92.650B
     #   t=2: $106.038B / (1+0.09)^2 ≈ $89.235B
     #   t=3: $111.340B / (1+0.09)^3 ≈ $86.052B
     #   t=4: $116.907B / (1+0.09)^4 ≈ $82.840B
     #   t=5: ($122.753B + $2,107.255B) / (1+0.09)^5 ≈ $1,549.272B
     #   Total PV ≈ $1,800.049B
-    # Implicação: O loop garante precisão; para anos>10, considere vetorização com NumPy para performance.
     # Referência: Conceito central do DCF, baseado em Irving Fisher (1930).
-    present_value = 0
-    for t, cash_flow in enumerate(all_cash_flows, start=1):
-        discounted_cf = cash_flow / (1 + wacc) ** t  # Cálculo individual para cada fluxo
-        present_value += discounted_cf
-        print(f"[Depuração] Fluxo Descontado Ano {t}: ${discounted_cf:,.2f}")  # Logging detalhado por ano
+    present_value = explicit_pv + terminal_pv
+    print(f"[Depuração] Valor Presente Total: ${present_value:,.2f}")
 
     # Passo 6: Calcula o Valor do Patrimônio Líquido (Equity Value).
     # Fórmula: Equity Value = PV - net_debt
@@ -5,6 +5,9 @@
 # Referência: NumPy é amplamente usado em finanças quantitativas (ex.: QuantLib, Python for Finance).
 import numpy as np
 
+# Núcleo de desconto compartilhado com FCDEvaluator/FCFEvaluator (fatores de desconto em cache por WACC).
+from descontos import projetar_fluxos, valor_fcd_crescimento_constante
+
 
 # Definindo a função principal para calcular o valuation por Fluxo de Caixa Descontado (DCF).
 # Esta função encapsula o modelo DCF completo, permitindo reutilização para PETR4 ou outras ações.
@@ -90,7 +93,7 @@ def dcf_valuation(current_fcf, growth_rate, years, wacc, terminal_growth_rate, s
     # Implicação financeira: Projeções explícitas são a base do DCF; erros em growth_rate amplificam o valor terminal.
     # Referência: Crescimento composto, Damodaran (2012).
     # Depuração: Imprime FCFs projetados para verificação detalhada.
-    projected_fcfs = [current_fcf * (1 + growth_rate) ** (i + 1) for i in range(years)]
+    projected_fcfs = projetar_fluxos(current_fcf, growth_rate, years)
     print("[Depuração] Fluxos de Caixa Projetados:", [f"R${fcf:,.2f}" for fcf in projected_fcfs])
 
     # Passo 2: Extrai o último FCF projetado, que serve como base para o Valor Terminal.
@@ -112,23 +115,23 @@ def dcf_valuation(current_fcf, growth_rate, years, wacc, terminal_growth_rate, s
     # Implicação financeira: O TV representa a maior parte do valor da empresa (60-80% em empresas maduras como PETR4); sensível ao denominador (wacc - terminal_growth_rate).
     # Referência: Gordon Growth Model (1959), usado em Damodaran (2012).
     # Depuração: Imprime TV para verificação.
-    terminal_value = last_fcf * (1 + terminal_growth_rate) / (wacc - terminal_growth_rate)
+    # Valor Terminal, VP dos fluxos explícitos e VP do TV saem juntos da forma fechada do núcleo de desconto
+    # (série geométrica com q = (1 + growth_rate) / (1 + wacc)), sem descontar ano a ano.
+    explicit_pv, terminal_value, terminal_pv = valor_fcd_crescimento_constante(
+        current_fcf, growth_rate, wacc, terminal_growth_rate, years)
     print(f"[Depuração] Valor Terminal Calculado: R${terminal_value:,.2f}")
 
-    # Passo 4: Combina os fluxos de caixa explícitos com o Valor Terminal no último ano.
-    # Razão: O TV é recebido no final do último ano explícito (ano 5), então é somado ao FCF desse ano para desconto conjunto.
-    # Exemplo para PETR4:
-    #   projected_fcfs = [87.2307B, 89.8478B, 92.5432B, 95.3195B, 98.1791B]
-    #   all_cash_flows = [87.2307B, 89.8478B, 92.5432B, 95.3195B, (98.1791B + 1,251.7838B)] = [..., 1,349.9629B]
-    # Implicação: Garante que o TV seja descontado corretamente como fluxo futuro.
-    # Referência: Estrutura padrão de DCF.
-    all_cash_flows = projected_fcfs[:-1] + [projected_fcfs[-1] + terminal_value]
-    print("[Depuração] Todos os Fluxos de Caixa (incluindo TV):", [f"R${cf:,.2f}" for cf in all_cash_flows])
-
-    # Passo 5: Calcula o Valor Presente (PV) total dos fluxos de caixa usando desconto composto.
-    # Fórmula matemática: PV = Σ [cash_flow_t / (1 + wacc)^t], para t=1 até years, onde cash_flow_years inclui o TV.
-    # Razão: Aplica o conceito de valor do dinheiro no tempo, descontando fluxos futuros ao valor presente para refletir risco e custo de oportunidade.
-    # Exemplo detalhado para PETR4 (wacc=0.10):
+    # Passo 4: Desconta o Valor Terminal junto com o último ano explícito.
+    # Razão: O TV é recebido no final do último ano explícito, então usa o mesmo fator de desconto desse ano: TV / (1 + wacc)^years.
+    # Implicação: Garante que o TV seja descontado corretamente como um fluxo futuro.
+    print(f"[Depuração] VP dos Fluxos Explícitos: R${explicit_pv:,.2f}")
+    print(f"[Depuração] VP do Valor Terminal: R${terminal_pv:,.2f}")
+
+    # Passo 5: Calcula o Valor Presente (PV) total: VP dos fluxos explícitos + VP do Valor Terminal.
+    # Fórmula matemática: PV = Σ [FCF_t / (1 + wacc)^t] + TV / (1 + wacc)^years, com a soma em forma fechada:
+    #   Σ FCF_t / (1 + wacc)^t = current_fcf * q * (1 - q^years) / (1 - q), q = (1 + growth_rate) / (1 + wacc).
+    # Razão: Reflete o "valor do dinheiro no tempo" – fluxos futuros valem menos hoje devido a risco e oportunidade.
+    # Exemplo detalhado (ano a ano, mesmo total da forma fechada):
     #   Ano 1: 87.2307B / (1 + 0.10)^1 = R$ 79.3006B
     #   Ano 2: 89.8478B / (1 + 0.10)^2 = R$ 74.3213B
     #   Ano 3: 92.5432B / (1 + 0.10)^3 = R$ 69.5552B
@@ -137,12 +140,8 @@ def dcf_valuation(current_fcf, growth_rate, years, wacc, terminal_growth_rate, s
     #   Total PV = 79.3006B + 74.3213B + 69.5552B + 65.1012B + 837.8535B = R$ 1,126.1318B
     # Implicação financeira: O PV é o valor da empresa hoje (Enterprise Value); sensível ao WACC – aumento de 1% pode reduzir PV em 10-20%.
     # Referência: Irving Fisher (1930), conceito de valor presente; Damodaran (2012).
-    # Depuração: Imprime cada fluxo descontado para transparência.
-    present_value = 0
-    for t, cash_flow in enumerate(all_cash_flows, start=1):
-        discounted_cf = cash_flow / (1 + wacc) ** t  # Calcula o valor presente de cada fluxo
-        present_value += discounted_cf
-        print(f"[Depuração] Fluxo Descontado Ano {t}: R${discounted_cf:,.2f}")
+    present_value = explicit_pv + terminal_pv
+    print(f"[Depuração] Valor Presente Total: R${present_value:,.2f}")
 
     # Passo 6: Calcula o Valor do Patrimônio Líquido (Equity Value).
     # Fórmula: Equity Value = PV - net_debt.
@@ -0,0 +1,248 @@
+# FCD reverso: descobre o crescimento (ou o WACC) que o preço de mercado já embute.
+# Usa exatamente o mesmo modelo de FCDEvaluator.calcular_fcd / dcf_valuation:
+#   EV = Σ [FCF₀ × (1 + g)ᵗ / (1 + WACC)ᵗ] + FCF₀ × (1 + g)ⁿ × (1 + gₜ) / (WACC - gₜ) / (1 + WACC)ⁿ
+# e resolve a equação EV_modelo = EV_mercado para todos os ativos ao mesmo tempo, com
+# Newton protegido por intervalo (bisseção quando o passo de Newton sai do intervalo).
+import numpy as np
+import pandas as pd
+
+from analiseativos import CrescimentoImplicitoEvaluator
+
+
+# Status possíveis de cada ativo após a resolução
+STATUS_CONVERGIU = 'convergiu'
+STATUS_SEM_RAIZ = 'sem_raiz_no_intervalo'
+STATUS_MAX_ITERACOES = 'max_iteracoes'
+STATUS_ENTRADA_INVALIDA = 'entrada_invalida'
+
+
+def valor_firma_dcf(fcf_atual, crescimento, wacc, crescimento_terminal, anos=5):
+    '''
+    Calcula o Enterprise Value pelo modelo FCD e suas derivadas em relação a g e ao WACC.
+
+    Parâmetros:
+    - fcf_atual: FCF atual (escalar ou array por ativo)
+    - crescimento: taxa de crescimento do período explícito (escalar ou array)
+    - wacc: custo médio ponderado de capital (escalar ou array)
+    - crescimento_terminal: taxa de crescimento perpétuo (escalar ou array)
+    - anos: número de anos do período explícito
+
+    Retorna:
+    - tuple: (valor da firma, derivada em relação ao crescimento, derivada em relação ao WACC)
+    '''
+    # Converte as entradas em arrays de float para operar em lote
+    fcf_atual = np.asarray(fcf_atual, dtype=float)
+    crescimento = np.asarray(crescimento, dtype=float)
+    wacc = np.asarray(wacc, dtype=float)
+    crescimento_terminal = np.asarray(crescimento_terminal, dtype=float)
+    # Vetor de anos 1..n, na última dimensão, para projetar todos os fluxos de uma vez
+    t = np.arange(1, anos + 1, dtype=float)
+    # Razão q = (1 + g) / (1 + WACC): cada fluxo descontado é FCF₀ × qᵗ
+    q = ((1 + crescimento) / (1 + wacc))[..., None]
+    q_t = q ** t
+    # Valor presente dos fluxos explícitos
+    soma_explicita = q_t.sum(axis=-1)
+    # Valor terminal descontado: FCF₀ × qⁿ × (1 + gₜ) / (WACC - gₜ)
+    spread = wacc - crescimento_terminal
+    fator_terminal = (1 + crescimento_terminal) / spread
+    q_n = q_t[..., -1]
+    valor = fcf_atual * (soma_explicita + q_n * fator_terminal)
+    # Derivada de qᵗ em relação a q: t × qᵗ⁻¹
+    dq_t = (t * q_t / q).sum(axis=-1)
+    dq_n = anos * q_n / q[..., 0]
+    # dq/dg = 1 / (1 + WACC)  e  dq/dWACC = -(1 + g) / (1 + WACC)²
+    dq_dg = 1 / (1 + wacc)
+    dq_dw = -(1 + crescimento) / (1 + wacc) ** 2
+    derivada_g = fcf_atual * (dq_t + dq_n * fator_terminal) * dq_dg
+    # No WACC também varia o denominador do valor terminal
+    derivada_w = fcf_atual * ((dq_t + dq_n * fator_terminal) * dq_dw - q_n * fator_terminal / spread)
+    return valor, derivada_g, derivada_w
+
+
+def valor_mercado_firma(preco, acoes, divida_liquida=0):
+    '''
+    Converte preço por ação em Enterprise Value de mercado (EV = preço × ações + dívida líquida).
+    '''
+    # Opera em lote para todo o universo de ativos
+    return np.asarray(preco, dtype=float) * np.asarray(acoes, dtype=float) + np.asarray(divida_liquida, dtype=float)
+
+
+def _resolver_intervalo(funcao, limite_inferior, limite_superior, escala, tolerancia, max_iteracoes):
+    '''
+    Resolve funcao(x) = 0 para vários ativos ao mesmo tempo com Newton protegido por bisseção.
+
+    Parâmetros:
+    - funcao: recebe um array x e retorna (resíduo, derivada) do mesmo formato
+    - limite_inferior / limite_superior: arrays com o intervalo inicial de cada ativo
+    - escala: array com a grandeza de referência do resíduo (ex.: o próprio valor de mercado)
+    - tolerancia: tolerância relativa do resíduo e absoluta da largura do intervalo
+    - max_iteracoes: limite de iterações
+
+    Retorna:
+    - dict com 'raiz', 'convergiu', 'iteracoes', 'residuo' e 'status' (arrays por ativo)
+    '''
+    # Copia os limites para não alterar os arrays do chamador
+    baixo = np.array(limite_inferior, dtype=float)
+    alto = np.array(limite_superior, dtype=float)
+    # Avalia os extremos para verificar se há troca de sinal (raiz no intervalo)
+    f_baixo, _ = funcao(baixo)
+    f_alto, _ = funcao(alto)
+    escala = np.abs(np.asarray(escala, dtype=float))
+    escala = np.where(np.isfinite(escala) & (escala > 0), escala, 1.0)
+    valido = np.isfinite(f_baixo) & np.isfinite(f_alto)
+    com_raiz = valido & (np.sign(f_baixo) != np.sign(f_alto))
+    # Ponto de partida: ponto médio do intervalo
+    x = 0.5 * (baixo + alto)
+    iteracoes = np.zeros(x.shape, dtype=int)
+    residuo = np.full(x.shape, np.nan)
+    convergiu = np.zeros(x.shape, dtype=bool)
+    ativos = com_raiz.copy()
+    for _ in range(max_iteracoes):
+        if not ativos.any():
+            break
+        # Avalia resíduo e derivada em todos os ativos (os já resolvidos são mascarados)
+        f_x, df_x = funcao(x)
+        residuo = np.where(ativos, f_x, residuo)
+        iteracoes += ativos
+        # Critério de parada: resíduo relativo pequeno ou intervalo colapsado
+        resolvidos = ativos & ((np.abs(f_x) <= tolerancia * escala) | (alto - baixo <= tolerancia))
+        convergiu |= resolvidos
+        ativos &= ~resolvidos
+        # Atualiza o intervalo mantendo a troca de sinal
+        mesmo_sinal_baixo = np.sign(f_x) == np.sign(f_baixo)
+        baixo = np.where(ativos & mesmo_sinal_baixo, x, baixo)
+        f_baixo = np.where(ativos & mesmo_sinal_baixo, f_x, f_baixo)
+        alto = np.where(ativos & ~mesmo_sinal_baixo, x, alto)
+        # Passo de Newton; se sair do intervalo (ou derivada nula), usa bisseção
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x - f_x / df_x
+        dentro = np.isfinite(newton) & (newton > baixo) & (newton < alto)
+        x = np.where(ativos, np.where(dentro, newton, 0.5 * (baixo + alto)), x)
+    # Classifica o status final de cada ativo
+    status = np.full(x.shape, STATUS_MAX_ITERACOES, dtype=object)
+    status[convergiu] = STATUS_CONVERGIU
+    status[valido & ~com_raiz] = STATUS_SEM_RAIZ
+    status[~valido] = STATUS_ENTRADA_INVALIDA
+    raiz = np.where(convergiu, x, np.nan)
+    return {
+        'raiz': raiz,
+        'convergiu': convergiu,
+        'iteracoes': iteracoes,
+        'residuo': residuo,
+        'status': status
+    }
+
+
+def resolver_crescimento_implicito(fcf_atual, valor_mercado, wacc, crescimento_terminal, anos=5,
+                                   limite_inferior=-0.5, limite_superior=1.0,
+                                   tolerancia=1e-10, max_iteracoes=100):
+    '''
+    Encontra, para cada ativo, o crescimento do período explícito que iguala o FCD ao valor de mercado.
+
+    Parâmetros:
+    - fcf_atual: FCF atual por ativo (deve ser positivo, como em dcf_valuation)
+    - valor_mercado: Enterprise Value de mercado por ativo (ver valor_mercado_firma)
+    - wacc, crescimento_terminal: premissas por ativo ou únicas para o universo
+    - anos: número de anos do período explícito
+    - limite_inferior / limite_superior: intervalo de busca do crescimento
+    - tolerancia / max_iteracoes: critérios de parada
+
+    Retorna:
+    - dict com 'crescimento', 'convergiu', 'iteracoes', 'residuo' e 'status' por ativo
+    '''
+    # Alinha todas as entradas no mesmo formato (um elemento por ativo)
+    fcf_atual, valor_mercado, wacc, crescimento_terminal = np.broadcast_arrays(
+        np.asarray(fcf_atual, dtype=float), np.asarray(valor_mercado, dtype=float),
+        np.asarray(wacc, dtype=float), np.asarray(crescimento_terminal, dtype=float))
+    # Entradas fora do domínio do modelo viram NaN e são marcadas como inválidas
+    invalido = (fcf_atual <= 0) | (valor_mercado <= 0) | (wacc <= crescimento_terminal)
+    fcf_atual = np.where(invalido, np.nan, fcf_atual)
+
+    # Resíduo EV_modelo(g) - EV_mercado e sua derivada em g
+    def funcao(g):
+        valor, derivada_g, _ = valor_firma_dcf(fcf_atual, g, wacc, crescimento_terminal, anos)
+        return valor - valor_mercado, derivada_g
+
+    resultado = _resolver_intervalo(
+        funcao,
+        np.full(fcf_atual.shape, limite_inferior),
+        np.full(fcf_atual.shape, limite_superior),
+        valor_mercado, tolerancia, max_iteracoes)
+    resultado['crescimento'] = resultado.pop('raiz')
+    return resultado
+
+
+def resolver_wacc_implicito(fcf_atual, valor_mercado, crescimento, crescimento_terminal, anos=5,
+                            limite_superior=1.0, tolerancia=1e-10, max_iteracoes=100):
+    '''
+    Encontra, para cada ativo, o WACC que iguala o FCD ao valor de mercado, dado o crescimento explícito.
+
+    O limite inferior é sempre ligeiramente acima da taxa de crescimento perpétuo, pois o modelo
+    de Gordon exige WACC > gₜ.
+
+    Retorna:
+    - dict com 'wacc', 'convergiu', 'iteracoes', 'residuo' e 'status' por ativo
+    '''
+    # Alinha todas as entradas no mesmo formato (um elemento por ativo)
+    fcf_atual, valor_mercado, crescimento, crescimento_terminal = np.broadcast_arrays(
+        np.asarray(fcf_atual, dtype=float), np.asarray(valor_mercado, dtype=float),
+        np.asarray(crescimento, dtype=float), np.asarray(crescimento_terminal, dtype=float))
+    # Entradas fora do domínio do modelo viram NaN e são marcadas como inválidas
+    invalido = (fcf_atual <= 0) | (valor_mercado <= 0)
+    fcf_atual = np.where(invalido, np.nan, fcf_atual)
+
+    # Resíduo EV_modelo(WACC) - EV_mercado e sua derivada no WACC
+    def funcao(w):
+        valor, _, derivada_w = valor_firma_dcf(fcf_atual, crescimento, w, crescimento_terminal, anos)
+        return valor - valor_mercado, derivada_w
+
+    resultado = _resolver_intervalo(
+        funcao,
+        crescimento_terminal + 1e-6,
+        np.full(fcf_atual.shape, limite_superior),
+        valor_mercado, tolerancia, max_iteracoes)
+    resultado['wacc'] = resultado.pop('raiz')
+    return resultado
+
+
+def avaliar_crescimento_implicito_universo(tickers, fcf_atual, valor_mercado, wacc, crescimento_terminal, anos=5):
+    '''
+    Resolve o FCD reverso para todo o universo e classifica o resultado com CrescimentoImplicitoEvaluator.
+
+    Retorna:
+    - pd.DataFrame com uma linha por ativo, incluindo diagnósticos de convergência
+    '''
+    # Resolve o crescimento implícito de todos os ativos de uma vez
+    resultado = resolver_crescimento_implicito(fcf_atual, valor_mercado, wacc, crescimento_terminal, anos)
+    avaliador = CrescimentoImplicitoEvaluator()
+    linhas = []
+    for i, ticker in enumerate(tickers):
+        # Classifica o crescimento implícito (NaN gera ResultadoIND de erro)
+        avaliacao = avaliador.avaliar(float(resultado['crescimento'][i]))
+        linhas.append({
+            'Ativo': ticker,
+            'Crescimento Implícito': resultado['crescimento'][i],
+            'Convergiu': bool(resultado['convergiu'][i]),
+            'Iterações': int(resultado['iteracoes'][i]),
+            'Resíduo': resultado['residuo'][i],
+            'Status': resultado['status'][i],
+            'Classificacao': avaliacao.classificacao,
+            'Faixa': avaliacao.faixa
+        })
+    return pd.DataFrame(linhas)
+
+
+# Bloco principal para testes
+if __name__ == "__main__":
+    # Ida e volta: calcula o EV com crescimentos conhecidos e recupera-os pelo FCD reverso
+    tickers = ['PETR4', 'VALE3', 'ABEV3', 'WEGE3', 'XXXX3']
+    fcf = np.array([84.69e9, 60e9, 15e9, 6e9, -1e9])
+    crescimento_real = np.array([0.03, -0.02, 0.05, 0.18, 0.05])
+    wacc = np.array([0.10, 0.11, 0.09, 0.12, 0.10])
+    valor_mercado, _, _ = valor_firma_dcf(fcf, crescimento_real, wacc, 0.02, 5)
+    valor_mercado = np.where(np.isfinite(valor_mercado), valor_mercado, 1e9)
+    df = avaliar_crescimento_implicito_universo(tickers, fcf, valor_mercado, wacc, 0.02)
+    print(df.to_string())
+    # O WACC implícito deve recuperar o WACC usado no cálculo
+    wacc_implicito = resolver_wacc_implicito(fcf[:4], valor_mercado[:4], crescimento_real[:4], 0.02)
+    print("WACC implícito:", wacc_implicito['wacc'], wacc_implicito['status'], wacc_implicito['iteracoes'])
@@ -1,25 +1,25 @@
-import inspect
-import analisefundamentalista  # substitua pelo nome do seu arquivo sem ".py"
-import analiseativos
+from manifestoavaliadores import carregar_manifesto
 
-funcoes = [name for name, obj in inspect.getmembers(analiseativos, inspect.isfunction)]
+# Lê o manifesto gerado por manifestoavaliadores.py (sem importar analiseativos)
+manifesto = carregar_manifesto()
+
+funcoes = manifesto['funcoes']
 print("Funções disponíveis:", funcoes)
 
 
 
 
-classes = [name for name, obj in inspect.getmembers(analiseativos, inspect.isclass)]
+classes = sorted(manifesto['classes'])
 print("Classes disponíveis:", classes)
 
-import inspect
-import analiseativos  # Certifique-se de que esse módulo está acessível
-
 # Obtém todas as classes definidas no módulo
-classes = [name for name, obj in inspect.getmembers(analiseativos, inspect.isclass)]
+classes = sorted(manifesto['classes'])
 
 # Imprime cada classe separadamente
 print("Classes disponíveis:")
 for classe in classes:
     print(f" {classe}")
 
-
+# Classes definidas mais de uma vez: a última definição sobrescreve as anteriores
+for classe, linhas in manifesto['duplicadas'].items():
+    print(f"Aviso: {classe} definida em {', '.join(linhas)}")
@@ -1,8 +1,43 @@
+# Gera as páginas HTML com as caixas de indicadores de cada ativo (uma caixa por indicador, colorida pela
+# classificação).
+# Razão: a versão anterior montava a página com html += f"""...""" dentro de df.iterrows(): cada linha
+# criava uma Series e copiava a página inteira acumulada, e o ticker (ABEV3) estava fixo no código. Aqui
+# os templates são montados uma única vez, as linhas são lidas direto das colunas (sem objeto por linha)
+# e as caixas são gravadas em blocos num arquivo com buffer, de modo que o tempo cresce linearmente com o
+# número de linhas e a memória usada na geração não depende do tamanho da página. Serve para qualquer
+# ticker ou para o universo inteiro (uma página por ativo), em qualquer um dos modelos de página (MODELOS:
+# caixas, cards e tabela, os layouts de modelo1_caixas/modelo2_cards/modelo3_tabela.html).
+# Os textos de cada linha (cor, valor formatado, colunas escapadas para HTML) são preparados uma única vez
+# numa visão compartilhada por todos os modelos, e as páginas de vários modelos do mesmo ativo são
+# gravadas numa única passada por essa visão, em vez de cada modelo percorrer e formatar as linhas de novo.
+import hashlib
+import html
+import os
+import re
+import time
 
 import pandas as pd
 
-# Lê os dados da aba 'IndiRentabilidade' do arquivo Excel
-df = pd.read_excel("StatusInvest_html.xlsx", sheet_name="IndiRentabilidade", engine="openpyxl")
+from leituraplanilhas import ler_planilha
+
+
+# Planilha gravada pelos robôs (aba IndiRentabilidade, com a coluna Ativo)
+ARQUIVO_DADOS = "StatusInvest.xlsx"
+ABA_DADOS = "IndiRentabilidade"
+# Colunas usadas na caixa de cada indicador, na ordem em que entram no template
+COLUNAS = ("Indicador", "Classificacao", "Definição", "Descricao")
+# Nome de cada página gerada (modelo caixas)
+ARQUIVO_PAGINA = "indicadores_{ticker}_com_variaveis.html"
+# Caixas acumuladas antes de cada gravação no arquivo
+TAMANHO_BLOCO = 512
+# Buffer do arquivo de saída (bytes)
+BUFFER_ARQUIVO = 1 << 16
+
+# Colunas da visão preparada (ver preparar_visao), na ordem da linha passada aos templates de item,
+# depois da cor (posição 0)
+COLUNAS_VISAO = ("Indicador", "Agrupador", "Classificacao", "Valor", "Faixa", "Definição", "Descricao")
+# Versão da preparação da visão (formatação e escape): entra na versão de cada modelo
+VERSAO_VISAO = "visao-1"
 
 # Mapeia cores para cada classificação
 cores_classificacao = {
@@ -12,66 +47,366 @@ cores_classificacao = {
     "Ruim": "#f8d7da",
     "Crítico": "#f5c6cb"
 }
+# Cor das classificações fora do mapa
+COR_PADRAO = "#ffffff"
 
-# Inicia o conteúdo HTML
-html = """
+# Início da página (até o título)
+_CABECALHO = """
 <!DOCTYPE html>
 <html lang="pt-br">
 <head>
     <meta charset="UTF-8">
-    <title>Indicadores Financeiros - ABEV3</title>
+    <title>Indicadores Financeiros - {ticker}</title>
     <style>
-        body {
+        body {{
             font-family: Arial, sans-serif;
             background-color: #f2f2f2;
             padding: 20px;
-        }
-        .caixa {
+        }}
+        .caixa {{
             border-left: 8px solid #333;
             background-color: #fff;
             padding: 15px;
             margin-bottom: 20px;
             box-shadow: 0 0 5px rgba(0,0,0,0.1);
-        }
-        .titulo {
+        }}
+        .titulo {{
             font-size: 18px;
             font-weight: bold;
             margin-bottom: 10px;
-        }
-        .classificacao, .definicao, .descricao {
+        }}
+        .classificacao, .definicao, .descricao {{
             margin-bottom: 8px;
-        }
+        }}
     </style>
 </head>
 <body>
-    <h1>Indicadores Financeiros - ABEV3</h1>
+    <h1>Indicadores Financeiros - {ticker}</h1>
 """
 
-# Itera sobre as linhas do DataFrame e cria caixas HTML
-for _, row in df.iterrows():
-    indicador = row["Indicador"]
-    classificacao = row["Classificacao"]
-    definicao = row["Definição"]
-    descricao = row["Descricao"]
-    cor = cores_classificacao.get(classificacao, "#ffffff")
-
-    html += f"""
-    <div class="caixa" style="border-left-color:{cor}; background-color:{cor};">
-        <div class="titulo">{indicador}</div>
-        <div class="classificacao"><strong>Classificação:</strong> {classificacao}</div>
-        <div class="definicao"><strong>Definição:</strong> {definicao}</div>
-        <div class="descricao"><strong>Descrição:</strong> {descricao}</div>
+# Caixa de um indicador: o método format já ligado ao template, montado uma única vez
+_caixa = """
+    <div class="caixa" style="border-left-color:{0}; background-color:{0};">
+        <div class="titulo">{1}</div>
+        <div class="classificacao"><strong>Classificação:</strong> {2}</div>
+        <div class="definicao"><strong>Definição:</strong> {3}</div>
+        <div class="descricao"><strong>Descrição:</strong> {4}</div>
     </div>
-    """
+    """.format
 
-# Finaliza o HTML
-html += """
+# Fim da página
+_RODAPE = """
 </body>
 </html>
 """
 
-# Salva o HTML em um arquivo
-with open("indicadores_ABEV3_com_variaveis.html", "w", encoding="utf-8") as f:
-    f.write(html)
+# Modelo cards (layout de modelo2_cards.html)
+_CABECALHO_CARDS = """<!DOCTYPE html>
+<html lang="pt-br">
+<head>
+    <meta charset="utf-8">
+    <title>Indicadores {ticker} - Modelo 2</title>
+    <style>
+        body {{ font-family: Verdana; background-color: #eef2f3; padding: 20px; }}
+        .card {{ background: #fff; padding: 20px; margin: 15px 0; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }}
+        .card-header {{ font-size: 20px; font-weight: bold; margin-bottom: 10px; }}
+        .card-body {{ font-size: 14px; }}
+        .highlight {{ font-weight: bold; }}
+    </style>
+</head>
+<body>
+<h2>Indicadores Financeiros - {ticker} (Modelo 2)</h2>
+"""
+_CARD = """
+    <div class="card" style="background-color:{0};">
+        <div class="card-header">{1}</div>
+        <div class="card-body">
+            <p><span class="highlight">Agrupador:</span> {2}</p>
+            <p><span class="highlight">Classificação:</span> {3}</p>
+            <p><span class="highlight">Valor:</span> {4}</p>
+            <p><span class="highlight">Faixa:</span> {5}</p>
+            <p><span class="highlight">Definição:</span> {6}</p>
+            <p><span class="highlight">Descrição:</span> {7}</p>
+        </div>
+    </div>
+    """
+
+# Modelo tabela (layout de modelo3_tabela.html)
+_CABECALHO_TABELA = """<!DOCTYPE html>
+<html lang="pt-br">
+<head>
+    <meta charset="utf-8">
+    <title>Indicadores {ticker} - Modelo 3</title>
+    <style>
+        body {{ font-family: Tahoma; background-color: #ffffff; padding: 20px; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ccc; padding: 10px; text-align: left; }}
+        th {{ background-color: #333; color: white; }}
+    </style>
+</head>
+<body>
+<h2>Indicadores Financeiros - {ticker} (Modelo 3)</h2>
+<table>
+<tr>
+    <th>Indicador</th>
+    <th>Agrupador</th>
+    <th>Valor</th>
+    <th>Classificação</th>
+    <th>Faixa</th>
+    <th>Definição</th>
+    <th>Descrição</th>
+</tr>
+"""
+_LINHA_TABELA = """
+    <tr style="background-color:{0};">
+        <td>{1}</td>
+        <td>{2}</td>
+        <td>{3}</td>
+        <td>{4}</td>
+        <td>{5}</td>
+        <td>{6}</td>
+        <td>{7}</td>
+    </tr>
+    """
+
+
+def _modelo(cabecalho, item, rodape, colunas):
+    # Modelo de página: templates, colunas do item e versão (hash dos templates e da preparação da visão),
+    # que entra no hash de entrada de cada página gerada. No template de item, {0} é a cor e {k} a coluna
+    # colunas[k - 1]; os campos são renumerados para a posição da coluna na linha da visão, de modo que
+    # todos os modelos formatam a mesma linha preparada
+    versao = hashlib.sha256('\0'.join((cabecalho, item, rodape, *colunas, VERSAO_VISAO)).encode('utf-8')).hexdigest()[:16]
+    posicoes = [0] + [1 + COLUNAS_VISAO.index(coluna) for coluna in colunas]
+    item = re.sub(r'\{(\d+)\}', lambda campo: '{%d}' % posicoes[int(campo.group(1))], item)
+    return {'cabecalho': cabecalho, 'item': item.format, 'rodape': rodape, 'colunas': colunas, 'versao': versao}
+
+
+# Modelos de página disponíveis: nome -> modelo
+MODELOS = {
+    'caixas': _modelo(_CABECALHO, _caixa.__self__, _RODAPE, COLUNAS),
+    'cards': _modelo(_CABECALHO_CARDS, _CARD, "</body></html>",
+                     ("Indicador", "Agrupador", "Classificacao", "Valor", "Faixa", "Definição", "Descricao")),
+    'tabela': _modelo(_CABECALHO_TABELA, _LINHA_TABELA, "</table></body></html>",
+                      ("Indicador", "Agrupador", "Valor", "Classificacao", "Faixa", "Definição", "Descricao")),
+}
+
+
+def carregar_indicadores(arquivo=ARQUIVO_DADOS, aba=ABA_DADOS):
+    '''
+    Lê a aba de indicadores da planilha (pelo cache de leituraplanilhas).
+
+    Retorna:
+    - pd.DataFrame com as colunas de COLUNAS (e Ativo, quando a planilha traz vários ativos)
+    '''
+    return ler_planilha(arquivo, aba)
+
+
+def _textos(valores):
+    # Texto escapado de cada valor (números no formato da planilha, como str); valores repetidos (as
+    # definições e descrições se repetem entre ativos) são escapados uma vez
+    escapados = {}
+    textos = []
+    for valor in valores:
+        texto = escapados.get(valor)
+        if texto is None:
+            texto = escapados[valor] = html.escape(str(valor), quote=False)
+        textos.append(texto)
+    return textos
+
+
+def preparar_visao(df):
+    '''
+    Visão preparada das linhas, compartilhada por todos os modelos: a cor da classificação e os textos de
+    COLUNAS_VISAO já formatados e escapados para HTML.
+
+    Parâmetros:
+    - df: DataFrame de indicadores; colunas de COLUNAS_VISAO ausentes ficam vazias
+
+    Retorna:
+    - list de listas [cores, *textos na ordem de COLUNAS_VISAO], com uma posição por linha
+    '''
+    cor = cores_classificacao.get
+    visao = [[cor(classificacao, COR_PADRAO) for classificacao in df["Classificacao"].tolist()]]
+    for coluna in COLUNAS_VISAO:
+        visao.append(_textos(df[coluna].tolist()) if coluna in df.columns else [''] * len(df))
+    return visao
+
+
+def escrever_paginas(arquivos, ticker, visao, tamanho_bloco=TAMANHO_BLOCO):
+    '''
+    Grava as páginas de um ativo em vários modelos numa única passada pela visão: cada bloco de linhas
+    preparadas é montado uma vez e formatado em todos os modelos (caixas, cards ou linhas).
+
+    Parâmetros:
+    - arquivos: dict {nome do modelo em MODELOS: arquivo de texto aberto para escrita}
+    - ticker: ativo exibido no título
+    - visao: linhas preparadas (ver preparar_visao)
+    - tamanho_bloco: linhas formatadas antes de cada gravação
+
+    Retorna:
+    - int: número de itens gravados em cada página
+    '''
+    saidas = [(MODELOS[nome], arquivo) for nome, arquivo in arquivos.items()]
+    for modelo, arquivo in saidas:
+        arquivo.write(modelo['cabecalho'].format(ticker=ticker))
+    quantidade = len(visao[0])
+    for inicio in range(0, quantidade, tamanho_bloco):
+        linhas = list(zip(*(coluna[inicio:inicio + tamanho_bloco] for coluna in visao)))
+        for modelo, arquivo in saidas:
+            formatar = modelo['item']
+            arquivo.write(''.join([formatar(*linha) for linha in linhas]))
+    for modelo, arquivo in saidas:
+        arquivo.write(modelo['rodape'])
+    return quantidade
+
+
+def escrever_pagina(arquivo, ticker, visao, modelo='caixas', tamanho_bloco=TAMANHO_BLOCO):
+    '''
+    Grava uma página completa de um modelo (ver escrever_paginas).
+
+    Retorna:
+    - int: número de itens gravados
+    '''
+    return escrever_paginas({modelo: arquivo}, ticker, visao, tamanho_bloco)
+
+
+def gerar_pagina(df, ticker, destino=None):
+    '''
+    Gera a página de um ativo.
+
+    Parâmetros:
+    - df: DataFrame de indicadores; se tiver a coluna Ativo, só as linhas do ticker entram na página
+    - ticker: ativo (ex.: 'ABEV3')
+    - destino: caminho do HTML; por padrão, ARQUIVO_PAGINA no diretório atual
+
+    Retorna:
+    - str: caminho do arquivo gerado
+    '''
+    if "Ativo" in df.columns:
+        df = df[df["Ativo"] == ticker]
+    destino = destino or ARQUIVO_PAGINA.format(ticker=ticker)
+    with open(destino, "w", encoding="utf-8", buffering=BUFFER_ARQUIVO) as f:
+        escrever_pagina(f, ticker, preparar_visao(df))
+    return destino
+
+
+def gerar_paginas(df, tickers=None, diretorio="."):
+    '''
+    Gera uma página por ativo.
+
+    Parâmetros:
+    - df: DataFrame de indicadores com a coluna Ativo
+    - tickers: lista de ativos; None gera o universo inteiro
+    - diretorio: diretório de saída
+
+    Retorna:
+    - list dos caminhos gerados
+    '''
+    os.makedirs(diretorio, exist_ok=True)
+    if tickers is not None:
+        df = df[df["Ativo"].isin(tickers)]
+    caminhos = []
+    # Um único agrupamento separa as linhas de todos os ativos (sem filtrar o DataFrame a cada ticker)
+    for ticker, linhas in df.groupby("Ativo", sort=False):
+        destino = os.path.join(diretorio, ARQUIVO_PAGINA.format(ticker=ticker))
+        with open(destino, "w", encoding="utf-8", buffering=BUFFER_ARQUIVO) as f:
+            escrever_pagina(f, ticker, preparar_visao(linhas))
+        caminhos.append(destino)
+    return caminhos
+
+
+def _pagina_concatenada(df, ticker):
+    # Montagem anterior (html += dentro de iterrows), mantida só para comparação no benchmark
+    html = _CABECALHO.format(ticker=ticker)
+    for _, row in df.iterrows():
+        cor = cores_classificacao.get(row["Classificacao"], COR_PADRAO)
+        html += _caixa(cor, row["Indicador"], row["Classificacao"], row["Definição"], row["Descricao"])
+    html += _RODAPE
+    return html
+
+
+def medir_geracao(df, quantidades=(12_500, 25_000, 50_000), destino=os.devnull):
+    '''
+    Benchmark: gera páginas com 12,5 mil, 25 mil e 50 mil indicadores (linhas reais repetidas) pela
+    montagem anterior e pela atual, medindo tempo e pico de memória alocada durante a geração.
+
+    Retorna:
+    - pd.DataFrame com uma linha por quantidade
+    '''
+    import tracemalloc
+
+    linhas = []
+    for quantidade in quantidades:
+        amostra = df.iloc[[i % len(df) for i in range(quantidade)]].reset_index(drop=True)
+        medidas = {'linhas': quantidade}
+        for rotulo, gerar in (('anterior', lambda: _gravar_concatenada(amostra, destino)),
+                              ('atual', lambda: gerar_pagina(amostra.drop(columns="Ativo", errors="ignore"), "BENCH", destino))):
+            tracemalloc.start()
+            inicio = time.perf_counter()
+            gerar()
+            medidas[f'{rotulo}_s'] = time.perf_counter() - inicio
+            medidas[f'{rotulo}_pico_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+        linhas.append(medidas)
+    resultado = pd.DataFrame(linhas)
+    # Tempo por linha constante indica crescimento linear
+    resultado['atual_us_por_linha'] = resultado['atual_s'] / resultado['linhas'] * 1e6
+    return resultado
+
+
+def _paginas_por_modelo(df, ticker, arquivos):
+    # Geração por modelo, mantida só para comparação: cada modelo percorre as linhas de novo, formatando e
+    # escapando todas as colunas da linha
+    for nome, arquivo in arquivos.items():
+        modelo = MODELOS[nome]
+        formatar = modelo['item']
+        arquivo.write(modelo['cabecalho'].format(ticker=ticker))
+        for classificacao, *valores in zip(df["Classificacao"].tolist(), *(df[c].tolist() for c in COLUNAS_VISAO)):
+            arquivo.write(formatar(cores_classificacao.get(classificacao, COR_PADRAO),
+                                   *[html.escape(str(valor), quote=False) for valor in valores]))
+        arquivo.write(modelo['rodape'])
+
+
+def medir_modelos(df, repeticoes=5, destino=os.devnull):
+    '''
+    Benchmark: páginas de todos os ativos em todos os modelos de MODELOS, com cada modelo percorrendo
+    as linhas (anterior) e com a visão preparada uma vez e uma única passada (atual).
+
+    Retorna:
+    - dict com páginas, anterior_s e atual_s (melhor de repeticoes)
+    '''
+    grupos = [(ticker, linhas.reset_index(drop=True)) for ticker, linhas in df.groupby("Ativo", sort=False)]
+    tempos = {}
+    with open(destino, "w", encoding="utf-8", buffering=BUFFER_ARQUIVO) as f:
+        arquivos = {nome: f for nome in MODELOS}
+        for rotulo, gerar in (('anterior', lambda ticker, linhas: _paginas_por_modelo(linhas, ticker, arquivos)),
+                              ('atual', lambda ticker, linhas: escrever_paginas(arquivos, ticker, preparar_visao(linhas)))):
+            melhor = float('inf')
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                for ticker, linhas in grupos:
+                    gerar(ticker, linhas)
+                melhor = min(melhor, time.perf_counter() - inicio)
+            tempos[f'{rotulo}_s'] = melhor
+    return {'paginas': len(grupos) * len(MODELOS), **tempos}
+
+
+def _gravar_concatenada(df, destino):
+    with open(destino, "w", encoding="utf-8") as f:
+        f.write(_pagina_concatenada(df, "BENCH"))
+
 
-print("Arquivo HTML gerado com sucesso: indicadores_ABEV3_com_variaveis.html")
+# Bloco principal: gera a página do ABEV3 (como antes), a do universo inteiro e o benchmark de 50 mil linhas
+if __name__ == "__main__":
+    dados = carregar_indicadores()
+    caminho = gerar_pagina(dados, "ABEV3")
+    print(f"Arquivo HTML gerado com sucesso: {caminho}")
+    inicio = time.perf_counter()
+    caminhos = gerar_paginas(dados, diretorio="paginas_indicadores")
+    print(f"{len(caminhos)} páginas (universo inteiro) em paginas_indicadores/ em {time.perf_counter() - inicio:.2f} s")
+    pd.set_option('display.width', 200)
+    print(medir_geracao(dados).round(3).to_string(index=False))
+    medidas = medir_modelos(dados)
+    print(f"{medidas['paginas']} páginas ({dados['Ativo'].nunique()} ativos × {len(MODELOS)} modelos): "
+          f"um percurso por modelo {medidas['anterior_s'] * 1e3:.1f} ms | visão única e uma passada "
+          f"{medidas['atual_s'] * 1e3:.1f} ms ({medidas['anterior_s'] / medidas['atual_s']:.1f}x)")
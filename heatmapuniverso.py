@@ -0,0 +1,234 @@
+# Heatmap do universo inteiro a partir da matriz de códigos de faixa (ativos × indicadores).
+# Razão: os heatmaps de heatmaps6/heatmaps8_from_excel são por ativo, montados de uma planilha por vez,
+# com uma célula no DOM por valor, cada uma com estilo e texto embutidos; com o universo inteiro a página
+# fica pesada para abrir e rolar. Aqui a entrada é a matriz int8 de avaliacaoparalela.avaliar_universo
+# (ou qualquer DataFrame ativos × indicadores com os mesmos códigos), as colunas são agrupadas pelo
+# agrupador de cada indicador e a grade vai para a página como uma string com um caractere por célula.
+# O navegador desenha a grade num canvas (um retângulo por célula, sem elemento no DOM), a dica da
+# célula sob o mouse é calculada pela posição e a ordenação (por ativo, média ou qualquer indicador) só
+# troca a ordem das linhas e redesenha.
+import html
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+import analiseativos
+from avaliacaoparalela import AVALIACOES_PADRAO, CLASSIFICACOES, CODIGO_SEM_FAIXA
+
+
+ARQUIVO_HEATMAP = "heatmap_universo.html"
+# Agrupador das colunas cujo avaliador não é conhecido
+AGRUPADOR_PADRAO = "Outros"
+# Cor de cada código (posição em CLASSIFICACOES) e da célula sem faixa
+CORES_CODIGO = {
+    'Erro': "#4b5563",
+    'Muito Crítico': "#7f1d1d",
+    'Crítico': "#991b1b",
+    'Ruim': "#b91c1c",
+    'Moderado': "#a16207",
+    'Bom': "#15803d",
+    'Muito Bom': "#166534",
+    'Ótimo': "#14532d",
+}
+COR_SEM_FAIXA = "#1f2937"
+
+# Página: script de desenho (window.carregarHeatmap) e {dados}, o script que entrega o payload (embutido
+# em gerar_heatmap; buscado na API em servidorpainel)
+_PAGINA = """<!doctype html><html lang="pt-BR"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1"><title>{titulo}</title><style>
+body{{margin:0;font:12px/1.4 Arial,sans-serif;background:#0f172a;color:#e5e7eb}}
+.topo{{padding:10px 14px;display:flex;gap:12px;flex-wrap:wrap;align-items:center}}
+.legenda span{{display:inline-block;padding:2px 8px;margin-right:4px;border-radius:4px;color:#fff}}
+select{{background:#0c1424;color:#e5e7eb;border:1px solid #334155;border-radius:6px;padding:3px}}
+#area{{overflow:auto;max-height:calc(100vh - 60px)}}
+#cab{{position:sticky;top:0;z-index:2;display:block;background:#0f172a;cursor:pointer}}
+#grade{{display:block}}
+#dica{{position:fixed;pointer-events:none;background:#111827;border:1px solid #374151;padding:4px 8px;border-radius:4px;display:none;z-index:3}}
+</style></head><body>
+<div class="topo"><b>{titulo}</b><span id="resumo"></span><label>Ordenar por <select id="ordem"></select></label><div class="legenda" id="legenda"></div></div>
+<div id="area"><canvas id="cab"></canvas><canvas id="grade"></canvas></div><div id="dica"></div>
+<script>
+(function(){{
+  const CEL=14, ESQ=90, TOPO=130;
+  const cab=document.getElementById('cab'), grade=document.getElementById('grade'), dica=document.getElementById('dica'), sel=document.getElementById('ordem');
+  let H=null, A=[], I=[], nL=0, nC=0, cod=new Int8Array(0), grupoColuna=[], inicios=[], medias=new Float32Array(0);
+  let ordem=[], chave='ativo', decrescente=false;
+  const cor=c=>c<0?H.cor_sem_faixa:H.cores[c];
+  function media(r){{ let s=0,n=0; for(let c=0;c<nC;c++){{ const v=cod[r*nC+c]; if(v>0){{ s+=v; n++; }} }} return n?s/n:-1; }}
+  function ordenar(){{
+    const valor = chave==='ativo' ? null : chave==='media' ? (r=>medias[r]) : (r=>cod[r*nC+chave]);
+    ordem.sort(valor===null ? (a,b)=>A[a]<A[b]?-1:A[a]>A[b]?1:0 : (a,b)=>(valor(b)-valor(a))||(A[a]<A[b]?-1:1));
+    if(decrescente) ordem.reverse();
+    desenhar();
+  }}
+  function desenhar(){{
+    const largura=ESQ+nC*CEL;
+    cab.width=largura; cab.height=TOPO; grade.width=largura; grade.height=nL*CEL;
+    let g=cab.getContext('2d'); g.fillStyle='#0f172a'; g.fillRect(0,0,largura,TOPO); g.font='11px Arial';
+    H.grupos.forEach(function(gr,j){{ const x=ESQ+inicios[j]*CEL; g.fillStyle=j%2?'#1e293b':'#0b1220'; g.fillRect(x,0,gr[1]*CEL,18); g.fillStyle='#93c5fd'; g.save(); g.beginPath(); g.rect(x,0,gr[1]*CEL,18); g.clip(); g.fillText(gr[0],x+3,13); g.restore(); }});
+    for(let c=0;c<nC;c++){{ g.save(); g.translate(ESQ+c*CEL+10,TOPO-4); g.rotate(-Math.PI/3); g.fillStyle=chave===c?'#fbbf24':'#cbd5e1'; g.fillText(I[c],0,0); g.restore(); }}
+    g=grade.getContext('2d'); g.font='11px Arial';
+    for(let r=0;r<nL;r++){{
+      const linha=ordem[r], y=r*CEL; g.fillStyle='#cbd5e1'; g.fillText(A[linha],2,y+11);
+      for(let c=0;c<nC;c++){{ g.fillStyle=cor(cod[linha*nC+c]); g.fillRect(ESQ+c*CEL,y,CEL-1,CEL-1); }}
+    }}
+    // Separadores entre agrupadores
+    g.fillStyle='#0f172a'; inicios.slice(1).forEach(c=>g.fillRect(ESQ+c*CEL-1,0,2,nL*CEL));
+  }}
+  function celula(e, alvo){{ const b=alvo.getBoundingClientRect(); return [Math.floor((e.clientX-b.left-ESQ)/CEL), Math.floor((e.clientY-b.top)/CEL)]; }}
+  grade.addEventListener('mousemove',function(e){{
+    const [c,r]=celula(e,grade); if(!H||c<0||c>=nC||r<0||r>=nL){{ dica.style.display='none'; return; }}
+    const v=cod[ordem[r]*nC+c]; dica.textContent=`${{A[ordem[r]]}} · ${{I[c]}} (${{H.grupos[grupoColuna[c]][0]}}): ${{v<0?'sem faixa':H.classificacoes[v]}}`;
+    dica.style.left=(e.clientX+12)+'px'; dica.style.top=(e.clientY+12)+'px'; dica.style.display='block';
+  }});
+  grade.addEventListener('mouseleave',()=>dica.style.display='none');
+  sel.addEventListener('change',function(){{ chave=isNaN(+sel.value)?sel.value:+sel.value; decrescente=false; ordenar(); }});
+  cab.addEventListener('click',function(e){{ const c=celula(e,cab)[0]; if(!H||c<0||c>=nC) return; decrescente = chave===c ? !decrescente : false; chave=c; sel.value=String(c); ordenar(); }});
+  // Carrega (ou substitui, numa atualização) os dados do heatmap, mantendo a ordenação escolhida
+  window.carregarHeatmap=function(dados){{
+    H=dados; A=H.ativos; I=H.indicadores; nL=A.length; nC=I.length;
+    // Grade: um caractere por célula, código + 1 ('0' = sem faixa)
+    cod=new Int8Array(nL*nC); for(let k=0;k<H.grade.length;k++) cod[k]=H.grade.charCodeAt(k)-49;
+    // Agrupador de cada coluna e início de cada grupo
+    grupoColuna=[]; inicios=[]; H.grupos.forEach(function(g,j){{ inicios.push(grupoColuna.length); for(let i=0;i<g[1];i++) grupoColuna.push(j); }});
+    medias=Float32Array.from({{length:nL}},(_,r)=>media(r));
+    ordem=[...Array(nL).keys()];
+    if(typeof chave==='number'&&chave>=nC) chave='ativo';
+    sel.innerHTML='<option value="ativo">Ativo</option><option value="media">Média</option>'+I.map((n,c)=>`<option value="${{c}}">${{n}}</option>`).join('');
+    sel.value=String(chave);
+    document.getElementById('legenda').innerHTML=H.classificacoes.map((n,c)=>`<span style="background:${{H.cores[c]}}">${{n}}</span>`).join('')+`<span style="background:${{H.cor_sem_faixa}}">sem faixa</span>`;
+    document.getElementById('resumo').textContent=`${{nL}} ativos × ${{nC}} indicadores`;
+    ordenar();
+  }};
+}})();
+</script>
+{dados}
+</body></html>
+"""
+
+
+def agrupadores_avaliacoes(avaliacoes=None):
+    '''
+    Agrupador de cada indicador, lido do avaliador que o classifica.
+
+    Parâmetros:
+    - avaliacoes: dict {indicador: (nome da classe, método)} (padrão AVALIACOES_PADRAO)
+
+    Retorna:
+    - dict {indicador: agrupador}
+    '''
+    avaliacoes = AVALIACOES_PADRAO if avaliacoes is None else avaliacoes
+    return {indicador: getattr(analiseativos, nome_classe)().agrupador
+            for indicador, (nome_classe, _) in avaliacoes.items()}
+
+
+def montar_heatmap(codigos, agrupadores=None):
+    '''
+    Monta o payload do heatmap: colunas reordenadas por agrupador (na ordem da primeira aparição,
+    mantendo a ordem dos indicadores dentro do grupo) e a grade codificada.
+
+    Parâmetros:
+    - codigos: pd.DataFrame int8 ativos × indicadores (ver avaliacaoparalela.avaliar_universo)
+    - agrupadores: dict {indicador: agrupador}; por padrão, o dos avaliadores de AVALIACOES_PADRAO
+
+    Retorna:
+    - dict pronto para JSON (ativos, indicadores, grupos, classificações, cores e grade)
+    '''
+    agrupadores = agrupadores_avaliacoes() if agrupadores is None else agrupadores
+    grupos = {}
+    for indicador in codigos.columns:
+        grupos.setdefault(agrupadores.get(indicador, AGRUPADOR_PADRAO), []).append(indicador)
+    colunas = [indicador for indicadores in grupos.values() for indicador in indicadores]
+    matriz = codigos[colunas].to_numpy(dtype=np.int8)
+    # Um caractere por célula: código + 1 em '0'..'8' (CODIGO_SEM_FAIXA = -1 vira '0')
+    grade = (np.clip(matriz, CODIGO_SEM_FAIXA, len(CLASSIFICACOES) - 1) + 1 + ord('0')).astype(np.uint8)
+    return {
+        'ativos': [str(ativo) for ativo in codigos.index],
+        'indicadores': [str(indicador) for indicador in colunas],
+        'grupos': [[agrupador, len(indicadores)] for agrupador, indicadores in grupos.items()],
+        'classificacoes': list(CLASSIFICACOES),
+        'cores': [CORES_CODIGO[classificacao] for classificacao in CLASSIFICACOES],
+        'cor_sem_faixa': COR_SEM_FAIXA,
+        'grade': grade.tobytes().decode('ascii'),
+    }
+
+
+def gerar_heatmap(codigos, destino=ARQUIVO_HEATMAP, agrupadores=None, titulo="Heatmap do universo"):
+    '''
+    Grava a página do heatmap do universo (um único arquivo, sem dependências).
+
+    Parâmetros:
+    - codigos: pd.DataFrame int8 ativos × indicadores
+    - destino: caminho do HTML
+    - agrupadores: dict {indicador: agrupador} (ver montar_heatmap)
+
+    Retorna:
+    - str: caminho do arquivo gerado
+    '''
+    # '</' escapado para que nenhum nome feche o <script> do payload
+    payload = json.dumps(montar_heatmap(codigos, agrupadores), ensure_ascii=False,
+                         separators=(',', ':')).replace('</', '<\\/')
+    with open(destino, "w", encoding="utf-8") as f:
+        f.write(pagina_heatmap(f"<script>carregarHeatmap({payload});</script>", titulo))
+    return destino
+
+
+def pagina_heatmap(dados, titulo="Heatmap do universo"):
+    '''
+    HTML da página do heatmap.
+
+    Parâmetros:
+    - dados: marcação que entrega o payload chamando carregarHeatmap(payload) (script embutido ou busca na API)
+    - titulo: título da página
+
+    Retorna:
+    - str
+    '''
+    return _PAGINA.format(titulo=html.escape(titulo), dados=dados)
+
+
+def _tabela_celulas(codigos):
+    # Montagem anterior (uma célula de tabela com estilo e texto por valor), mantida só para comparação
+    nomes = np.array(list(CLASSIFICACOES) + ['sem faixa'], dtype=object)
+    cores = np.array([CORES_CODIGO[c] for c in CLASSIFICACOES] + [COR_SEM_FAIXA], dtype=object)
+    partes = ['<table><tr><th>Ativo</th>', ''.join(f'<th>{html.escape(str(c))}</th>' for c in codigos.columns), '</tr>']
+    for ativo, linha in zip(codigos.index, codigos.to_numpy()):
+        partes.append(f'<tr><td>{html.escape(str(ativo))}</td>')
+        partes.append(''.join(f'<td style="background:{cores[c]};color:#fff" title="{html.escape(str(ativo))}">{nomes[c]}</td>'
+                              for c in linha))
+        partes.append('</tr>')
+    partes.append('</table>')
+    return ''.join(partes)
+
+
+# Bloco principal: heatmap do universo real (stocks_data.xlsx) e benchmark com 500 ativos × 50 indicadores
+if __name__ == "__main__":
+    import os
+
+    from avaliacaoparalela import avaliar_universo, preparar_valores
+    from leituraplanilhas import ler_planilha
+
+    stocks = ler_planilha('stocks_data.xlsx', index_col='indicadores')
+    codigos = avaliar_universo(preparar_valores(stocks), processos=1)
+    caminho = gerar_heatmap(codigos)
+    print(f"{caminho}: {codigos.shape[0]} ativos × {codigos.shape[1]} indicadores, {os.path.getsize(caminho) / 1024:.1f} KB")
+
+    # Universo sintético: 500 ativos × 50 indicadores (os reais repetidos, com o agrupador de cada um)
+    rng = np.random.default_rng(0)
+    reais = agrupadores_avaliacoes()
+    indicadores = [f"{indicador} #{i // len(reais) + 1}" for i, indicador in zip(range(50), list(reais) * 3)]
+    agrupadores = {nome: reais[nome.rsplit(' #', 1)[0]] for nome in indicadores}
+    sinteticos = pd.DataFrame(rng.integers(CODIGO_SEM_FAIXA, len(CLASSIFICACOES), (500, 50), dtype=np.int8),
+                              index=[f"SINT{i:03d}" for i in range(500)], columns=indicadores)
+    inicio = time.perf_counter()
+    gerar_heatmap(sinteticos, os.devnull, agrupadores)
+    tempo = time.perf_counter() - inicio
+    compacto = len(_PAGINA) + len(json.dumps(montar_heatmap(sinteticos, agrupadores), ensure_ascii=False))
+    inicio = time.perf_counter()
+    tabela = _tabela_celulas(sinteticos)
+    tempo_tabela = time.perf_counter() - inicio
+    print(f"500 × 50: grade codificada {compacto / 1024:.0f} KB em {tempo * 1e3:.1f} ms e 0 elementos por célula | "
+          f"tabela com uma célula por valor {len(tabela) / 1024:.0f} KB em {tempo_tabela * 1e3:.1f} ms e "
+          f"{sinteticos.size:,} elementos <td>")
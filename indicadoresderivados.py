@@ -0,0 +1,416 @@
+# Grafo de indicadores derivados calculados a partir dos campos brutos do balanço/DRE.
+# Razão: avaliadores como LucroLiquidoEvaluator.avaliar(lucro_liquido, receita_liquida),
+# DividaBrutaEvaluator.avaliar(divida_bruta, ativos_totais) e
+# LiquidezSecaEvaluator.avaliar(ativo_circulante, estoques, passivo_circulante) refazem a mesma divisão
+# por avaliador e por ativo. Aqui cada razão é declarada uma única vez como nó sobre campos brutos (ou
+# sobre outros nós), o grafo é calculado uma vez por universo com aritmética vetorizada de colunas
+# (denominador zero vira NaN) e cada avaliador recebe a coluna da razão já calculada.
+import os
+
+import numpy as np
+import pandas as pd
+
+from analiseativos import (
+    LucroLiquidoEvaluator, DividaBrutaEvaluator, LiquidezSecaEvaluator, LiquidezCorrenteEvaluator,
+    PLAtivosEvaluator, DivLiquidaPatrimonioLiquidoEvaluator, ROEEvaluator, ROAEvaluator,
+    GiroAtivoEvaluator, PVPEvaluator, PAtivoEvaluator, PLEvaluator,
+)
+
+
+# Campos brutos coletados por soup_to_dict (robov8) / linhas de stocks_data.xlsx
+CAMPOS_SOUP = {
+    'preco_acao': 'Valor atual',
+    'patrimonio_liquido': 'Patrimonio liquido',
+    'ativos_totais': 'Ativos',
+    'ativo_circulante': 'Ativo circulante',
+    'divida_bruta': 'Divida bruta',
+    'divida_liquida': 'Divida liquida',
+    'disponibilidades': 'Disponibilidade',
+    'valor_mercado': 'Valor de mercado',
+    'valor_firma': 'Valor de firma',
+    'total_acoes': 'No total de papeis',
+}
+
+
+def dividir(numerador, denominador):
+    '''
+    Divisão vetorizada com proteção: denominador zero (ou ausente) resulta em NaN em vez de erro.
+    '''
+    numerador = np.asarray(numerador, dtype=float)
+    denominador = np.asarray(denominador, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominador == 0, np.nan, numerador / np.where(denominador == 0, 1.0, denominador))
+
+
+def _percentual(numerador, denominador):
+    # Razão expressa em %, como esperam ROEEvaluator e ROAEvaluator
+    return dividir(numerador, denominador) * 100
+
+
+def _liquidez_seca(ativo_circulante, estoques, passivo_circulante):
+    # (Ativo Circulante - Estoques) / Passivo Circulante
+    return dividir(np.asarray(ativo_circulante, dtype=float) - np.asarray(estoques, dtype=float), passivo_circulante)
+
+
+# Nós do grafo: nome -> (dependências, função vetorizada). Dependências podem ser campos brutos ou outros nós.
+NOS_DERIVADOS = {
+    'margem_liquida': (('lucro_liquido', 'receita_liquida'), dividir),
+    'divida_bruta_ativos': (('divida_bruta', 'ativos_totais'), dividir),
+    'liquidez_seca': (('ativo_circulante', 'estoques', 'passivo_circulante'), _liquidez_seca),
+    'liquidez_corrente': (('ativo_circulante', 'passivo_circulante'), dividir),
+    'pl_ativos': (('patrimonio_liquido', 'ativos_totais'), dividir),
+    'div_liquida_pl': (('divida_liquida', 'patrimonio_liquido'), dividir),
+    'roe': (('lucro_liquido', 'patrimonio_liquido'), _percentual),
+    'roa': (('lucro_liquido', 'ativos_totais'), _percentual),
+    'giro_ativos': (('receita_liquida', 'ativos_totais'), dividir),
+    'vpa': (('patrimonio_liquido', 'total_acoes'), dividir),
+    'lpa': (('lucro_liquido', 'total_acoes'), dividir),
+    'p_vp': (('preco_acao', 'vpa'), dividir),
+    'p_l': (('preco_acao', 'lpa'), dividir),
+    'p_ativo': (('valor_mercado', 'ativos_totais'), dividir),
+}
+
+# Avaliador e método que classificam cada nó a partir do valor já calculado
+AVALIACOES_DERIVADAS = {
+    'margem_liquida': (LucroLiquidoEvaluator, 'avaliar_margem_liquida'),
+    'divida_bruta_ativos': (DividaBrutaEvaluator, 'avaliar_divida_ativos'),
+    'liquidez_seca': (LiquidezSecaEvaluator, 'avaliar_liquidez_seca'),
+    'liquidez_corrente': (LiquidezCorrenteEvaluator, 'avaliar'),
+    'pl_ativos': (PLAtivosEvaluator, 'avaliar'),
+    'div_liquida_pl': (DivLiquidaPatrimonioLiquidoEvaluator, 'avaliar'),
+    'roe': (ROEEvaluator, 'avaliar'),
+    'roa': (ROAEvaluator, 'avaliar'),
+    'giro_ativos': (GiroAtivoEvaluator, 'avaliar'),
+    'p_vp': (PVPEvaluator, 'avaliar'),
+    'p_l': (PLEvaluator, 'avaliar'),
+    'p_ativo': (PAtivoEvaluator, 'avaliar'),
+}
+
+
+def ordem_topologica(nos=None):
+    '''
+    Ordena os nós de forma que cada um venha depois das suas dependências derivadas.
+
+    Retorna:
+    - list: nomes dos nós em ordem de cálculo
+
+    Lança ValueError se houver dependência circular.
+    '''
+    nos = NOS_DERIVADOS if nos is None else nos
+    ordem = []
+    # Estado de visita: 1 = em andamento (detecta ciclo), 2 = concluído
+    estado = {}
+
+    def visitar(nome):
+        if estado.get(nome) == 2:
+            return
+        if estado.get(nome) == 1:
+            raise ValueError(f"Dependência circular envolvendo o indicador '{nome}'.")
+        estado[nome] = 1
+        for dependencia in nos[nome][0]:
+            # Só nós derivados precisam ser ordenados; campos brutos já estão disponíveis
+            if dependencia in nos:
+                visitar(dependencia)
+        estado[nome] = 2
+        ordem.append(nome)
+
+    for nome in nos:
+        visitar(nome)
+    return ordem
+
+
+def campos_brutos(dict_stocks, campos_extras=None):
+    '''
+    Monta a matriz ativos × campos brutos usada pelo grafo.
+
+    Parâmetros:
+    - dict_stocks: dict {ticker: dict de soup_to_dict} ou o DataFrame indicadores × tickers de stocks_data.xlsx
+    - campos_extras: pd.DataFrame opcional (tickers × campos) com campos que o robô não coleta,
+      como 'lucro_liquido', 'receita_liquida', 'estoques' e 'passivo_circulante'
+
+    Retorna:
+    - pd.DataFrame indexado por ticker com um campo bruto por coluna (entradas inválidas viram NaN)
+    '''
+    # Mesmo formato de stocks_data.xlsx: linhas = indicadores, colunas = tickers
+    df = dict_stocks if isinstance(dict_stocks, pd.DataFrame) else pd.DataFrame(dict_stocks)
+    brutos = pd.DataFrame(index=df.columns)
+    for campo, chave in CAMPOS_SOUP.items():
+        # A chave do total de papéis vem com sufixo variável do HTML ('help_outline'), então casa pelo prefixo
+        linhas = [indice for indice in df.index if str(indice).startswith(chave)]
+        brutos[campo] = pd.to_numeric(df.loc[linhas[0]], errors='coerce') if linhas else np.nan
+    if campos_extras is not None:
+        # Campos extras complementam (ou corrigem) os coletados
+        extras = campos_extras.apply(pd.to_numeric, errors='coerce').reindex(brutos.index)
+        brutos = extras.combine_first(brutos)
+    return brutos
+
+
+def calcular_derivados(brutos, nos=None):
+    '''
+    Calcula todos os nós do grafo de uma vez para o universo inteiro.
+
+    Parâmetros:
+    - brutos: pd.DataFrame ativos × campos brutos (ver campos_brutos)
+    - nos: dict de nós (padrão NOS_DERIVADOS)
+
+    Retorna:
+    - pd.DataFrame ativos × indicadores derivados (NaN onde faltar dado ou o denominador for zero)
+    '''
+    nos = NOS_DERIVADOS if nos is None else nos
+    # Colunas disponíveis: campos brutos + nós já calculados
+    colunas = {campo: brutos[campo].to_numpy(dtype=float) for campo in brutos.columns}
+    ausente = np.full(len(brutos), np.nan)
+    for nome in ordem_topologica(nos):
+        dependencias, funcao = nos[nome]
+        # Campo bruto ausente no universo vira coluna de NaN (o nó correspondente fica NaN)
+        colunas[nome] = funcao(*(colunas.get(dependencia, ausente) for dependencia in dependencias))
+    return pd.DataFrame({nome: colunas[nome] for nome in nos}, index=brutos.index)
+
+
+def avaliar_derivados(derivados, avaliacoes=None):
+    '''
+    Classifica as colunas de indicadores derivados com os avaliadores de analiseativos.
+
+    Parâmetros:
+    - derivados: pd.DataFrame retornado por calcular_derivados
+    - avaliacoes: dict {indicador: (classe do avaliador, método)} (padrão AVALIACOES_DERIVADAS)
+
+    Retorna:
+    - pd.DataFrame em formato longo com 'Ativo', 'Indicador', 'Valor', 'Classificacao' e 'Faixa'
+    '''
+    avaliacoes = AVALIACOES_DERIVADAS if avaliacoes is None else avaliacoes
+    linhas = []
+    for indicador, (classe, metodo) in avaliacoes.items():
+        if indicador not in derivados.columns:
+            continue
+        # Um avaliador por indicador, reaproveitado em todo o universo
+        avaliar = getattr(classe(), metodo)
+        for ticker, valor in derivados[indicador].items():
+            linhas.append(_linha_avaliacao(avaliar, ticker, indicador, valor))
+    return pd.DataFrame(linhas, columns=COLUNAS_AVALIACAO)
+
+
+# Colunas da tabela longa de avaliações
+COLUNAS_AVALIACAO = ['Ativo', 'Indicador', 'Valor', 'Classificacao', 'Faixa']
+
+
+def _linha_avaliacao(avaliar, ticker, indicador, valor):
+    # NaN (dado ausente ou denominador zero) vira None para cair no tratamento de erro do avaliador
+    resultado = avaliar(None if valor != valor else float(valor))
+    return {'Ativo': ticker, 'Indicador': indicador, 'Valor': valor,
+            'Classificacao': resultado.classificacao, 'Faixa': resultado.faixa}
+
+
+class GrafoIndicadores:
+    # Construtor que calcula o grafo inteiro uma vez e prepara o rastreamento de nós sujos
+    def __init__(self, brutos, nos=None, avaliacoes=None):
+        '''
+        Parâmetros:
+        - brutos: pd.DataFrame ativos × campos brutos (ver campos_brutos)
+        - nos: dict de nós (padrão NOS_DERIVADOS)
+        - avaliacoes: dict {indicador: (classe do avaliador, método)} (padrão AVALIACOES_DERIVADAS)
+        '''
+        self.nos = NOS_DERIVADOS if nos is None else nos
+        self.ordem = ordem_topologica(self.nos)
+        self.brutos = brutos.astype(float)
+        self.derivados = calcular_derivados(self.brutos, self.nos)
+        # Avaliadores instanciados uma vez, um por indicador
+        avaliacoes = AVALIACOES_DERIVADAS if avaliacoes is None else avaliacoes
+        self.avaliadores = {indicador: getattr(classe(), metodo)
+                            for indicador, (classe, metodo) in avaliacoes.items() if indicador in self.nos}
+        # Avaliações correntes por (ativo, indicador), exportáveis sem recalcular nada
+        self.avaliacoes = {
+            (ticker, indicador): _linha_avaliacao(avaliar, ticker, indicador, valor)
+            for indicador, avaliar in self.avaliadores.items()
+            for ticker, valor in self.derivados[indicador].items()
+        }
+        # Dependentes diretos de cada campo bruto ou nó (arestas invertidas do grafo)
+        self.dependentes = {}
+        for nome, (dependencias, _) in self.nos.items():
+            for dependencia in dependencias:
+                self.dependentes.setdefault(dependencia, set()).add(nome)
+        # Nós sujos por ativo, aguardando recálculo
+        self.sujos = {}
+        # Contadores expostos para conferir que só o necessário foi recalculado
+        self.nos_recalculados = 0
+        self.avaliacoes_recalculadas = 0
+
+    # Todos os nós afetados (direta ou transitivamente) por um campo bruto ou nó
+    def afetados(self, campo):
+        afetados = set()
+        pendentes = [campo]
+        while pendentes:
+            for dependente in self.dependentes.get(pendentes.pop(), ()):
+                if dependente not in afetados:
+                    afetados.add(dependente)
+                    pendentes.append(dependente)
+        return afetados
+
+    # Corrige um campo bruto de um ativo e marca como sujos apenas os nós que dependem dele
+    def atualizar(self, ticker, campo, valor):
+        # Ativo ou campo desconhecido falharia só no recálculo (KeyError) ou criaria uma linha nova em brutos
+        if ticker not in self.brutos.index:
+            raise ValueError(f"Ativo desconhecido: {ticker!r}")
+        # Campos válidos: colunas de brutos e campos brutos usados por algum nó (nós derivados não são corrigíveis)
+        if campo not in self.brutos.columns and (campo not in self.dependentes or campo in self.nos):
+            raise ValueError(f"Campo bruto desconhecido: {campo!r}")
+        valor = float(valor) if valor is not None else np.nan
+        anterior = self.brutos.at[ticker, campo] if campo in self.brutos.columns else np.nan
+        # Valor idêntico (inclusive NaN -> NaN) não suja nada
+        if anterior == valor or (anterior != anterior and valor != valor):
+            return
+        self.brutos.loc[ticker, campo] = valor
+        self.sujos.setdefault(ticker, set()).update(self.afetados(campo))
+
+    # Recalcula apenas os nós sujos de cada ativo, em ordem topológica, e reavalia os indicadores afetados
+    def recalcular(self):
+        '''
+        Retorna:
+        - pd.DataFrame com as linhas de avaliação que mudaram (mesmas colunas de avaliar_derivados),
+          prontas para reexportação
+        '''
+        alteradas = []
+        for ticker, sujos in self.sujos.items():
+            for nome in self.ordem:
+                if nome not in sujos:
+                    continue
+                dependencias, funcao = self.nos[nome]
+                # Mesma função vetorizada do cálculo em lote, aplicada a uma única linha
+                entradas = [self.derivados.at[ticker, dependencia] if dependencia in self.nos
+                            else self.brutos.at[ticker, dependencia] if dependencia in self.brutos.columns
+                            else np.nan
+                            for dependencia in dependencias]
+                valor = float(funcao(*(np.array([entrada]) for entrada in entradas))[0])
+                self.derivados.at[ticker, nome] = valor
+                self.nos_recalculados += 1
+                if nome in self.avaliadores:
+                    linha = _linha_avaliacao(self.avaliadores[nome], ticker, nome, valor)
+                    self.avaliacoes_recalculadas += 1
+                    # Só entra na reexportação o que de fato mudou
+                    anterior = self.avaliacoes[(ticker, nome)]
+                    mesmo_valor = linha['Valor'] == anterior['Valor'] or (linha['Valor'] != linha['Valor'] and
+                                                                          anterior['Valor'] != anterior['Valor'])
+                    if not mesmo_valor or linha['Classificacao'] != anterior['Classificacao']:
+                        self.avaliacoes[(ticker, nome)] = linha
+                        alteradas.append(linha)
+        self.sujos = {}
+        return pd.DataFrame(alteradas, columns=COLUNAS_AVALIACAO)
+
+    # Tabela longa com todas as avaliações correntes (sem recalcular)
+    def tabela(self):
+        return pd.DataFrame(list(self.avaliacoes.values()), columns=COLUNAS_AVALIACAO)
+
+    # Grava as avaliações em Excel: tabela completa ou só o delta devolvido por recalcular()
+    def exportar(self, nome_arquivo="indicadores_derivados.xlsx", alteradas=None):
+        """
+        Parâmetros:
+            nome_arquivo: planilha de destino.
+            alteradas: DataFrame devolvido por recalcular(); se informado e a planilha já existir,
+                só as linhas (Ativo, Indicador) presentes nele são substituídas/acrescentadas.
+        Retorna:
+            Número de linhas de avaliação gravadas (0 quando não há delta a aplicar).
+        """
+        if alteradas is None or not os.path.exists(nome_arquivo):
+            tabela = self.tabela()
+            tabela.to_excel(nome_arquivo, index=False)
+            print(f"Indicadores derivados salvos em {nome_arquivo}")
+            return len(tabela)
+        # Nada mudou desde a última exportação: a planilha continua válida
+        if alteradas.empty:
+            return 0
+        chave = ['Ativo', 'Indicador']
+        existente = pd.read_excel(nome_arquivo).set_index(chave)
+        novas = alteradas.set_index(chave)
+        # Linhas já exportadas são trocadas no lugar (ordem preservada); as inéditas vão para o fim
+        comuns = novas.index.intersection(existente.index)
+        existente = existente.astype(object)
+        existente.loc[comuns, :] = novas.loc[comuns, existente.columns].astype(object)
+        tabela = pd.concat([existente, novas.drop(comuns)]).reset_index()[COLUNAS_AVALIACAO]
+        tabela.to_excel(nome_arquivo, index=False)
+        print(f"{len(novas)} avaliações atualizadas em {nome_arquivo}")
+        return len(novas)
+
+
+# Bloco principal para testes
+if __name__ == "__main__":
+    import time
+
+    from leituraplanilhas import ler_planilha
+
+    # Universo coletado pelo robô (linhas = indicadores, colunas = tickers)
+    stocks = ler_planilha('stocks_data.xlsx', index_col='indicadores')
+    brutos = campos_brutos(stocks)
+    derivados = calcular_derivados(brutos)
+    # Conferência com as razões já publicadas pelo site (arredondadas a 2 casas)
+    publicado = pd.to_numeric(stocks.loc['PL/Ativos'], errors='coerce')
+    comparacao = pd.DataFrame({'pl_ativos': derivados['pl_ativos'].round(2), 'site': publicado})
+    print(comparacao.head(8).to_string())
+    # Classificação por ativo × indicador (indicadores sem campos brutos coletados ficam como 'Erro')
+    print(avaliar_derivados(derivados).pivot(index='Ativo', columns='Indicador', values='Classificacao').head(8).to_string())
+
+    # Mesma classificação pelo avaliador com campos brutos e pela coluna pré-calculada
+    extras = pd.DataFrame({'estoques': 0.1 * brutos['ativo_circulante'],
+                           'passivo_circulante': 0.5 * brutos['ativo_circulante']}, index=brutos.index)
+    derivados = calcular_derivados(campos_brutos(stocks, extras))
+    avaliador = LiquidezSecaEvaluator()
+    for ticker, linha in campos_brutos(stocks, extras).dropna(subset=['ativo_circulante']).iterrows():
+        direto = avaliador.avaliar(linha['ativo_circulante'], linha['estoques'], linha['passivo_circulante'])
+        assert direto.classificacao == avaliador.avaliar_liquidez_seca(derivados.at[ticker, 'liquidez_seca']).classificacao
+
+    # Benchmark: grafo vetorizado × divisões escalares por avaliador em 10 mil ativos sintéticos
+    rng = np.random.default_rng(42)
+    n = 10000
+    sinteticos = pd.DataFrame(rng.uniform(-1e9, 1e10, size=(n, 4)),
+                              columns=['lucro_liquido', 'receita_liquida', 'divida_bruta', 'ativos_totais'])
+    sinteticos.iloc[::97, 3] = 0.0
+    inicio = time.perf_counter()
+    calcular_derivados(sinteticos)
+    grafo = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    lucro, divida = LucroLiquidoEvaluator(), DividaBrutaEvaluator()
+    for linha in sinteticos.itertuples(index=False):
+        for calcular, args in ((lucro.calcular_margem_liquida, (linha.lucro_liquido, linha.receita_liquida)),
+                               (divida.calcular_divida_ativos, (linha.divida_bruta, linha.ativos_totais))):
+            try:
+                calcular(*args)
+            except ValueError:
+                pass
+    escalar = time.perf_counter() - inicio
+    print(f"Grafo completo ({len(NOS_DERIVADOS)} nós): {grafo * 1e3:.1f} ms | "
+          f"2 razões escalares: {escalar * 1e3:.1f} ms ({n} ativos)")
+
+    # Recálculo incremental: corrigir o patrimônio líquido de um ativo só recalcula os nós dependentes dele
+    grafo = GrafoIndicadores(campos_brutos(stocks))
+    # Ativo ou campo desconhecido é recusado já na correção
+    for ticker, campo in (('XXXX3', 'patrimonio_liquido'), ('ABEV3', 'patrimonio'), ('ABEV3', 'roe')):
+        try:
+            grafo.atualizar(ticker, campo, 1.0)
+            raise AssertionError(f"{ticker}/{campo} deveria ser recusado")
+        except ValueError:
+            pass
+    grafo.atualizar('ABEV3', 'patrimonio_liquido', 2e9)
+    alteradas = grafo.recalcular()
+    print(alteradas.to_string())
+    print(f"Nós recalculados: {grafo.nos_recalculados} | avaliações recalculadas: {grafo.avaliacoes_recalculadas}")
+    # pl_ativos, div_liquida_pl, roe, vpa e os dependentes de vpa (p_vp)
+    assert grafo.nos_recalculados == len(grafo.afetados('patrimonio_liquido')) == 5
+    # O resultado incremental coincide com o recálculo completo
+    completo = calcular_derivados(grafo.brutos)
+    assert completo.equals(grafo.derivados) or np.allclose(completo, grafo.derivados, equal_nan=True)
+    # Reexportação incremental: só as avaliações alteradas são regravadas na planilha
+    import tempfile
+    with tempfile.TemporaryDirectory() as pasta:
+        destino = os.path.join(pasta, 'indicadores_derivados.xlsx')
+        grafo_exportacao = GrafoIndicadores(brutos)
+        assert grafo_exportacao.exportar(destino) == len(grafo_exportacao.tabela())
+        grafo_exportacao.atualizar('ABEV3', 'patrimonio_liquido', 2e9)
+        delta = grafo_exportacao.recalcular()
+        assert grafo_exportacao.exportar(destino, alteradas=delta) == len(delta)
+        relida = pd.read_excel(destino)
+        assert len(relida) == len(grafo_exportacao.tabela())
+        # A planilha atualizada pelo delta coincide com a exportação completa
+        completa = grafo_exportacao.tabela()
+        pd.testing.assert_frame_equal(relida[['Ativo', 'Indicador']], completa[['Ativo', 'Indicador']])
+        pd.testing.assert_series_equal(relida['Classificacao'], completa['Classificacao'], check_dtype=False)
+        assert np.allclose(relida['Valor'].astype(float), completa['Valor'].astype(float), equal_nan=True)
+        assert grafo_exportacao.exportar(destino, alteradas=grafo_exportacao.recalcular()) == 0
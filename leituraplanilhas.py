@@ -0,0 +1,210 @@
+# Leitura das planilhas (StatusInvest.xlsx, stocks_data.xlsx...) com cache colunar ao lado do arquivo.
+# Razão: cada gerador (gerar_html_indicadores, construirsite, modaiscompartilhados, heatmapuniverso,
+# servidorpainel...) lia a planilha inteira com pd.read_excel(engine="openpyxl") e limpava os nomes das
+# colunas em toda execução, e o openpyxl interpreta o XML célula a célula, o que leva segundos em planilhas
+# grandes mesmo quando nada mudou. Aqui a aba é lida uma vez, normalizada (nomes sem espaços nas pontas,
+# linhas totalmente vazias removidas) e gravada num arquivo lateral em .cache_planilhas (feather quando o
+# pyarrow está instalado, senão pickle do pandas), com a chave (data, tamanho e hash do .xlsx) num
+# manifesto. Enquanto a planilha não muda, a leitura é a do arquivo lateral; data diferente com o mesmo
+# hash (arquivo regravado igual) só atualiza o manifesto. No mesmo processo, leituras repetidas da mesma
+# aba reaproveitam o DataFrame já carregado.
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:
+    # Sem o pyarrow o arquivo lateral é um pickle do pandas
+    pyarrow = None
+
+
+# Diretório dos arquivos laterais, criado ao lado de cada planilha, e manifesto com a chave de cada um
+DIRETORIO_CACHE = ".cache_planilhas"
+ARQUIVO_MANIFESTO = "manifesto.json"
+# Versão da normalização: mudar a normalização invalida todos os arquivos laterais
+VERSAO_NORMALIZACAO = 1
+# Bytes lidos por vez no hash da planilha
+BLOCO_HASH = 1 << 20
+
+# DataFrames já carregados neste processo: (caminho, aba) -> ((data, tamanho), DataFrame normalizado)
+_carregadas = {}
+
+
+def normalizar(df):
+    '''
+    Normalização guardada no arquivo lateral: nomes de coluna sem espaços nas pontas e sem as linhas
+    totalmente vazias.
+
+    Retorna:
+    - pd.DataFrame com índice 0..n-1
+    '''
+    df.columns = [str(coluna).strip() for coluna in df.columns]
+    return df.dropna(how='all').reset_index(drop=True)
+
+
+def _hash_arquivo(caminho):
+    # blake2b do conteúdo da planilha, lido em blocos
+    resumo = hashlib.blake2b(digest_size=16)
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(BLOCO_HASH), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def _gravar_lateral(df, destino):
+    # feather quando possível (colunas de tipo misto não cabem no Arrow e vão para o pickle)
+    temporario = destino + ".tmp"
+    if pyarrow is not None:
+        try:
+            df.to_feather(temporario)
+            os.replace(temporario, destino + ".feather")
+            return "feather"
+        except (TypeError, ValueError):
+            pass
+    df.to_pickle(temporario, compression=None)
+    os.replace(temporario, destino + ".pkl")
+    return "pkl"
+
+
+def _ler_lateral(destino, formato):
+    if formato == "feather":
+        return pd.read_feather(destino + ".feather")
+    return pd.read_pickle(destino + ".pkl", compression=None)
+
+
+def _ler_manifesto(caminho):
+    if not os.path.exists(caminho):
+        return {}
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _gravar_manifesto(caminho, manifesto):
+    temporario = caminho + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(manifesto, f, sort_keys=True, indent=1)
+    os.replace(temporario, caminho)
+
+
+def _carregar(caminho, aba, estado):
+    # Arquivo lateral válido, reaproveitado pelo hash, ou leitura da planilha e gravação do lateral
+    diretorio = os.path.join(os.path.dirname(caminho), DIRETORIO_CACHE)
+    caminho_manifesto = os.path.join(diretorio, ARQUIVO_MANIFESTO)
+    nome = f"{os.path.basename(caminho)}-{aba}"
+    # Abas com caracteres fora de nome de arquivo (ex.: '/') ficam com '_' no lateral
+    destino = os.path.join(diretorio, "".join(c if c.isalnum() or c in "._-" else "_" for c in nome))
+    manifesto = _ler_manifesto(caminho_manifesto)
+    entrada = manifesto.get(nome)
+    if entrada is not None and entrada['versao'] == VERSAO_NORMALIZACAO and \
+            os.path.exists(f"{destino}.{entrada['formato']}"):
+        if entrada['mtime_ns'] == estado.st_mtime_ns and entrada['tamanho'] == estado.st_size:
+            return _ler_lateral(destino, entrada['formato'])
+        if entrada['tamanho'] == estado.st_size and entrada['hash'] == _hash_arquivo(caminho):
+            # Planilha regravada sem mudar o conteúdo: só a data é atualizada
+            entrada['mtime_ns'] = estado.st_mtime_ns
+            _gravar_manifesto(caminho_manifesto, manifesto)
+            return _ler_lateral(destino, entrada['formato'])
+    assinatura = _hash_arquivo(caminho)
+    df = normalizar(pd.read_excel(caminho, sheet_name=aba, engine="openpyxl"))
+    os.makedirs(diretorio, exist_ok=True)
+    formato = _gravar_lateral(df, destino)
+    manifesto[nome] = {'mtime_ns': estado.st_mtime_ns, 'tamanho': estado.st_size, 'hash': assinatura,
+                       'versao': VERSAO_NORMALIZACAO, 'formato': formato}
+    # O manifesto só é gravado depois do lateral: uma gravação interrompida é refeita na próxima leitura
+    _gravar_manifesto(caminho_manifesto, manifesto)
+    return df
+
+
+def ler_planilha(arquivo, aba=0, index_col=None, aliases=None, obrigatorias=None):
+    '''
+    Lê uma aba da planilha pelo cache (ver o cabeçalho do módulo).
+
+    Parâmetros:
+    - arquivo: caminho do .xlsx
+    - aba: nome ou posição da aba (padrão: a primeira)
+    - index_col: coluna usada como índice (como em pd.read_excel)
+    - aliases: dict {nome na planilha: nome normalizado} aplicado às colunas (ex.: {'Fórmula': 'Formula'})
+    - obrigatorias: colunas que precisam existir (depois dos aliases); faltando alguma, ValueError
+
+    Retorna:
+    - pd.DataFrame (cópia: alterações não chegam ao cache)
+    '''
+    caminho = os.path.abspath(arquivo)
+    estado = os.stat(caminho)
+    chave = (caminho, aba)
+    carregada = _carregadas.get(chave)
+    if carregada is not None and carregada[0] == (estado.st_mtime_ns, estado.st_size):
+        df = carregada[1]
+    else:
+        df = _carregar(caminho, aba, estado)
+        _carregadas[chave] = ((estado.st_mtime_ns, estado.st_size), df)
+    # Cópia profunda: sem depender do copy-on-write (padrão só a partir do pandas 3), alterações de quem
+    # chamou não chegam ao DataFrame guardado para as próximas leituras
+    df = df.copy()
+    if aliases:
+        df = df.rename(columns=aliases)
+    if obrigatorias:
+        faltando = [coluna for coluna in obrigatorias if coluna not in df.columns]
+        if faltando:
+            raise ValueError(f"{arquivo} (aba {aba}): colunas ausentes {faltando}")
+    if index_col is not None:
+        df = df.set_index(index_col)
+    return df
+
+
+def descartar_carregadas():
+    '''
+    Esquece os DataFrames carregados neste processo (os arquivos laterais continuam valendo).
+    '''
+    _carregadas.clear()
+
+
+# Bloco principal: conferência com pd.read_excel nas planilhas do repositório e benchmark com uma
+# planilha de 100 mil linhas (as linhas de StatusInvest.xlsx repetidas com tickers derivados): leitura
+# direta, primeira leitura (planilha + gravação do lateral), leitura do lateral num processo novo,
+# leitura repetida no mesmo processo e leitura depois de regravar a planilha sem mudar o conteúdo.
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    for arquivo, aba, index_col in (("StatusInvest.xlsx", "IndiRentabilidade", None),
+                                    ("stocks_data.xlsx", 0, "indicadores")):
+        esperado = pd.read_excel(arquivo, sheet_name=aba, index_col=index_col, engine="openpyxl")
+        pd.testing.assert_frame_equal(ler_planilha(arquivo, aba, index_col), esperado)
+        print(f"{arquivo}: igual a pd.read_excel ({esperado.shape[0]} linhas)")
+
+    print(f"Arquivo lateral: {'feather' if pyarrow is not None else 'pickle (pyarrow não instalado)'}")
+    temporario = tempfile.mkdtemp()
+    try:
+        base = pd.read_excel("StatusInvest.xlsx", sheet_name="IndiRentabilidade", engine="openpyxl")
+        repeticoes = -(-100_000 // len(base))
+        grande = pd.concat([base.assign(Ativo=base["Ativo"] + f"_{i}") for i in range(repeticoes)],
+                           ignore_index=True).iloc[:100_000]
+        arquivo = os.path.join(temporario, "StatusInvest_100k.xlsx")
+        inicio = time.perf_counter()
+        grande.to_excel(arquivo, sheet_name="IndiRentabilidade", index=False)
+        print(f"Planilha de {len(grande):,} linhas gravada em {time.perf_counter() - inicio:.1f} s "
+              f"({os.path.getsize(arquivo) / 1e6:.1f} MB)")
+
+        def medir(rotulo, funcao):
+            inicio = time.perf_counter()
+            df = funcao()
+            print(f"  {rotulo} {time.perf_counter() - inicio:8.3f} s ({len(df):,} linhas)")
+            return df
+
+        direta = medir("pd.read_excel direto:           ", lambda: normalizar(
+            pd.read_excel(arquivo, sheet_name="IndiRentabilidade", engine="openpyxl")))
+        medir("primeira leitura (cria cache):  ", lambda: ler_planilha(arquivo, "IndiRentabilidade"))
+        descartar_carregadas()
+        lateral = medir("arquivo lateral (processo novo):", lambda: ler_planilha(arquivo, "IndiRentabilidade"))
+        medir("mesmo processo:                 ", lambda: ler_planilha(arquivo, "IndiRentabilidade"))
+        descartar_carregadas()
+        os.utime(arquivo)
+        medir("regravada igual (hash):         ", lambda: ler_planilha(arquivo, "IndiRentabilidade"))
+        pd.testing.assert_frame_equal(lateral, direta)
+    finally:
+        shutil.rmtree(temporario, ignore_errors=True)
@@ -0,0 +1,218 @@
+# Manifesto pré-calculado dos avaliadores do pacote analiseativos.
+# Razão: funcionalidades.py lista os avaliadores com inspect.getmembers (o que obriga a importar o módulo
+# inteiro, com mais de 7 mil linhas) e extrair_classes_e_parametros (roboteste.py) reprocessa o código
+# com ast a cada chamada. Aqui a análise com ast roda uma única vez, como etapa de build, e grava um JSON
+# com classe, assinatura de avaliar, agrupador, fórmula e tabela de faixas de cada avaliador; o carregador
+# só lê esse JSON (desatualizado, monta o manifesto na memória e avisa, sem gravar o arquivo). Classes definidas mais de uma vez (a última sobrescreve as anteriores em silêncio,
+# como PLAtivosEvaluator) ficam sinalizadas no manifesto.
+import ast
+import hashlib
+import json
+import os
+import time
+import warnings
+
+
+ARQUIVO_CODIGO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analiseativos')
+ARQUIVO_MANIFESTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manifesto_avaliadores.json')
+
+
+def _fontes(arquivo_codigo):
+    # Um arquivo .py ou todos os submódulos de um pacote, em ordem alfabética (sem __init__/__main__),
+    # mais a tabela de faixas regras.json do pacote
+    if os.path.isdir(arquivo_codigo):
+        return [os.path.join(arquivo_codigo, nome) for nome in sorted(os.listdir(arquivo_codigo))
+                if (nome.endswith('.py') and not nome.startswith('__')) or nome == 'regras.json']
+    return [arquivo_codigo]
+
+
+def _assinatura(funcao):
+    # Parâmetros (sem self) com o valor padrão em texto, na ordem da definição
+    argumentos = funcao.args.args[1:] if funcao.args.args and funcao.args.args[0].arg == 'self' else funcao.args.args
+    padroes = [None] * (len(argumentos) - len(funcao.args.defaults)) + [ast.unparse(d) for d in funcao.args.defaults]
+    return [{'nome': argumento.arg, 'padrao': padrao} for argumento, padrao in zip(argumentos, padroes)]
+
+
+def _texto(no):
+    # Valor literal de uma string (ou o código da expressão quando não for literal)
+    try:
+        valor = ast.literal_eval(no)
+        return ' '.join(valor.split()) if isinstance(valor, str) else valor
+    except ValueError:
+        return ast.unparse(no)
+
+
+def _atributos_init(classe):
+    # Atribuições self.<atributo> = <literal> feitas no construtor
+    atributos = {}
+    for no in classe.body:
+        if isinstance(no, ast.FunctionDef) and no.name == '__init__':
+            for instrucao in ast.walk(no):
+                if isinstance(instrucao, ast.Assign):
+                    for alvo in instrucao.targets:
+                        if isinstance(alvo, ast.Attribute) and isinstance(alvo.value, ast.Name) and alvo.value.id == 'self':
+                            atributos[alvo.attr] = _texto(instrucao.value)
+    return atributos
+
+
+def _faixas(corpo, condicao=None):
+    # Percorre a cadeia if/elif e coleta (condição, classificação, faixa) de cada gerar_resultado retornado
+    faixas = []
+    for no in corpo:
+        if isinstance(no, ast.If):
+            faixas += _faixas(no.body, ast.unparse(no.test))
+            faixas += _faixas(no.orelse, None)
+        elif isinstance(no, (ast.Try, ast.With, ast.For)):
+            faixas += _faixas(no.body, condicao)
+        elif isinstance(no, ast.Return) and isinstance(no.value, ast.Call) and \
+                isinstance(no.value.func, ast.Attribute) and no.value.func.attr == 'gerar_resultado':
+            argumentos = {k.arg: k.value for k in no.value.keywords}
+            faixas.append({
+                'condicao': condicao,
+                'classificacao': _texto(argumentos['classificacao']) if 'classificacao' in argumentos else None,
+                'faixa': _texto(argumentos['faixa']) if 'faixa' in argumentos else None,
+            })
+    return faixas
+
+
+def montar_manifesto(arquivo_codigo=ARQUIVO_CODIGO):
+    '''
+    Analisa o código-fonte com ast e monta o manifesto na memória (sem gravar; ver gerar_manifesto).
+
+    Retorna:
+    - dict: o manifesto
+    '''
+    classes = {}
+    definicoes = {}
+    funcoes = []
+    resumo = hashlib.sha256()
+    fontes = _fontes(arquivo_codigo)
+    # Só o nível de cada módulo: é o que fica acessível via import
+    nos = []
+    regras = {}
+    for fonte in fontes:
+        with open(fonte, 'rb') as f:
+            bruto = f.read()
+        resumo.update(bruto)
+        # Faixas dos avaliadores que classificam pela tabela de regras
+        if fonte.endswith('.json'):
+            regras = json.loads(bruto.decode('utf-8'))
+            continue
+        modulo = os.path.splitext(os.path.basename(fonte))[0]
+        arvore = ast.parse(bruto.decode('utf-8'))
+        nos += [(modulo, no) for no in arvore.body]
+        funcoes += [no.name for no in arvore.body if isinstance(no, ast.FunctionDef) and not no.name.startswith('_')]
+    for modulo, no in nos:
+        # Classes privadas (ex.: _Catalogo) não fazem parte da interface do pacote
+        if not isinstance(no, ast.ClassDef) or no.name.startswith('_'):
+            continue
+        definicoes.setdefault(no.name, []).append(f'{modulo}:{no.lineno}')
+        metodos = {m.name: m for m in no.body if isinstance(m, ast.FunctionDef)}
+        atributos = _atributos_init(no)
+        entrada = {
+            'classe': no.name,
+            'modulo': modulo,
+            'linha': no.lineno,
+            'avaliador': 'avaliar' in metodos,
+            'agrupador': atributos.get('agrupador'),
+            'formula': atributos.get('formula'),
+            'metodos': {nome: _assinatura(m) for nome, m in metodos.items()
+                        if nome == 'avaliar' or nome.startswith(('avaliar_', 'calcular'))},
+            # Faixas da tabela de regras ou, sem regra, da cadeia if/elif do método que classifica
+            # (avaliar_* quando avaliar só delega a ele)
+            'faixas': regras[no.name]['faixas'] if no.name in regras else
+            next((f for f in (_faixas(m.body) for nome, m in metodos.items()
+                              if nome == 'avaliar' or nome.startswith('avaliar_')) if f), []),
+        }
+        # Mesma semântica do Python: a última definição vence
+        classes[no.name] = entrada
+    duplicadas = {nome: linhas for nome, linhas in definicoes.items() if len(linhas) > 1}
+    for nome, linhas in duplicadas.items():
+        classes[nome]['sombreia_linhas'] = linhas[:-1]
+    return {
+        'arquivo': os.path.basename(arquivo_codigo),
+        'sha256': resumo.hexdigest(),
+        'funcoes': funcoes,
+        'duplicadas': duplicadas,
+        'classes': classes,
+    }
+
+
+def gerar_manifesto(arquivo_codigo=ARQUIVO_CODIGO, destino=ARQUIVO_MANIFESTO):
+    '''
+    Etapa de build (python manifestoavaliadores.py): monta o manifesto e grava o JSON versionado.
+
+    Retorna:
+    - dict: o manifesto gravado
+    '''
+    manifesto = montar_manifesto(arquivo_codigo)
+    with open(destino, 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, ensure_ascii=False, indent=1)
+    return manifesto
+
+
+def carregar_manifesto(caminho=ARQUIVO_MANIFESTO, arquivo_codigo=ARQUIVO_CODIGO, verificar=True):
+    '''
+    Lê o manifesto gerado por gerar_manifesto, sem importar nem reprocessar o pacote analiseativos.
+    Nunca grava o arquivo: só a etapa de build (python manifestoavaliadores.py) o regenera.
+
+    Parâmetros:
+    - verificar: se True, compara o hash do código-fonte com o do manifesto; desatualizado (ou ausente),
+      o manifesto é montado só na memória, com um aviso para rodar a etapa de build
+
+    Retorna:
+    - dict com 'classes', 'funcoes' e 'duplicadas'
+    '''
+    if not os.path.exists(caminho):
+        warnings.warn(f"{os.path.basename(caminho)} ausente: rode python manifestoavaliadores.py "
+                      "(manifesto montado na memória nesta execução)", stacklevel=2)
+        return montar_manifesto(arquivo_codigo)
+    with open(caminho, encoding='utf-8') as f:
+        manifesto = json.load(f)
+    if verificar and os.path.exists(arquivo_codigo):
+        # Só o hash do conteúdo: datas mudam a cada checkout e o manifesto é versionado, então não são
+        # guardadas nele (hashear as fontes custa menos de 1 ms)
+        resumo = hashlib.sha256()
+        for fonte in _fontes(arquivo_codigo):
+            with open(fonte, 'rb') as f:
+                resumo.update(f.read())
+        if resumo.hexdigest() != manifesto['sha256']:
+            warnings.warn(f"{os.path.basename(caminho)} desatualizado em relação a {manifesto['arquivo']}: rode "
+                          "python manifestoavaliadores.py (manifesto montado na memória nesta execução)", stacklevel=2)
+            return montar_manifesto(arquivo_codigo)
+    return manifesto
+
+
+def avaliadores(manifesto=None):
+    '''
+    Retorna os nomes das classes que possuem avaliar, agrupados por submódulo.
+    '''
+    manifesto = manifesto or carregar_manifesto()
+    return [nome for nome, classe in manifesto['classes'].items() if classe['avaliador']]
+
+
+# Bloco principal: etapa de build e comparação de tempo com as varreduras em tempo de execução
+if __name__ == "__main__":
+    import importlib
+    import inspect
+
+    inicio = time.perf_counter()
+    manifesto = gerar_manifesto()
+    print(f"Manifesto gerado em {(time.perf_counter() - inicio) * 1e3:.0f} ms: "
+          f"{len(avaliadores(manifesto))} avaliadores, {len(manifesto['funcoes'])} funções")
+    for nome, linhas in manifesto['duplicadas'].items():
+        print(f"AVISO: classe {nome} definida {len(linhas)} vezes (em {', '.join(linhas)}); "
+              f"a definição em {linhas[-1]} sobrescreve as anteriores")
+
+    inicio = time.perf_counter()
+    manifesto = carregar_manifesto()
+    carga = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    modulo = importlib.import_module('analiseativos')
+    # Com o pacote preguiçoso, listar as classes exige carregar todos os submódulos
+    classes = [nome for nome in modulo.__all__ if inspect.isclass(getattr(modulo, nome))]
+    importacao = time.perf_counter() - inicio
+    print(f"Carregar manifesto: {carga * 1e3:.1f} ms | import + varredura das classes: {importacao * 1e3:.1f} ms")
+    # O manifesto enxerga exatamente as mesmas classes que o import
+    assert set(classes) == set(manifesto['classes'])
+    print(json.dumps(manifesto['classes']['ROEEvaluator']['faixas'][:2], ensure_ascii=False, indent=1))
@@ -0,0 +1,541 @@
+# Páginas interativas de indicadores (variantes de modals_plus6_from_excel) no modo compartilhado.
+# Razão: os geradores (gerador1/gerador2/gerar3/gerar4.txt e o que produziu modals_plus6_from_excel)
+# serializam o conjunto inteiro com json.dumps e embutem os dados, o CSS e o JS em cada página: cada
+# variante tem de 85 a 260 KB e quase tudo é o mesmo texto de definição/descrição repetido (em cada
+# cartão, no atributo data-p e na chave de busca data-k). Aqui os dados vão para arquivos compartilhados
+# em que cada texto distinto é guardado uma única vez e as linhas guardam só índices: dados.js, com o
+# necessário para o primeiro desenho (ativo, indicador, valor, classificação e faixa), e textos.js, com os
+# textos longos (fórmula, definição, referência e descrição), que só é carregado quando um cartão ou modal
+# é aberto. O CSS (estilo.css) e o JS comum (comum.js: expansão dos dados, cartões, filtros e carga dos
+# textos) também são compartilhados, e cada variante traz só a marcação e o script próprios. Os dados são
+# scripts (e não .json buscados com fetch) para que as páginas abram direto do disco; os irmãos .gz/.br
+# vêm de artefatoscomprimidos. A busca do primeiro desenho cobre só os campos curtos.
+import html
+import json
+import math
+import os
+import time
+
+import pandas as pd
+
+from artefatoscomprimidos import comprimir_artefatos
+from leituraplanilhas import ler_planilha
+
+
+# Planilha de indicadores (a mesma de gerar_html_indicadores)
+ARQUIVO_DADOS = "StatusInvest.xlsx"
+ABA_DADOS = "IndiRentabilidade"
+# Colunas dos registros, na ordem em que aparecem nos modais
+COLUNAS = ("Agrupador", "Fonte", "Ativo", "Indicador", "Formula", "Definição", "Referencia", "Valor",
+           "Classificacao", "Faixa", "Descricao")
+# Única coluna numérica; as demais viram índices nas tabelas de textos
+COLUNA_VALOR = "Valor"
+# Colunas de texto longo, fora do carregamento inicial (buscadas quando um cartão ou modal é aberto)
+COLUNAS_LONGAS = ("Formula", "Definição", "Referencia", "Descricao")
+# Arquivos compartilhados gravados ao lado das páginas
+ARQUIVO_PAYLOAD = "dados.js"
+ARQUIVO_TEXTOS = "textos.js"
+ARQUIVO_CSS = "estilo.css"
+ARQUIVO_JS = "comum.js"
+# Orçamento do carregamento inicial de cada variante (página + estilo.css + comum.js + dados.js) para
+# um universo de ATIVOS_ORCAMENTO ativos, conferido por verificar_orcamento
+ORCAMENTO_INICIAL = 256 * 1024
+ATIVOS_ORCAMENTO = 400
+# Diretório de saída padrão
+DIRETORIO_SAIDA = "modals_compartilhados"
+
+# Cor de fundo de cada classificação (as mesmas das páginas de modals_plus6_from_excel)
+CORES_CLASSIFICACAO = {
+    "Ótimo": "#14532d",
+    "Muito Bom": "#166534",
+    "Bom": "#15803d",
+    "Moderado": "#a16207",
+    "Ruim": "#b91c1c",
+    "Crítico": "#991b1b",
+    "Muito Crítico": "#7f1d1d",
+}
+COR_PADRAO = "#374151"
+# Filtros por classificação (chips), na ordem das páginas originais
+FILTROS = ("Ótimo", "Muito Bom", "Bom", "Moderado", "Ruim", "Crítico", "Muito Crítico")
+
+# CSS comum a todas as variantes (idêntico nas seis páginas de modals_plus6_from_excel)
+CSS = r"""
+:root{--bg:#0f172a;--panel:#0b1220;--text:#e5e7eb;--muted:#9aa0ab;--border:#1f2937;--accent:#60a5fa}
+*{box-sizing:border-box}
+body{margin:0;background:var(--bg);color:var(--text);font:14px/1.55 ui-sans-serif,system-ui,-apple-system,Segoe UI,Roboto,Ubuntu,Cantarell,Noto Sans,Arial}
+.shell{max-width:1280px;margin:24px auto;padding:0 16px 48px}
+.header{position:sticky;top:0;z-index:5;background:linear-gradient(90deg,#0b1220,#101826);border:1px solid var(--border);border-radius:10px;padding:12px 14px;margin-bottom:14px;box-shadow:0 10px 30px rgba(0,0,0,.25)}
+.badge{display:inline-block;padding:3px 10px;border:1px solid #334155;border-radius:999px;background:#0c1424;color:#93c5fd;font-weight:700}
+.meta{color:var(--muted);margin-top:4px}
+.controls{display:flex;gap:8px;flex-wrap:wrap;margin:10px 0}
+.search{flex:1;min-width:220px;padding:10px;border:1px solid #334155;border-radius:8px;background:#0c1424;color:#e5e7eb}
+.chips{display:flex;gap:8px;flex-wrap:wrap}
+.chip{display:inline-block;padding:4px 10px;border-radius:999px;border:1px solid #334155;background:#0c1424;color:#cbd5e1;text-decoration:none}
+.grid{display:grid;gap:12px}
+.hm{grid-template-columns:repeat(auto-fit,minmax(220px,1fr))}
+.card{padding:12px;border:1px solid var(--border);border-radius:12px;background:#0c1424;box-shadow:0 10px 25px rgba(0,0,0,.25);position:relative}
+.k{font-weight:700;color:#cbd5e1}
+.small{font-size:12px;color:var(--muted)}
+.val{font-weight:800}
+.btn{display:inline-block;background:#111827;border:1px solid #374151;color:#cbd5e1;padding:6px 10px;border-radius:8px;text-decoration:none}
+.table-mini{width:100%;border-collapse:collapse}
+.table-mini td{padding:2px 0;vertical-align:top}
+.table-mini td:first-child{color:#9aa0ab;padding-right:8px;white-space:nowrap}
+/* Modal base */
+.modal{position:fixed;inset:0;background:rgba(0,0,0,.55);display:none;align-items:center;justify-content:center;z-index:20}
+.modal.open{display:flex}
+.modal .box{background:#0c1424;border:1px solid #334155;border-radius:12px;padding:16px;max-width:900px;width:96%;max-height:86vh;overflow:auto}
+.modal .close{position:sticky;top:0;display:block;margin-left:auto}
+/* Variantes */
+.toolbar{display:flex;gap:8px;flex-wrap:wrap;align-items:center;margin:8px 0}
+.sel{background:#0c1424;border:1px solid #334155;color:#e5e7eb;border-radius:8px;padding:6px}
+.counter{display:inline-flex;gap:6px;flex-wrap:wrap}
+.badge-count{border:1px solid #334155;background:#0c1424;border-radius:999px;padding:2px 8px}
+/* Tabs no modal */
+.tabs{display:flex;gap:6px;margin:8px 0}
+.tab{padding:6px 10px;border:1px solid #334155;border-radius:999px;background:#0c1424;color:#cbd5e1;cursor:pointer}
+.tab.active{border-color:#60a5fa;color:#93c5fd}
+.tab-panel{display:none}
+.tab-panel.active{display:block}
+/* Fullscreen board */
+.board{display:grid;gap:6px}
+.tile{display:flex;align-items:center;justify-content:center;border:1px solid #334155;border-radius:8px;background:#0c1424;min-height:60px;font-weight:700}
+/* Story mode */
+.center{display:grid;grid-template-columns:1fr 480px;gap:12px}
+.viewer{border:1px solid #334155;border-radius:12px;background:#0c1424;padding:12px}
+.side{border:1px solid #334155;border-radius:12px;background:#0c1424;padding:12px}
+.progress{height:8px;background:#1f2937;border-radius:999px;overflow:hidden}
+.progress>i{display:block;height:100%;background:linear-gradient(90deg,#60a5fa,#2563eb);width:0}
+/* Command palette */
+.kbar{position:fixed;inset:0;background:rgba(0,0,0,.55);display:none;align-items:flex-start;justify-content:center;padding-top:10vh;z-index:30}
+.kbar.open{display:flex}
+.kbox{background:#0c1424;border:1px solid #334155;border-radius:12px;padding:12px;max-width:720px;width:92%}
+.kbox input{width:100%;padding:10px;border:1px solid #334155;border-radius:8px;background:#0b1220;color:#e5e7eb}
+.klist{margin-top:8px;max-height:320px;overflow:auto}
+.kitem{padding:8px;border-bottom:1px solid #1f2937;cursor:pointer}
+.kitem:hover{background:#0e1626}
+"""
+
+# JS comum: expande o payload inicial em registros (window.DADOS, textos longos vazios), desenha os
+# cartões, carrega textos.js na primeira abertura de um cartão (comTextos) e liga os filtros
+JS_COMUM = r"""(function(){
+  const P=window.DADOS_INDICADORES, T=P.textos, DADOS=[];
+  P.blocos.forEach(function(b){ const ativo=T[b[0]]; b[1].forEach(function(l){ const it=P.itens[l[0]], fx=P.faixas[l[1]];
+    DADOS.push({'Agrupador':T[it[0]],'Fonte':T[it[1]],'Ativo':ativo,'Indicador':T[it[2]],'Formula':'','Definição':'','Referencia':'','Valor':l[2]===null?'':l[2],'Classificacao':T[fx[0]],'Faixa':T[fx[1]],'Descricao':'','__bg':P.cores[T[fx[0]]]||P.cor_padrao,'__k':T[it[2]],'__l':fx[2]}); }); });
+  const CURTAS=['Agrupador','Fonte','Ativo','Indicador','Valor','Classificacao','Faixa'], LONGAS=['Formula','Definição','Referencia','Descricao'];
+  const CHAVES=DADOS.map(function(p){ return CURTAS.map(function(c){ return String(p[c]); }).join(' ').toLowerCase(); });
+  function esc(s){ return String(s).replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;').replace(/'/g,'&#39;'); }
+  window.DADOS=DADOS;
+  window.registro=function(el){ return DADOS[parseInt(el.getAttribute('data-i'))]; };
+  // Textos longos: textos.js é buscado uma única vez; as aberturas durante o carregamento esperam na fila
+  let longos=null; const espera=[];
+  function preencher(p){ if(longos&&!p.__t){ const g=longos.grupos[p.__l]; LONGAS.forEach(function(c,j){ p[c]=longos.textos[g[j]]; }); p.__t=1; } return p; }
+  window.comTextos=function(p,cb){
+    if(longos){ cb(preencher(p)); return; }
+    espera.push([p,cb]); if(espera.length>1) return;
+    const s=document.createElement('script'); s.src=P.arquivo_textos;
+    s.onload=function(){ longos=window.TEXTOS_INDICADORES; espera.splice(0).forEach(function(x){ x[1](preencher(x[0])); }); };
+    s.onerror=function(){ espera.splice(0).forEach(function(x){ x[1](x[0]); }); s.remove(); };
+    document.head.appendChild(s);
+  };
+  window.renderizarCartoes=function(alvo){
+    alvo.innerHTML=DADOS.map(function(p,i){ return `<div class='card item' style='background:${p.__bg}' data-i='${i}' data-k="${esc(CHAVES[i])}" data-cls="${esc(String(p['Classificacao']).toLowerCase())}"><div class='k'>${esc(p['Indicador'])}</div><div class='small'>${esc(p['Ativo'])} · ${esc(p['Agrupador'])} · ${esc(p['Fonte'])}</div><div class='val'>${esc(p['Valor'])} <span class='small'>(${esc(p['Classificacao'])})</span></div></div>`; }).join('');
+  };
+  const alvo=document.getElementById('wrap')||document.getElementById('board');
+  if(alvo) window.renderizarCartoes(alvo);
+})();
+(function(){
+  const q=document.getElementById('q');
+  const fs=[...document.querySelectorAll('.f')];
+  let f='__all';
+  function apply(){
+    const v=(q&&q.value?q.value:'').toLowerCase();
+    document.querySelectorAll('.item').forEach(it=>{
+      const okK=(it.getAttribute('data-k')||'').includes(v);
+      const okF=(f==='__all'||it.getAttribute('data-cls')===f);
+      it.style.display=(okK&&okF)?'':'none';
+    });
+  }
+  q&&q.addEventListener('input',apply);
+  fs.forEach(x=>x.addEventListener('click',e=>{e.preventDefault(); f=x.getAttribute('data-f'); window.currentFilter=f; apply(); }));
+  window.applyFilters=apply;
+})();
+"""
+
+# Modal (comum às variantes com cartões)
+_MODAL = "<div id='modal' class='modal'><div class='box'><a href='#' class='btn close'>Fechar</a><div id='modal-body'></div></div></div>"
+
+# Variantes: nome do arquivo -> (marcação depois dos filtros, marcação do conteúdo, script próprio); {cartoes}
+# marca onde os cartões entram (vazio no modo compartilhado: comum.js os desenha)
+VARIANTES = {
+    "hfm01_modal_tabs.html": ("", "<div id='wrap' class='grid hm'>{cartoes}</div>" + _MODAL, r"""(function(){
+  const modal=document.getElementById('modal'); const body=document.getElementById('modal-body');
+  function renderTabs(p){
+    const resumo = `<div class='tab-panel active'>
+      <div class='small'><b>Ativo:</b> ${p['Ativo']||''}</div>
+      <div><b>${p['Indicador']||''}</b> · <span class='small'>${p['Classificacao']||''}</span></div>
+      <div class='small'><b>Agrupador:</b> ${p['Agrupador']||''} · <b>Fonte:</b> ${p['Fonte']||''}</div>
+      <div style='margin-top:6px'><b>Valor:</b> ${p['Valor']||''}</div>
+      <div class='small' style='margin-top:6px'><b>Faixa:</b> ${p['Faixa']||''}</div>
+      <div class='small' style='margin-top:6px'><b>Descricao:</b> ${p['Descricao']||''}</div>
+    </div>`;
+    const tecnico = `<div class='tab-panel'>
+      <div class='small'><b>Fórmula:</b> ${p['Formula']||''}</div>
+      <div class='small' style='margin-top:6px'><b>Definição:</b> ${p['Definição']||p['Definicao']||''}</div>
+      <div class='small' style='margin-top:6px'><b>Referencia:</b> ${p['Referencia']||''}</div>
+    </div>`;
+    const completoRows = Object.keys(p).filter(k=>!k.startsWith('__')).map(k=>`<tr><td>${k}</td><td>${p[k]||''}</td></tr>`).join('');
+    const completo = `<div class='tab-panel'><table class='table-mini'>${completoRows}</table></div>`;
+    body.innerHTML = `<div style='margin-bottom:8px;font-weight:800'>${p['Indicador']||''}</div>
+      <div class='tabs'>
+        <a href='#' class='tab active' data-t='0'>Resumo</a>
+        <a href='#' class='tab' data-t='1'>Técnico</a>
+        <a href='#' class='tab' data-t='2'>Completo</a>
+      </div>${resumo}${tecnico}${completo}`;
+    const tabs=[...body.querySelectorAll('.tab')]; const panels=[...body.querySelectorAll('.tab-panel')];
+    tabs.forEach(tb=>tb.addEventListener('click', function(e){ e.preventDefault(); tabs.forEach(x=>x.classList.remove('active')); panels.forEach(x=>x.classList.remove('active')); tb.classList.add('active'); panels[parseInt(tb.getAttribute('data-t'))].classList.add('active'); }));
+  }
+  document.getElementById('wrap').addEventListener('click', function(e){ const card=e.target.closest('.item'); if(!card) return; comTextos(registro(card), function(p){ renderTabs(p); modal.classList.add('open'); }); });
+  modal.addEventListener('click', function(e){ if(e.target.classList.contains('modal')||e.target.classList.contains('close')) modal.classList.remove('open'); });
+})();"""),
+    "hfm02_modal_compare.html": ("", "<div id='wrap' class='grid hm'>{cartoes}</div>" + _MODAL, r"""(function(){
+  const modal=document.getElementById('modal'); const body=document.getElementById('modal-body');
+  const INDEX = {}; DADOS.forEach(x=>{ (INDEX[x['Indicador']]=INDEX[x['Indicador']]||[]).push(x); });
+  function renderCompare(p){
+    const peers = INDEX[p['Indicador']]||[];
+    const rows = peers.map(x=>`<tr><td>${x['Ativo']||''}</td><td>${x['Valor']||''}</td><td>${x['Classificacao']||''}</td><td>${x['Faixa']||''}</td></tr>`).join('');
+    const full = Object.keys(p).filter(k=>!k.startsWith('__')).map(k=>`<tr><td>${k}</td><td>${p[k]||''}</td></tr>`).join('');
+    body.innerHTML = `<div style='font-weight:800;margin-bottom:8px'>${p['Indicador']||''}</div>
+      <div class='small' style='margin-bottom:8px'><b>Ativo:</b> ${p['Ativo']||''} · <b>Valor:</b> ${p['Valor']||''} · <b>Classificação:</b> ${p['Classificacao']||''}</div>
+      <div class='tabs'><a href='#' class='tab active' data-t='0'>Comparar</a><a href='#' class='tab' data-t='1'>Detalhes</a></div>
+      <div class='tab-panel active'><table class='table-mini'><tr><td><b>Ativo</b></td><td><b>Valor</b></td><td><b>Status</b></td><td><b>Faixa</b></td></tr>${rows}</table></div>
+      <div class='tab-panel'><table class='table-mini'>${full}</table></div>`;
+    const tabs=[...body.querySelectorAll('.tab')]; const panels=[...body.querySelectorAll('.tab-panel')];
+    tabs.forEach(tb=>tb.addEventListener('click', function(e){ e.preventDefault(); tabs.forEach(x=>x.classList.remove('active')); panels.forEach(x=>x.classList.remove('active')); tb.classList.add('active'); panels[parseInt(tb.getAttribute('data-t'))].classList.add('active'); }));
+  }
+  document.getElementById('wrap').addEventListener('click', function(e){ const card=e.target.closest('.item'); if(!card) return; comTextos(registro(card), function(p){ renderCompare(p); modal.classList.add('open'); }); });
+  modal.addEventListener('click', function(e){ if(e.target.classList.contains('modal')||e.target.classList.contains('close')) modal.classList.remove('open'); });
+})();"""),
+    "hfm03_modal_keyboard.html": ("", "<div id='wrap' class='grid hm'>{cartoes}</div>" + _MODAL, r"""(function(){
+  const modal=document.getElementById('modal'); const body=document.getElementById('modal-body');
+  let current=-1; let items=[];
+  function openAt(i){ if(i<0||i>=items.length) return; current=i; comTextos(registro(items[i]), function(p){ body.innerHTML = Object.keys(p).filter(k=>!k.startsWith('__')).map(k=>`<div class='small'><b>${k}:</b> ${p[k]||''}</div>`).join(''); modal.classList.add('open'); }); location.hash = 'i='+i; }
+  function close(){ modal.classList.remove('open'); }
+  function fromHash(){ const h=location.hash.replace('#',''); const m=h.match(/i=(\d+)/); if(m){ const idx=parseInt(m[1]); if(!isNaN(idx)){ items=[...document.querySelectorAll('#wrap .item')]; openAt(idx); } } }
+  document.getElementById('wrap').addEventListener('click',function(e){ items=[...document.querySelectorAll('#wrap .item')]; const card=e.target.closest('.item'); if(!card) return; openAt(items.indexOf(card)); });
+  document.addEventListener('keydown',function(e){ if(!modal.classList.contains('open')) return; if(e.key==='Escape'){ close(); } if(e.key==='ArrowRight'){ openAt(Math.min(items.length-1,current+1)); } if(e.key==='ArrowLeft'){ openAt(Math.max(0,current-1)); } });
+  modal.addEventListener('click', function(e){ if(e.target.classList.contains('modal')||e.target.classList.contains('close')) close(); });
+  fromHash();
+})();"""),
+    "hfr01_fullscreen_board.html": ("<div class='toolbar'><label class='small'>Densidade:</label><input type='range' id='dens' min='60' max='220' value='120'><span class='small' id='dval'>120px</span></div>",
+                                    "<div id='board' class='board'>{cartoes}</div>" + _MODAL, r"""(function(){
+  const board=document.getElementById('board'); const dens=document.getElementById('dens'); const dval=document.getElementById('dval'); const modal=document.getElementById('modal'); const body=document.getElementById('modal-body');
+  function applyDensity(){ const px=dens.value; dval.textContent=px+'px'; board.style.gridTemplateColumns='repeat(auto-fit, minmax('+px+'px, 1fr))'; [...board.children].forEach(t=>t.classList.add('tile')); }
+  applyDensity(); dens.addEventListener('input',applyDensity);
+  board.addEventListener('click', function(e){ const card=e.target.closest('.item'); if(!card) return; comTextos(registro(card), function(p){ body.innerHTML = Object.keys(p).filter(k=>!k.startsWith('__')).map(k=>`<div class='small'><b>${k}:</b> ${p[k]||''}</div>`).join(''); modal.classList.add('open'); }); });
+  modal.addEventListener('click', function(e){ if(e.target.classList.contains('modal')||e.target.classList.contains('close')) modal.classList.remove('open'); });
+})();"""),
+    "hfr02_story_mode.html": ("", "<div class='center'><div class='viewer'><div class='toolbar'><a href='#' id='prev' class='btn'>◀</a> <a href='#' id='play' class='btn'>Play</a> <a href='#' id='next' class='btn'>▶</a></div><div id='view'></div><div class='progress'><i id='prog'></i></div></div><div class='side'><div class='small'>Sequência</div><div id='list'></div></div></div>", r"""(function(){
+  const DATA=DADOS;
+  let idx=0; let timer=null; const view=document.getElementById('view'); const list=document.getElementById('list'); const prog=document.getElementById('prog');
+  function render(){ const atual=idx; comTextos(DATA[idx]||{}, function(p){ if(atual===idx) view.innerHTML = Object.keys(p).filter(k=>!k.startsWith('__')).map(k=>`<div class='small'><b>${k}:</b> ${p[k]||''}</div>`).join(''); }); [...list.children].forEach((li,i)=>{ li.style.background = i===idx ? '#0e1626':'transparent'; }); prog.style.width = (((idx+1)/DATA.length)*100)+'%'; }
+  list.innerHTML = DATA.map((p,i)=>`<div class='kitem' data-i='${i}'>${p['Indicador']||''} · <span class='small'>${p['Ativo']||''}</span></div>`).join('');
+  list.addEventListener('click',function(e){ const it=e.target.closest('.kitem'); if(!it) return; idx=parseInt(it.getAttribute('data-i')); stop(); render(); });
+  function next(){ idx=(idx+1)%DATA.length; render(); }
+  function prev(){ idx=(idx-1+DATA.length)%DATA.length; render(); }
+  function play(){ stop(); timer=setInterval(next, 2000); }
+  function stop(){ if(timer){ clearInterval(timer); timer=null; } }
+  document.getElementById('next').onclick=(e)=>{e.preventDefault(); next();};
+  document.getElementById('prev').onclick=(e)=>{e.preventDefault(); prev();};
+  document.getElementById('play').onclick=(e)=>{e.preventDefault(); if(timer){ stop(); e.target.textContent='Play'; } else { play(); e.target.textContent='Pause'; }};
+  document.addEventListener('keydown',function(e){ if(e.key==='ArrowRight') next(); if(e.key==='ArrowLeft') prev(); });
+  render();
+})();"""),
+    "hfr03_command_palette.html": ("<a href='#' class='btn' id='openK'>Abrir (Ctrl+K)</a>",
+                                   "<div id='wrap' class='grid hm'>{cartoes}</div>" + _MODAL + "<div id='kbar' class='kbar'><div class='kbox'><input id='kk' placeholder='Digite para buscar (Enter abre modal)'><div id='klist' class='klist'></div></div></div>", r"""(function(){
+  const kbar=document.getElementById('kbar'); const kk=document.getElementById('kk'); const list=document.getElementById('klist'); const openK=document.getElementById('openK');
+  const modal=document.getElementById('modal'); const body=document.getElementById('modal-body');
+  function allItems(){ return [...document.querySelectorAll('#wrap .item')]; }
+  function openPalette(){ kbar.classList.add('open'); kk.value=''; renderList(''); kk.focus(); }
+  function closePalette(){ kbar.classList.remove('open'); }
+  function renderList(q){ const v=(q||'').toLowerCase(); const items=allItems().filter(it=> (it.getAttribute('data-k')||'').includes(v)); list.innerHTML = items.slice(0,100).map((it,i)=>`<div class='kitem' data-i='${i}'>${it.querySelector('.k').textContent} · <span class='small'>${(it.getAttribute('data-k')||'').slice(0,80)}</span></div>`).join(''); list.__items = items; }
+  function openModalFrom(it){ comTextos(registro(it), function(p){ body.innerHTML = Object.keys(p).filter(k=>!k.startsWith('__')).map(k=>`<div class='small'><b>${k}:</b> ${p[k]||''}</div>`).join(''); modal.classList.add('open'); }); }
+  document.addEventListener('keydown', function(e){ if((e.ctrlKey||e.metaKey) && e.key.toLowerCase()==='k'){ e.preventDefault(); openPalette(); } });
+  openK&&openK.addEventListener('click', function(e){ e.preventDefault(); openPalette(); });
+  kk.addEventListener('input', function(){ renderList(kk.value); });
+  kk.addEventListener('keydown', function(e){ if(e.key==='Escape'){ closePalette(); } if(e.key==='Enter'){ const first=list.querySelector('.kitem'); if(first){ const it=list.__items[parseInt(first.getAttribute('data-i'))]; closePalette(); openModalFrom(it); } } });
+  list.addEventListener('click', function(e){ const li=e.target.closest('.kitem'); if(!li) return; const it=list.__items[parseInt(li.getAttribute('data-i'))]; closePalette(); openModalFrom(it); });
+  modal.addEventListener('click', function(e){ if(e.target.classList.contains('modal')||e.target.classList.contains('close')) modal.classList.remove('open'); });
+})();"""),
+}
+
+
+def carregar_registros(arquivo=ARQUIVO_DADOS, aba=ABA_DADOS, tickers=None):
+    '''
+    Lê os indicadores da planilha, só com as colunas dos modais.
+
+    Parâmetros:
+    - tickers: lista de ativos; None lê todos
+
+    Retorna:
+    - pd.DataFrame com as colunas de COLUNAS
+    '''
+    df = ler_planilha(arquivo, aba)
+    if tickers is not None:
+        df = df[df["Ativo"].isin(tickers)]
+    return df[list(COLUNAS)].reset_index(drop=True)
+
+
+def _internar(tabela, indices, valor):
+    # Posição do valor na tabela, acrescentado na primeira vez
+    posicao = indices.get(valor)
+    if posicao is None:
+        posicao = indices[valor] = len(tabela)
+        tabela.append(valor)
+    return posicao
+
+
+def _texto(valor):
+    # Células vazias viram texto vazio, como nos modais originais
+    return "" if valor is None or valor != valor else str(valor)
+
+
+def montar_payload(df):
+    '''
+    Monta os dois arquivos de dados compartilhados.
+
+    O inicial (dados.js) traz só o necessário para desenhar cartões, filtros e busca: cada texto curto
+    distinto uma única vez, os indicadores (agrupador, fonte, indicador) e as faixas (classificação,
+    faixa e o grupo de textos longos) distintos, e por ativo as linhas [indicador, faixa, valor]. Os
+    textos longos (fórmula, definição, referência e descrição), deduplicados, vão para textos.js, que a
+    página só busca quando um cartão ou modal é aberto.
+
+    Retorna:
+    - (payload inicial, payload dos textos longos), dicts prontos para JSON
+    '''
+    textos, indices_textos = [], {}
+    longos, indices_longos = [], {}
+    grupos, indices_grupos = [], {}
+    itens, indices_itens = [], {}
+    faixas, indices_faixas = [], {}
+    blocos = []
+    ativo_anterior = None
+    colunas = [df[coluna].tolist() for coluna in COLUNAS]
+    for agrupador, fonte, ativo, indicador, formula, definicao, referencia, valor, classificacao, faixa, descricao in zip(*colunas):
+        grupo = _internar(grupos, indices_grupos, tuple(_internar(longos, indices_longos, _texto(t))
+                                                        for t in (formula, definicao, referencia, descricao)))
+        item = _internar(itens, indices_itens, tuple(_internar(textos, indices_textos, _texto(t))
+                                                     for t in (agrupador, fonte, indicador)))
+        posicao_faixa = _internar(faixas, indices_faixas, (_internar(textos, indices_textos, _texto(classificacao)),
+                                                           _internar(textos, indices_textos, _texto(faixa)), grupo))
+        # NaN e infinito não existem em JSON: viram null
+        if not isinstance(valor, (int, float)) or math.isnan(valor) or math.isinf(valor):
+            valor = None
+        # Um bloco por sequência de linhas do mesmo ativo (preserva a ordem da planilha)
+        if ativo != ativo_anterior:
+            blocos.append([_internar(textos, indices_textos, _texto(ativo)), []])
+            ativo_anterior = ativo
+        blocos[-1][1].append([item, posicao_faixa, valor])
+    inicial = {'textos': textos, 'itens': itens, 'faixas': faixas, 'blocos': blocos, 'cores': CORES_CLASSIFICACAO,
+               'cor_padrao': COR_PADRAO, 'arquivo_textos': ARQUIVO_TEXTOS}
+    return inicial, {'textos': longos, 'grupos': grupos}
+
+
+def _script_dados(variavel, payload):
+    # Arquivo .js que atribui o payload a uma variável global (abre direto do disco, sem fetch)
+    return (f"window.{variavel}=" + json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+            + ";\n").encode("utf-8")
+
+
+def gravar_assets(diretorio, payload, longos):
+    '''
+    Grava os arquivos compartilhados: dados.js, textos.js, estilo.css e comum.js.
+
+    Retorna:
+    - list dos caminhos gravados
+    '''
+    os.makedirs(diretorio, exist_ok=True)
+    dados = _script_dados("DADOS_INDICADORES", payload)
+    textos = _script_dados("TEXTOS_INDICADORES", longos)
+    caminhos = []
+    for nome, conteudo in ((ARQUIVO_PAYLOAD, dados), (ARQUIVO_TEXTOS, textos), (ARQUIVO_CSS, CSS.encode("utf-8")),
+                           (ARQUIVO_JS, JS_COMUM.encode("utf-8"))):
+        caminho = os.path.join(diretorio, nome)
+        with open(caminho, "wb") as f:
+            f.write(conteudo)
+        caminhos.append(caminho)
+    return caminhos
+
+
+def bytes_iniciais(diretorio, nome):
+    '''
+    Bytes baixados antes do primeiro desenho da variante: a página, estilo.css, comum.js e dados.js
+    (textos.js fica de fora: só é buscado ao abrir um cartão).
+    '''
+    return sum(os.path.getsize(os.path.join(diretorio, arquivo))
+               for arquivo in (nome, ARQUIVO_CSS, ARQUIVO_JS, ARQUIVO_PAYLOAD))
+
+
+def verificar_orcamento(df, limite=ORCAMENTO_INICIAL):
+    '''
+    Gera as variantes num diretório temporário e confere se o carregamento inicial de cada uma cabe
+    no orçamento.
+
+    Parâmetros:
+    - df: DataFrame com as colunas de COLUNAS (ex.: o universo de 400 ativos)
+    - limite: orçamento em bytes
+
+    Retorna:
+    - dict {variante: bytes iniciais}; levanta ValueError se alguma variante passar do limite
+    '''
+    import shutil
+    import tempfile
+
+    diretorio = tempfile.mkdtemp()
+    try:
+        gerar_variantes(df, diretorio, comprimir=False)
+        medidas = {nome: bytes_iniciais(diretorio, nome) for nome in VARIANTES}
+    finally:
+        shutil.rmtree(diretorio)
+    excedidas = {nome: tamanho for nome, tamanho in medidas.items() if tamanho > limite}
+    if excedidas:
+        raise ValueError(f"Carregamento inicial acima do orçamento de {limite} bytes: {excedidas}")
+    return medidas
+
+
+def _cabecalho(nome, ativos, registros, extra_controles, estilo):
+    # Cabeçalho, busca e filtros de classificação (iguais em todas as variantes)
+    chips = ''.join(f"<a href='#' class='chip f' data-f='{html.escape(c.lower())}'>{html.escape(c)}</a>" for c in FILTROS)
+    return (f'<!doctype html><html lang="pt-BR"><head><meta charset="utf-8"><meta name="viewport" '
+            f'content="width=device-width, initial-scale=1"><title>{nome}</title>{estilo}</head><body>'
+            f'<div class="shell"><div class=\'header\'><span class=\'badge\'>Modal/Interativo – '
+            f'{html.escape(", ".join(ativos))}</span><div class=\'meta\'>Registros: {registros} · Colunas: '
+            f'{len(COLUNAS)}</div></div><div class=\'controls\'><input id=\'q\' class=\'search\' '
+            f'placeholder=\'Buscar em qualquer coluna...\'><div class=\'chips\'>{chips}'
+            f"<a href='#' class='chip f' data-f='__all'>Todos</a></div>{extra_controles}</div>")
+
+
+def pagina_variante(nome, ativos, registros):
+    '''
+    Página de uma variante no modo compartilhado: só a marcação e o script próprios; dados, CSS e JS
+    comum vêm dos arquivos compartilhados.
+    '''
+    extra_controles, conteudo, script = VARIANTES[nome]
+    return (_cabecalho(nome, ativos, registros, extra_controles, f'<link rel="stylesheet" href="{ARQUIVO_CSS}">')
+            + conteudo.format(cartoes='') + f'\n<script src="{ARQUIVO_PAYLOAD}"></script><script src="{ARQUIVO_JS}"></script>'
+            + f'<script>\n{script}\n</script>\n</div></body></html>')
+
+
+def gerar_variantes(df, diretorio=DIRETORIO_SAIDA, variantes=None, comprimir=True):
+    '''
+    Gera as variantes no modo compartilhado (payload, CSS e JS gravados uma única vez).
+
+    Parâmetros:
+    - df: DataFrame com as colunas de COLUNAS
+    - diretorio: diretório de saída
+    - variantes: nomes de VARIANTES; por padrão, todas
+    - comprimir: se True, grava os irmãos .gz/.br de cada arquivo (ver artefatoscomprimidos)
+
+    Retorna:
+    - list dos caminhos gravados (páginas e arquivos compartilhados, sem os irmãos comprimidos)
+    '''
+    caminhos = gravar_assets(diretorio, *montar_payload(df))
+    ativos = df["Ativo"].drop_duplicates().astype(str).tolist()
+    for nome in variantes or VARIANTES:
+        caminho = os.path.join(diretorio, nome)
+        with open(caminho, "w", encoding="utf-8") as f:
+            f.write(pagina_variante(nome, ativos, len(df)))
+        caminhos.append(caminho)
+    if comprimir:
+        comprimir_artefatos(diretorio)
+    return caminhos
+
+
+def _pagina_embutida(nome, df):
+    # Modo anterior (dados, CSS e JS embutidos em cada página, data-p em cada cartão), mantido só para
+    # comparação no benchmark
+    extra_controles, conteudo, script = VARIANTES[nome]
+    registros = []
+    for linha in df.to_dict(orient="records"):
+        registro = {c: ("" if c != COLUNA_VALOR and linha[c] != linha[c] else linha[c]) for c in COLUNAS}
+        registro["__bg"] = CORES_CLASSIFICACAO.get(registro["Classificacao"], COR_PADRAO)
+        registro["__k"] = registro["Indicador"]
+        registros.append(registro)
+    cartoes = ''.join(
+        f"<div class='card item' style='background:{r['__bg']}' data-k=\"{html.escape(' '.join(str(linha[c]) for c in COLUNAS).lower())}\" "
+        f"data-cls=\"{html.escape(str(r['Classificacao']).lower())}\" data-p=\"{html.escape(json.dumps(r))}\"><div class='k'>"
+        f"{r['Indicador']}</div><div class='small'>{r['Ativo']} · {r['Agrupador']} · {r['Fonte']}</div><div class='val'>"
+        f"{r['Valor']} <span class='small'>({r['Classificacao']})</span></div></div>"
+        for r, linha in zip(registros, df.to_dict(orient="records")))
+    # Só as variantes que percorrem todos os registros (comparação, story mode) embutiam a lista inteira
+    dados = f"window.DADOS={json.dumps(registros)};\n" if "DADOS" in script else ""
+    ativos = df["Ativo"].drop_duplicates().astype(str).tolist()
+    return (_cabecalho(nome, ativos, len(df), extra_controles, f"<style>{CSS}</style>") + conteudo.format(cartoes=cartoes)
+            + f"\n<script>\n{dados}window.registro=el=>JSON.parse(el.getAttribute('data-p')); window.comTextos=(p,cb)=>cb(p);\n"
+            + f"{JS_COMUM.split('})();', 1)[1]}\n</script>\n<script>\n{script}\n</script>\n</div></body></html>")
+
+
+def medir_modos(df, diretorio):
+    '''
+    Benchmark: gera todas as variantes no modo anterior (tudo embutido em cada página) e no
+    compartilhado, medindo tempo, bytes gravados e o maior carregamento inicial de uma variante.
+
+    Retorna:
+    - pd.DataFrame com uma linha por modo
+    '''
+    linhas = []
+    for modo in ("embutido", "compartilhado"):
+        destino = os.path.join(diretorio, modo)
+        os.makedirs(destino, exist_ok=True)
+        inicio = time.perf_counter()
+        if modo == "embutido":
+            caminhos = []
+            for nome in VARIANTES:
+                caminho = os.path.join(destino, nome)
+                with open(caminho, "w", encoding="utf-8") as f:
+                    f.write(_pagina_embutida(nome, df))
+                caminhos.append(caminho)
+        else:
+            caminhos = gerar_variantes(df, destino)
+        segundos = time.perf_counter() - inicio
+        # No modo anterior a página é o carregamento inicial inteiro
+        inicial = max(os.path.getsize(os.path.join(destino, nome)) if modo == "embutido"
+                      else bytes_iniciais(destino, nome) for nome in VARIANTES)
+        linhas.append({'modo': modo, 'arquivos': len(caminhos), 'segundos': segundos,
+                       'kb': sum(os.path.getsize(c) for c in caminhos) / 1024, 'kb_inicial': inicial / 1024})
+    resultado = pd.DataFrame(linhas)
+    resultado['kb_gz_dados'] = os.path.getsize(os.path.join(diretorio, "compartilhado", ARQUIVO_PAYLOAD + ".gz")) / 1024
+    return resultado
+
+
+# Bloco principal: gera as variantes no modo compartilhado para os ativos de modals_plus6_from_excel
+# (ABEV3 e AERI3), compara os dois modos nesses ativos e no universo inteiro e confere o orçamento do
+# carregamento inicial com 400 ativos
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    from construirsite import universo_sintetico
+
+    universo = carregar_registros()
+    amostra = universo[universo["Ativo"].isin(["ABEV3", "AERI3"])].reset_index(drop=True)
+    caminhos = gerar_variantes(amostra)
+    print(f"{len(caminhos)} arquivos em {DIRETORIO_SAIDA}/ ({sum(os.path.getsize(c) for c in caminhos) / 1024:.0f} KB)")
+    payload, longos = montar_payload(universo)
+    print(f"Universo: {len(universo)} linhas, {len(payload['textos'])} textos curtos e {len(longos['textos'])} "
+          f"longos distintos, {len(payload['itens'])} indicadores, {len(payload['faixas'])} faixas")
+    originais = [os.path.join("modals_plus6_from_excel", nome) for nome in VARIANTES]
+    if all(os.path.exists(c) for c in originais):
+        print(f"modals_plus6_from_excel/ (gerado no modo anterior): {sum(os.path.getsize(c) for c in originais) / 1024:.0f} KB")
+    pd.set_option('display.width', 200)
+    for rotulo, df in (("ABEV3 e AERI3", amostra), ("universo inteiro", universo)):
+        temporario = tempfile.mkdtemp()
+        try:
+            print(f"\n{rotulo} ({len(df)} linhas)")
+            print(medir_modos(df, temporario).round(3).to_string(index=False))
+        finally:
+            shutil.rmtree(temporario)
+    grande = universo_sintetico(universo, ATIVOS_ORCAMENTO)
+    medidas = verificar_orcamento(grande)
+    print(f"\n{ATIVOS_ORCAMENTO} ativos ({len(grande)} linhas): carregamento inicial de {max(medidas.values()) / 1024:.0f} KB "
+          f"no máximo, dentro do orçamento de {ORCAMENTO_INICIAL / 1024:.0f} KB")
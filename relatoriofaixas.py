@@ -0,0 +1,48 @@
+# Relatório das divergências de faixas entre as funções evaluate_* (analisefundamentalista.py) e as
+# classes de analiseativos que avaliam o mesmo indicador, e entre as definições repetidas de evaluate_*.
+# As faixas vêm da tabela única de regras (analiseativos/regras.json); ver analiseativos/regras.py.
+import pandas as pd
+
+from analiseativos.regras import divergencias
+
+
+ARQUIVO_RELATORIO = 'divergencias_faixas.csv'
+
+
+def relatorio_divergencias():
+    '''
+    Monta o relatório de divergências de faixas.
+
+    Retorna:
+    - pd.DataFrame com uma linha por par comparado: pontos de corte de cada lado ('c]' = c na faixa de
+      baixo, '[c' = c na faixa de cima, '{c}' = c sozinho numa faixa), cortes exclusivos de cada lado e
+      os valores de teste em que as classificações diferem
+    '''
+    linhas = []
+    for item in divergencias():
+        linhas.append({
+            'regra': item['regra'],
+            'comparada_com': item['comparada_com'],
+            'relacao': item['relacao'],
+            'cortes': ' '.join(item['cortes']),
+            'cortes_comparada': ' '.join(item['cortes_comparada']),
+            'so_na_regra': ' '.join(item['so_na_regra']),
+            'so_na_comparada': ' '.join(item['so_na_comparada']),
+            # Mesmos limites nos dois lados
+            'limites_iguais': not item['so_na_regra'] and not item['so_na_comparada'],
+            'valores_divergentes': len(item['classificacoes_diferentes']),
+            'exemplos': '; '.join(f'{valor:g}: {atual} x {outra}'
+                                  for valor, atual, outra in item['classificacoes_diferentes'][:4]),
+        })
+    return pd.DataFrame(linhas)
+
+
+# Bloco principal: imprime o resumo e grava o relatório completo em CSV
+if __name__ == "__main__":
+    relatorio = relatorio_divergencias()
+    pd.set_option('display.width', 200)
+    print(relatorio[['regra', 'comparada_com', 'relacao', 'so_na_regra', 'so_na_comparada',
+                     'valores_divergentes']].to_string(index=False))
+    print(f"\n{(~relatorio['limites_iguais']).sum()} de {len(relatorio)} pares com limites de faixa diferentes")
+    relatorio.to_csv(ARQUIVO_RELATORIO, index=False)
+    print(f"Relatório completo em {ARQUIVO_RELATORIO}")
@@ -0,0 +1,408 @@
+# Servidor local do painel: relatórios gerados, matriz de avaliação em JSON e aviso de nova execução.
+# Razão: os relatórios eram abertos como arquivos HTML estáticos que ficavam desatualizados a cada
+# execução do robô, e atualizar o painel exigia gerar (e abrir) tudo de novo. Aqui um servidor HTTP da
+# biblioteca padrão serve os relatórios gerados (usando os irmãos .gz/.br de artefatoscomprimidos quando
+# o navegador aceita), publica a matriz de códigos de avaliação (payload de heatmapuniverso) em
+# /api/matriz com ETag, respondendo 304 a quem já tem a versão atual, e avisa as páginas abertas por
+# server-sent events (/api/eventos) quando uma execução nova termina: um observador recarrega a matriz
+# quando stocks_data.xlsx muda (ou quando alguém chama POST /api/recarregar), e o painel (/) só busca a
+# matriz de novo quando recebe o aviso com um ETag diferente do que tem.
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+import urllib.parse
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from artefatoscomprimidos import EXTENSOES, irmao_atual
+from avaliacaoparalela import avaliar_universo, preparar_valores
+from heatmapuniverso import montar_heatmap, pagina_heatmap
+from leituraplanilhas import ler_planilha
+
+
+HOST_PADRAO = "127.0.0.1"
+PORTA_PADRAO = 8765
+# Planilha gravada pelo robô a cada execução e diretório raiz dos relatórios servidos
+ARQUIVO_DADOS = "stocks_data.xlsx"
+DIRETORIO_RELATORIOS = "."
+# Segundos entre verificações da planilha e entre comentários de manutenção no fluxo de eventos
+INTERVALO_VERIFICACAO = 2.0
+INTERVALO_PING = 15.0
+# Codificações pré-comprimidas (Content-Encoding, formato do irmão), em ordem de preferência
+CODIFICACOES = (("br", "br"), ("gzip", "gz"))
+
+# Painel: a página do heatmap buscando a matriz na API e recarregando-a a cada aviso de versão nova.
+# cache:'no-cache' faz o navegador revalidar com If-None-Match, e um 304 reaproveita o corpo em cache.
+_SCRIPT_PAINEL = """<script>
+(function(){
+  let etag=null;
+  function atualizar(){
+    fetch('/api/matriz',{cache:'no-cache'}).then(function(r){
+      if(!r.ok) return null; etag=r.headers.get('ETag'); return r.json();
+    }).then(function(d){ if(d) carregarHeatmap(d); });
+  }
+  atualizar();
+  new EventSource('/api/eventos').addEventListener('matriz',function(e){
+    if(JSON.parse(e.data).etag!==etag) atualizar();
+  });
+})();
+</script>"""
+
+
+class MatrizPublicada:
+    '''
+    Última matriz de avaliação publicada (corpo JSON, versão gzip e ETag), com espera por versões novas.
+    '''
+
+    def __init__(self):
+        self._condicao = threading.Condition()
+        self._encerrada = False
+        self.versao = 0
+        self.etag = None
+        self.corpo = b''
+        self.corpo_gzip = b''
+        self.publicada_em = None
+
+    def publicar(self, codigos, agrupadores=None):
+        '''
+        Publica a matriz de uma execução e acorda quem espera por versão nova.
+
+        Parâmetros:
+        - codigos: pd.DataFrame int8 ativos × indicadores (ver avaliacaoparalela.avaliar_universo)
+        - agrupadores: dict {indicador: agrupador} (ver heatmapuniverso.montar_heatmap)
+
+        Retorna:
+        - bool: False se o conteúdo é igual ao da versão atual (nada muda, nem o ETag)
+        '''
+        corpo = json.dumps(montar_heatmap(codigos, agrupadores), ensure_ascii=False,
+                           separators=(',', ':')).encode('utf-8')
+        etag = f'"{hashlib.blake2b(corpo, digest_size=16).hexdigest()}"'
+        if etag == self.etag:
+            return False
+        # A compressão é feita uma vez por versão, fora da trava
+        corpo_gzip = gzip.compress(corpo, compresslevel=6, mtime=0)
+        with self._condicao:
+            self.corpo, self.corpo_gzip, self.etag = corpo, corpo_gzip, etag
+            self.versao += 1
+            self.publicada_em = time.time()
+            self._condicao.notify_all()
+        return True
+
+    def atual(self):
+        '''
+        Retorna:
+        - tuple (corpo, corpo gzip, ETag, publicada em) da mesma versão
+        '''
+        with self._condicao:
+            return self.corpo, self.corpo_gzip, self.etag, self.publicada_em
+
+    def aguardar(self, versao, tempo_maximo):
+        '''
+        Espera até existir versão diferente de versao (ou até tempo_maximo segundos, ou o encerramento).
+
+        Retorna:
+        - tuple (versão atual, ETag atual)
+        '''
+        with self._condicao:
+            self._condicao.wait_for(lambda: self.versao != versao or self._encerrada, tempo_maximo)
+            return self.versao, self.etag
+
+    def encerrar(self):
+        # Libera todos os fluxos de eventos em espera
+        with self._condicao:
+            self._encerrada = True
+            self._condicao.notify_all()
+
+
+def carregar_matriz(arquivo=ARQUIVO_DADOS):
+    '''
+    Lê a planilha de uma execução do robô e avalia o universo.
+
+    Retorna:
+    - pd.DataFrame int8 ativos × indicadores
+    '''
+    stocks = ler_planilha(arquivo, index_col='indicadores')
+    return avaliar_universo(preparar_valores(stocks), processos=1)
+
+
+def _observar(servidor):
+    # Recarrega a matriz quando a planilha muda (data e tamanho) ou quando um recarregamento é pedido
+    assinatura = None
+    while not servidor.parar.is_set():
+        pedido = servidor.acordar.is_set()
+        servidor.acordar.clear()
+        try:
+            estado = os.stat(servidor.arquivo_dados)
+            atual = (estado.st_mtime_ns, estado.st_size)
+            if atual != assinatura or pedido:
+                # Planilha ainda sendo gravada não abre: a assinatura só avança depois de uma leitura completa
+                if servidor.matriz.publicar(carregar_matriz(servidor.arquivo_dados)):
+                    print(f"Matriz versão {servidor.matriz.versao} publicada ({servidor.matriz.etag})")
+                assinatura = atual
+        except Exception as erro:
+            print(f"Falha ao carregar {servidor.arquivo_dados}: {erro}")
+        servidor.acordar.wait(servidor.intervalo)
+
+
+def _codificacoes_aceitas(cabecalho):
+    # Nomes do Accept-Encoding sem q=0
+    aceitas = set()
+    for item in (cabecalho or '').split(','):
+        nome, _, parametros = item.strip().partition(';')
+        if nome and parametros.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            aceitas.add(nome.strip().lower())
+    return aceitas
+
+
+def _etag_confere(cabecalho, etag):
+    # If-None-Match: lista de ETags (fortes ou fracos) ou '*'
+    if not cabecalho or etag is None:
+        return False
+    candidatos = [item.strip() for item in cabecalho.split(',')]
+    return '*' in candidatos or etag in (c[2:] if c.startswith('W/') else c for c in candidatos)
+
+
+class _Manipulador(BaseHTTPRequestHandler):
+    # Conexões persistentes: toda resposta leva Content-Length, exceto o fluxo de eventos, que fecha a conexão
+    protocol_version = "HTTP/1.1"
+    server_version = "PainelIndicadores/1.0"
+
+    def log_message(self, formato, *args):
+        if not self.server.silencioso:
+            super().log_message(formato, *args)
+
+    def _responder(self, status, corpo=b'', tipo=None, cabecalhos=()):
+        # Resposta completa; 304 vai sem corpo
+        self.send_response(status)
+        if tipo:
+            self.send_header("Content-Type", tipo)
+        for nome, valor in cabecalhos:
+            self.send_header(nome, valor)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        if corpo and self.command != "HEAD":
+            self.wfile.write(corpo)
+
+    def do_GET(self):
+        caminho = urllib.parse.urlsplit(self.path).path
+        if caminho == "/":
+            self._responder(HTTPStatus.OK, pagina_heatmap(_SCRIPT_PAINEL, "Painel do universo").encode('utf-8'),
+                            "text/html; charset=utf-8", [("Cache-Control", "no-cache")])
+        elif caminho == "/api/matriz":
+            self._matriz()
+        elif caminho == "/api/eventos":
+            self._eventos()
+        else:
+            self._arquivo(caminho)
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        if urllib.parse.urlsplit(self.path).path == "/api/recarregar":
+            # O observador recarrega na sua thread; quem pediu recebe o aviso pelo fluxo de eventos
+            self.server.acordar.set()
+            self._responder(HTTPStatus.ACCEPTED)
+        else:
+            self._responder(HTTPStatus.NOT_FOUND)
+
+    def _matriz(self):
+        corpo, corpo_gzip, etag, publicada_em = self.server.matriz.atual()
+        if etag is None:
+            self._responder(HTTPStatus.SERVICE_UNAVAILABLE, cabecalhos=[("Retry-After", "2")])
+            return
+        cabecalhos = [("ETag", etag), ("Cache-Control", "no-cache"), ("Vary", "Accept-Encoding"),
+                      ("Last-Modified", formatdate(publicada_em, usegmt=True))]
+        if _etag_confere(self.headers.get("If-None-Match"), etag):
+            self._responder(HTTPStatus.NOT_MODIFIED, cabecalhos=cabecalhos)
+            return
+        if "gzip" in _codificacoes_aceitas(self.headers.get("Accept-Encoding")):
+            corpo = corpo_gzip
+            cabecalhos.append(("Content-Encoding", "gzip"))
+        self._responder(HTTPStatus.OK, corpo, "application/json; charset=utf-8", cabecalhos)
+
+    def _eventos(self):
+        # Fluxo text/event-stream: a versão atual na conexão e cada versão nova depois dela
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        if self.command == "HEAD":
+            return
+        versao = None
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            self.wfile.flush()
+            while not self.server.parar.is_set():
+                atual, etag = self.server.matriz.aguardar(versao, INTERVALO_PING)
+                if atual != versao and etag is not None:
+                    dados = json.dumps({'versao': atual, 'etag': etag})
+                    self.wfile.write(f"event: matriz\ndata: {dados}\n\n".encode('utf-8'))
+                else:
+                    # Comentário: mantém a conexão viva e detecta o cliente que saiu
+                    self.wfile.write(b": ping\n\n")
+                self.wfile.flush()
+                versao = atual
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _arquivo(self, caminho):
+        # Relatório gerado dentro da raiz; arquivos e pastas ocultos (.git, manifestos) e extensões que
+        # não são de relatório (planilhas, código) não são servidos
+        partes = [parte for parte in urllib.parse.unquote(caminho).split('/') if parte]
+        if any(parte.startswith('.') or os.sep in parte for parte in partes):
+            self._responder(HTTPStatus.NOT_FOUND)
+            return
+        alvo = os.path.join(self.server.raiz, *partes)
+        if os.path.isdir(alvo):
+            if not caminho.endswith('/'):
+                # Os links relativos do índice dependem da barra final
+                self._responder(HTTPStatus.MOVED_PERMANENTLY, cabecalhos=[("Location", caminho + '/')])
+                return
+            alvo = os.path.join(alvo, "index.html")
+        if not alvo.endswith(EXTENSOES) or not os.path.isfile(alvo):
+            self._responder(HTTPStatus.NOT_FOUND)
+            return
+        estado = os.stat(alvo)
+        etag = f'"{estado.st_mtime_ns:x}-{estado.st_size:x}"'
+        tipo = mimetypes.guess_type(alvo)[0] or "application/octet-stream"
+        if tipo.startswith("text/") or tipo in ("application/javascript", "application/json"):
+            tipo += "; charset=utf-8"
+        cabecalhos = [("ETag", etag), ("Cache-Control", "no-cache"), ("Vary", "Accept-Encoding")]
+        if _etag_confere(self.headers.get("If-None-Match"), etag):
+            self._responder(HTTPStatus.NOT_MODIFIED, cabecalhos=cabecalhos)
+            return
+        aceitas = _codificacoes_aceitas(self.headers.get("Accept-Encoding"))
+        for nome, formato in CODIFICACOES:
+            # Só irmão em dia com o artefato segundo o manifesto da compressão (ver artefatoscomprimidos)
+            irmao = irmao_atual(alvo, formato, self.server.raiz) if nome in aceitas else None
+            if irmao is not None:
+                alvo = irmao
+                cabecalhos.append(("Content-Encoding", nome))
+                break
+        with open(alvo, "rb") as f:
+            self._responder(HTTPStatus.OK, f.read(), tipo, cabecalhos)
+
+
+def criar_servidor(host=HOST_PADRAO, porta=PORTA_PADRAO, raiz=DIRETORIO_RELATORIOS, arquivo_dados=ARQUIVO_DADOS,
+                   intervalo=INTERVALO_VERIFICACAO, observar=True, silencioso=False):
+    '''
+    Cria o servidor do painel (sem começar a atender; ver servir).
+
+    Parâmetros:
+    - host, porta: endereço de escuta (porta 0 escolhe uma livre)
+    - raiz: diretório dos relatórios servidos
+    - arquivo_dados: planilha observada; a matriz é recarregada quando ela muda
+    - intervalo: segundos entre verificações da planilha
+    - observar: se False, a matriz só muda por servidor.matriz.publicar (execuções no próprio processo)
+    - silencioso: se True, não registra cada requisição
+
+    Retorna:
+    - ThreadingHTTPServer com os atributos matriz (MatrizPublicada), parar, acordar e observador
+    '''
+    servidor = ThreadingHTTPServer((host, porta), _Manipulador)
+    # Threads de requisição (inclusive fluxos de eventos abertos) não seguram o encerramento
+    servidor.daemon_threads = True
+    servidor.raiz = os.path.abspath(raiz)
+    servidor.arquivo_dados = arquivo_dados
+    servidor.intervalo = intervalo
+    servidor.silencioso = silencioso
+    servidor.matriz = MatrizPublicada()
+    servidor.parar = threading.Event()
+    servidor.acordar = threading.Event()
+    servidor.observador = None
+    if observar:
+        servidor.observador = threading.Thread(target=_observar, args=(servidor,), daemon=True)
+        servidor.observador.start()
+    return servidor
+
+
+def _liberar(servidor):
+    # Para o observador e os fluxos de eventos abertos e fecha o socket
+    servidor.parar.set()
+    servidor.acordar.set()
+    servidor.matriz.encerrar()
+    servidor.server_close()
+
+
+def encerrar_servidor(servidor):
+    '''
+    Encerra um servidor atendendo em outra thread (serve_forever).
+    '''
+    servidor.shutdown()
+    _liberar(servidor)
+
+
+def servir(servidor):
+    '''
+    Atende até Ctrl+C.
+    '''
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _liberar(servidor)
+
+
+# Bloco principal: verificação com o servidor numa porta livre (matriz com e sem If-None-Match, aviso
+# por eventos de uma execução nova publicada no processo, página do site com e sem gzip) e, em seguida,
+# o painel em http://127.0.0.1:8765/ até Ctrl+C.
+if __name__ == "__main__":
+    import urllib.error
+    import urllib.request
+
+    servidor = criar_servidor(porta=0, observar=False, silencioso=True)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    base = f"http://{HOST_PADRAO}:{servidor.server_address[1]}"
+    codigos = carregar_matriz()
+    servidor.matriz.publicar(codigos)
+
+    def buscar(caminho, **cabecalhos):
+        # (status, cabeçalhos, bytes recebidos no corpo)
+        try:
+            with urllib.request.urlopen(urllib.request.Request(base + caminho, headers=cabecalhos)) as r:
+                return r.status, r.headers, len(r.read())
+        except urllib.error.HTTPError as erro:
+            return erro.code, erro.headers, len(erro.read())
+
+    status, cabecalhos, tamanho = buscar("/api/matriz", **{"Accept-Encoding": "gzip"})
+    print(f"/api/matriz: {status}, {tamanho} bytes (gzip), ETag {cabecalhos['ETag']}")
+    status, _, tamanho = buscar("/api/matriz", **{"If-None-Match": cabecalhos['ETag']})
+    print(f"/api/matriz revalidada: {status}, {tamanho} bytes")
+
+    # Aviso de uma execução nova: o fluxo recebe a versão atual na conexão e a nova depois da publicação
+    fluxo = urllib.request.urlopen(base + "/api/eventos")
+    eventos = []
+    leitor = threading.Thread(target=lambda: [eventos.append(linha) for linha in fluxo
+                                              if linha.startswith(b"data:") and len(eventos) < 2], daemon=True)
+    leitor.start()
+    while not eventos:
+        time.sleep(0.01)
+    revisados = codigos.copy()
+    revisados.iloc[0, 0] = (revisados.iloc[0, 0] + 1) % 8
+    inicio = time.perf_counter()
+    servidor.matriz.publicar(revisados)
+    while len(eventos) < 2:
+        time.sleep(0.001)
+    print(f"Aviso de versão nova recebido em {(time.perf_counter() - inicio) * 1e3:.1f} ms: {eventos[1].decode().strip()}")
+    status, _, tamanho = buscar("/api/matriz", **{"If-None-Match": cabecalhos['ETag']})
+    print(f"/api/matriz com o ETag anterior: {status}, {tamanho} bytes")
+
+    # Relatório estático servido pelo irmão .gz quando existe (ver artefatoscomprimidos)
+    for pagina in ("/modelo2_cards.html", "/site_indicadores/index.html"):
+        status, cabecalhos, tamanho = buscar(pagina, **{"Accept-Encoding": "gzip"})
+        codificacao = cabecalhos.get('Content-Encoding', 'identidade') if status == 200 else '-'
+        print(f"{pagina}: {status}, {tamanho} bytes ({codificacao})")
+    fluxo.close()
+    encerrar_servidor(servidor)
+
+    servidor = criar_servidor()
+    print(f"Painel em http://{HOST_PADRAO}:{PORTA_PADRAO}/ (Ctrl+C encerra)")
+    servir(servidor)
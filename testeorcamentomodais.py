@@ -0,0 +1,36 @@
+import unittest
+
+from construirsite import universo_sintetico
+from modaiscompartilhados import (
+    ATIVOS_ORCAMENTO, ORCAMENTO_INICIAL, VARIANTES, carregar_registros, verificar_orcamento,
+)
+
+
+# Conferência do orçamento do carregamento inicial dos modais compartilhados, separada do benchmark
+# do bloco principal de modaiscompartilhados.py
+class TestOrcamentoModais(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Universo da planilha repetido até ATIVOS_ORCAMENTO (400) ativos
+        cls.universo = universo_sintetico(carregar_registros(), ATIVOS_ORCAMENTO)
+
+    def test_universo_sintetico(self):
+        self.assertEqual(self.universo["Ativo"].nunique(), ATIVOS_ORCAMENTO,
+                         "Universo sintético sem a quantidade de ativos do orçamento")
+
+    def test_dentro_do_orcamento(self):
+        medidas = verificar_orcamento(self.universo)
+        self.assertEqual(set(medidas), set(VARIANTES), "Variante sem medida de carregamento inicial")
+        for nome, tamanho in medidas.items():
+            self.assertGreater(tamanho, 0, f"{nome} sem bytes iniciais")
+            self.assertLessEqual(tamanho, ORCAMENTO_INICIAL,
+                                 f"{nome}: {tamanho} bytes acima do orçamento de {ORCAMENTO_INICIAL}")
+
+    def test_orcamento_estourado(self):
+        # Um limite menor que qualquer página tem de ser recusado
+        with self.assertRaises(ValueError):
+            verificar_orcamento(self.universo, limite=1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,407 @@
+# Validação, estatísticas e registros do front (relatórios de gerar4.txt) processados em blocos.
+# Razão: validate_schema, make_validation_report e serialize_for_front de gerar4.txt recebem o DataFrame
+# inteiro e montam relatorio_validacao.json/relatorio_stats.json e o JSON de todas as linhas na memória,
+# de modo que a memória cresce com a planilha. Aqui a entrada (planilha lida linha a linha em modo
+# somente leitura, ou CSV em pedaços) é processada em blocos de tamanho fixo: cada bloco é limpo,
+# enriquecido (valor numérico, percentual, valor formatado, cor) e resumido num agregado parcial
+# (ParcialValidacao: contagens por classificação e agrupador, nulos por coluna, estatísticas por
+# indicador) que pode ser combinado com outros em qualquer ordem, então os blocos podem ir para um pool
+# de processos. Os registros de cada bloco são gravados em JSON Lines assim que o bloco termina e só os
+# agregados (do tamanho do número de indicadores, não de linhas) ficam na memória até o fim.
+import itertools
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+# Colunas obrigatórias (nomes normalizados) e aliases da planilha, como em gerar4.txt
+COLUNAS_OBRIGATORIAS = ("Agrupador", "Fonte", "Ativo", "Indicador", "Formula", "Definicao",
+                        "Referencia", "Valor", "Classificacao", "Faixa", "Descricao")
+ALIASES_COLUNAS = {
+    "Fórmula": "Formula",
+    "Definição": "Definicao",
+    "Referência": "Referencia",
+    "Classificação": "Classificacao",
+    "Descrição": "Descricao",
+}
+# Indicador ou fórmula com estes termos é exibido como percentual (heurística de gerar4.txt)
+TERMOS_PERCENTUAL = ("roe", "roa", "roic", "m. ", "margem", "dy", "d.y", "yield", "tag along", "dividend")
+SEM_CLASSIFICACAO = "Sem classificação"
+# Cor do front por classificação (paleta de class_color em gerar4.txt, chaves sem acento também)
+CORES_CLASSE = {
+    "ótimo": "#059669", "otimo": "#059669",
+    "bom": "#2563eb",
+    "moderado": "#f59e0b",
+    "ruim": "#ef4444",
+    "crítico": "#7f1d1d", "critico": "#7f1d1d",
+}
+COR_PADRAO = "#6b7280"
+# Linhas por bloco
+TAMANHO_BLOCO = 5_000
+# Saídas
+DIRETORIO_SAIDA = "relatorios_validacao"
+ARQUIVO_REGISTROS = "registros.jsonl"
+ARQUIVO_VALIDACAO = "relatorio_validacao.json"
+ARQUIVO_STATS = "relatorio_stats.json"
+ARQUIVO_TEXTO = "relatorio_validacao.txt"
+
+
+class ParcialValidacao:
+    '''
+    Agregado parcial de um ou mais blocos; combinar() junta dois agregados (a ordem não importa).
+    '''
+
+    def __init__(self):
+        # Nome original -> normalizado de todas as colunas vistas
+        self.mapeamento = {}
+        self.linhas = 0
+        self.descartadas = 0
+        self.nulos = Counter()
+        self.classificacoes = Counter()
+        # (agrupador, classificação) -> linhas
+        self.matriz = Counter()
+        self.percentuais = 0
+        self.nao_numericos = 0
+        # Indicador -> [n, média, soma dos quadrados dos desvios, mínimo, máximo] dos valores numéricos
+        self.valores = {}
+
+    def combinar(self, outro):
+        '''
+        Acrescenta outro agregado a este (as médias e dispersões são combinadas pelas fórmulas de Chan).
+
+        Retorna:
+        - self
+        '''
+        self.mapeamento.update(outro.mapeamento)
+        self.linhas += outro.linhas
+        self.descartadas += outro.descartadas
+        self.nulos.update(outro.nulos)
+        self.classificacoes.update(outro.classificacoes)
+        self.matriz.update(outro.matriz)
+        self.percentuais += outro.percentuais
+        self.nao_numericos += outro.nao_numericos
+        for indicador, (n_b, media_b, m2_b, minimo_b, maximo_b) in outro.valores.items():
+            atual = self.valores.get(indicador)
+            if atual is None:
+                self.valores[indicador] = [n_b, media_b, m2_b, minimo_b, maximo_b]
+                continue
+            n_a, media_a, m2_a, minimo_a, maximo_a = atual
+            n = n_a + n_b
+            delta = media_b - media_a
+            self.valores[indicador] = [n, media_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n,
+                                       min(minimo_a, minimo_b), max(maximo_a, maximo_b)]
+        return self
+
+    def relatorio_validacao(self):
+        '''
+        Aderência ao esquema e contagens (chaves de validate_schema e make_validation_report de gerar4.txt).
+
+        Retorna:
+        - dict
+        '''
+        presentes = set(self.mapeamento.values())
+        faltantes = sorted(set(COLUNAS_OBRIGATORIAS) - presentes)
+        agrupadores = sorted({agrupador for agrupador, _ in self.matriz if str(agrupador).strip()})
+        classes = sorted(c for c in self.classificacoes if c != SEM_CLASSIFICACAO and str(c).strip())
+        nulos = {}
+        for coluna in COLUNAS_OBRIGATORIAS:
+            quantidade = self.nulos[coluna] if coluna in presentes else None
+            nulos[coluna] = {'nulos': quantidade,
+                             'pct': quantidade / self.linhas * 100.0 if quantidade is not None and self.linhas else None}
+        # Matriz densa como o pivot_table(fill_value=0) de gerar4.txt: todo agrupador com todas as classes
+        colunas = sorted({classificacao for _, classificacao in self.matriz})
+        matriz = {agrupador: {classificacao: self.matriz[(agrupador, classificacao)] for classificacao in colunas}
+                  for agrupador in sorted({agrupador for agrupador, _ in self.matriz})}
+        return {
+            'colunas_obrigatorias_presentes': not faltantes,
+            'faltantes': faltantes,
+            'extras': sorted(presentes - set(COLUNAS_OBRIGATORIAS)),
+            'mapeamento_original_para_normalizado': self.mapeamento,
+            'total_linhas': self.linhas,
+            'linhas_descartadas': self.descartadas,
+            'agrupadores': agrupadores,
+            'n_agrupadores': len(agrupadores),
+            'classes': classes,
+            'n_classes': len(classes),
+            'nulos_por_coluna': nulos,
+            'distribuicao_por_classificacao': dict(self.classificacoes.most_common()),
+            'matriz_agrupador_classificacao': matriz,
+        }
+
+    def relatorio_stats(self):
+        '''
+        Estatísticas dos valores: por indicador (n, média, desvio padrão, mínimo, máximo), valores não
+        numéricos e linhas exibidas como percentual.
+
+        Retorna:
+        - dict
+        '''
+        return {
+            'total_linhas': self.linhas,
+            'valores_nao_numericos': self.nao_numericos,
+            'linhas_percentuais': self.percentuais,
+            'por_indicador': {indicador: {'n': n, 'media': media, 'desvio': (m2 / n) ** 0.5,
+                                          'minimo': minimo, 'maximo': maximo}
+                              for indicador, (n, media, m2, minimo, maximo) in sorted(self.valores.items())},
+        }
+
+
+def _normalizar_nome(coluna):
+    nome = str(coluna).strip()
+    return ALIASES_COLUNAS.get(nome, nome)
+
+
+def _valor_numerico(valores):
+    # Números e textos numéricos direto; nos demais, vírgula vira ponto e sobram dígitos, '-' e '.'
+    # (only_numeric_sign de gerar4.txt, vetorizado)
+    numeros = pd.to_numeric(valores, errors='coerce')
+    limpos = valores.astype(str).str.replace(',', '.', regex=False).str.replace(r'[^0-9.\-]', '', regex=True)
+    return numeros.fillna(pd.to_numeric(limpos, errors='coerce')).astype(float)
+
+
+def _formatar_br(valor, percentual):
+    # Número no padrão pt-BR com 2 casas ('-' para NaN); percentuais multiplicados por 100
+    if valor != valor:
+        return "-"
+    texto = f"{valor * 100 if percentual else valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return texto + "%" if percentual else texto
+
+
+def _cor_classe(classificacao):
+    # class_color de gerar4.txt: sem espaços nas pontas e sem diferenciar maiúsculas; vazio/NaN fica cinza
+    if not isinstance(classificacao, str):
+        return COR_PADRAO
+    return CORES_CLASSE.get(classificacao.strip().lower(), COR_PADRAO)
+
+
+def processar_bloco(bloco):
+    '''
+    Limpa, enriquece e resume um bloco de linhas.
+
+    Parâmetros:
+    - bloco: pd.DataFrame com as colunas da planilha (nomes originais)
+
+    Retorna:
+    - tuple (ParcialValidacao do bloco, texto JSON Lines com os registros do front do bloco)
+    '''
+    parcial = ParcialValidacao()
+    parcial.mapeamento = {str(coluna): _normalizar_nome(coluna) for coluna in bloco.columns}
+    bloco = bloco.rename(columns=_normalizar_nome)
+    for coluna in COLUNAS_OBRIGATORIAS:
+        if coluna not in bloco.columns:
+            bloco[coluna] = None
+    # Linhas totalmente vazias e sem indicador
+    limpo = bloco.dropna(how='all')
+    limpo = limpo[limpo["Indicador"].notna()]
+    parcial.descartadas = len(bloco) - len(limpo)
+    parcial.linhas = len(limpo)
+    parcial.nulos.update({coluna: int(quantidade) for coluna, quantidade in limpo.isna().sum().items()})
+    parcial.classificacoes.update(limpo["Classificacao"].fillna(SEM_CLASSIFICACAO).value_counts().to_dict())
+    parcial.matriz.update(limpo.groupby(["Agrupador", "Classificacao"]).size().to_dict())
+
+    numeros = _valor_numerico(limpo["Valor"])
+    parcial.nao_numericos = int(numeros.isna().sum() - limpo["Valor"].isna().sum())
+    termos = '|'.join(termo.replace('.', r'\.') for termo in TERMOS_PERCENTUAL)
+    percentual = (limpo["Formula"].fillna('').astype(str).str.lower().str.contains(r'\(%\)|\* 100')
+                  | limpo["Indicador"].astype(str).str.lower().str.contains(termos))
+    parcial.percentuais = int(percentual.sum())
+    # Estatísticas do bloco por indicador, na forma que combinar() junta
+    grupos = numeros.groupby(limpo["Indicador"]).agg(['count', 'mean', 'min', 'max'])
+    variancias = numeros.groupby(limpo["Indicador"]).var(ddof=0)
+    for indicador, (n, media, minimo, maximo), variancia in zip(grupos.index, grupos.to_numpy().tolist(),
+                                                                variancias.reindex(grupos.index).tolist()):
+        if n:
+            parcial.valores[indicador] = [int(n), media, variancia * n, minimo, maximo]
+
+    # Registros do front (serialize_for_front de gerar4.txt)
+    registros = limpo[list(COLUNAS_OBRIGATORIAS)].fillna('').astype(str)
+    registros["Valor"] = numeros.to_numpy()
+    registros["ValorFmt"] = [_formatar_br(valor, eh) for valor, eh in zip(numeros.tolist(), percentual.tolist())]
+    registros["EhPercentual"] = percentual.to_numpy()
+    registros["CorClass"] = [_cor_classe(c) for c in limpo["Classificacao"].tolist()]
+    texto = registros.to_json(orient='records', lines=True, force_ascii=False) if len(registros) else ''
+    if texto and not texto.endswith('\n'):
+        texto += '\n'
+    return parcial, texto
+
+
+def blocos_entrada(arquivo, aba=0, tamanho=TAMANHO_BLOCO):
+    '''
+    Blocos de linhas da entrada, sem carregar o arquivo inteiro: CSV em pedaços ou planilha lida linha
+    a linha pelo openpyxl em modo somente leitura.
+
+    Parâmetros:
+    - arquivo: .csv ou .xlsx
+    - aba: nome ou posição da aba (planilhas)
+    - tamanho: linhas por bloco
+
+    Retorna:
+    - gerador de pd.DataFrame
+    '''
+    if arquivo.lower().endswith('.csv'):
+        yield from pd.read_csv(arquivo, chunksize=tamanho)
+        return
+    import openpyxl
+
+    livro = openpyxl.load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        folha = livro[aba] if isinstance(aba, str) else livro.worksheets[aba]
+        linhas = folha.iter_rows(values_only=True)
+        cabecalho = next(linhas, None)
+        if cabecalho is None:
+            return
+        # Colunas sem título ficam como 'Unnamed: k' (como em pd.read_excel)
+        colunas = [str(c) if c is not None else f"Unnamed: {k}" for k, c in enumerate(cabecalho)]
+        for lote in iter(lambda: list(itertools.islice(linhas, tamanho)), []):
+            yield pd.DataFrame(lote, columns=colunas)
+    finally:
+        livro.close()
+
+
+def _gravar_json(caminho, dados):
+    temporario = caminho + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, caminho)
+
+
+def gravar_relatorios(parcial, diretorio=DIRETORIO_SAIDA):
+    '''
+    Grava relatorio_validacao.json, relatorio_stats.json e o resumo em texto do agregado.
+    '''
+    validacao = parcial.relatorio_validacao()
+    _gravar_json(os.path.join(diretorio, ARQUIVO_VALIDACAO), validacao)
+    _gravar_json(os.path.join(diretorio, ARQUIVO_STATS), parcial.relatorio_stats())
+    linhas = [f"Linhas válidas: {validacao['total_linhas']} (descartadas: {validacao['linhas_descartadas']})",
+              f"Colunas obrigatórias presentes: {'sim' if validacao['colunas_obrigatorias_presentes'] else 'não'}"]
+    if validacao['faltantes']:
+        linhas.append(f"Faltantes: {', '.join(validacao['faltantes'])}")
+    linhas.append(f"Agrupadores ({validacao['n_agrupadores']}): {', '.join(map(str, validacao['agrupadores']))}")
+    linhas.append("Distribuição por classificação:")
+    linhas.extend(f"  {classe}: {quantidade}" for classe, quantidade in validacao['distribuicao_por_classificacao'].items())
+    with open(os.path.join(diretorio, ARQUIVO_TEXTO), "w", encoding="utf-8") as f:
+        f.write('\n'.join(linhas) + '\n')
+
+
+def validar_em_blocos(blocos, diretorio=DIRETORIO_SAIDA, processos=1):
+    '''
+    Processa os blocos (em paralelo quando processos > 1), grava os registros de cada bloco em JSON Lines
+    assim que ele termina e, no fim, os relatórios.
+
+    Parâmetros:
+    - blocos: iterável de pd.DataFrame (ver blocos_entrada)
+    - diretorio: diretório das saídas
+    - processos: processos do pool; 1 processa no processo atual
+
+    Retorna:
+    - ParcialValidacao com o agregado de todos os blocos
+    '''
+    os.makedirs(diretorio, exist_ok=True)
+    total = ParcialValidacao()
+    caminho = os.path.join(diretorio, ARQUIVO_REGISTROS)
+    with open(caminho + ".tmp", "w", encoding="utf-8") as saida:
+        def consumir(resultado):
+            parcial, texto = resultado
+            total.combinar(parcial)
+            saida.write(texto)
+
+        if processos == 1:
+            for bloco in blocos:
+                consumir(processar_bloco(bloco))
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                # No máximo dois blocos por processo em andamento: a leitura não corre à frente do pool e
+                # os registros saem na ordem da entrada
+                pendentes = deque()
+                for bloco in blocos:
+                    pendentes.append(executor.submit(processar_bloco, bloco))
+                    if len(pendentes) >= 2 * processos:
+                        consumir(pendentes.popleft().result())
+                while pendentes:
+                    consumir(pendentes.popleft().result())
+    os.replace(caminho + ".tmp", caminho)
+    gravar_relatorios(total, diretorio)
+    return total
+
+
+def _relatorios_inteiros(df):
+    # Caminho anterior (DataFrame inteiro, registros num único JSON), mantido só para comparação
+    bloco = df.rename(columns=_normalizar_nome)
+    limpo = bloco.dropna(how='all')
+    limpo = limpo[limpo["Indicador"].notna()].copy()
+    limpo["Valor_num"] = _valor_numerico(limpo["Valor"])
+    registros = [{coluna: str(linha[coluna]) for coluna in COLUNAS_OBRIGATORIAS if coluna in linha}
+                 for linha in limpo.to_dict(orient='records')]
+    dados = json.dumps(registros, ensure_ascii=False)
+    matriz = limpo.pivot_table(index="Agrupador", columns="Classificacao", values="Indicador",
+                               aggfunc="count", fill_value=0).to_dict(orient="index")
+    return dados, matriz, limpo["Classificacao"].fillna(SEM_CLASSIFICACAO).value_counts().to_dict()
+
+
+# Bloco principal: relatórios da planilha de indicadores (com a conferência das contagens e estatísticas
+# contra o cálculo no DataFrame inteiro e da combinação fora de ordem), e benchmark de memória e tempo com
+# entradas CSV de 25 mil a 100 mil linhas (as linhas reais repetidas).
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    import tracemalloc
+
+    from gerar_html_indicadores import ABA_DADOS, ARQUIVO_DADOS
+
+    total = validar_em_blocos(blocos_entrada(ARQUIVO_DADOS, ABA_DADOS, tamanho=300))
+    validacao = total.relatorio_validacao()
+    print(f"{DIRETORIO_SAIDA}/: {validacao['total_linhas']} linhas, {validacao['n_agrupadores']} agrupadores, "
+          f"{validacao['n_classes']} classes, obrigatórias presentes: {validacao['colunas_obrigatorias_presentes']}")
+    inteiro = pd.read_excel(ARQUIVO_DADOS, sheet_name=ABA_DADOS, engine="openpyxl")
+    _, matriz, distribuicao = _relatorios_inteiros(inteiro)
+    assert distribuicao == validacao['distribuicao_por_classificacao']
+    assert matriz == validacao['matriz_agrupador_classificacao']
+    numeros = _valor_numerico(inteiro["Valor"])
+    esperado = numeros.groupby(inteiro["Indicador"]).agg(['count', 'mean', 'std'])
+    stats = total.relatorio_stats()['por_indicador']
+    for indicador, (n, media, desvio) in zip(esperado.index, esperado.to_numpy()):
+        # Indicadores sem nenhum valor numérico (ex.: Free Float) não entram nas estatísticas
+        if n == 0:
+            assert indicador not in stats
+            continue
+        obtido = stats[indicador]
+        assert obtido['n'] == n and np.isclose(obtido['media'], media)
+        assert n == 1 or np.isclose(obtido['desvio'], desvio * np.sqrt((n - 1) / n))
+    # Os agregados dos blocos combinados em outra ordem dão o mesmo relatório
+    parciais = [processar_bloco(bloco)[0] for bloco in blocos_entrada(ARQUIVO_DADOS, ABA_DADOS, tamanho=300)]
+    invertido = ParcialValidacao()
+    for parcial in reversed(parciais):
+        invertido.combinar(parcial)
+    assert invertido.relatorio_validacao()['matriz_agrupador_classificacao'] == validacao['matriz_agrupador_classificacao']
+    print("Contagens e estatísticas conferem com o DataFrame inteiro e com a combinação fora de ordem")
+
+    temporario = tempfile.mkdtemp()
+    try:
+        # Pool de processos: mesmos relatórios e registros na mesma ordem
+        paralelo = validar_em_blocos(blocos_entrada(ARQUIVO_DADOS, ABA_DADOS, tamanho=300),
+                                     os.path.join(temporario, "paralelo"), processos=2)
+        assert paralelo.relatorio_validacao() == validacao
+        with open(os.path.join(temporario, "paralelo", ARQUIVO_REGISTROS), "rb") as a, \
+                open(os.path.join(DIRETORIO_SAIDA, ARQUIVO_REGISTROS), "rb") as b:
+            assert a.read() == b.read()
+        print("Pool de 2 processos: mesmos relatórios e registros")
+        print(f"{'linhas':>8} {'inteiro_s':>10} {'inteiro_pico_mb':>16} {'blocos_s':>9} {'blocos_pico_mb':>15}")
+        for quantidade in (25_000, 50_000, 100_000):
+            entrada = os.path.join(temporario, f"entrada_{quantidade}.csv")
+            inteiro.iloc[np.arange(quantidade) % len(inteiro)].to_csv(entrada, index=False)
+            medidas = []
+            for gerar in (lambda: _relatorios_inteiros(pd.read_csv(entrada)),
+                          lambda: validar_em_blocos(blocos_entrada(entrada), os.path.join(temporario, "saida"))):
+                tracemalloc.start()
+                inicio = time.perf_counter()
+                gerar()
+                medidas += [time.perf_counter() - inicio, tracemalloc.get_traced_memory()[1] / 1e6]
+                tracemalloc.stop()
+            print(f"{quantidade:>8} {medidas[0]:>10.2f} {medidas[1]:>16.1f} {medidas[2]:>9.2f} {medidas[3]:>15.1f}")
+    finally:
+        shutil.rmtree(temporario, ignore_errors=True)